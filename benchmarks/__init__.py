@@ -0,0 +1,6 @@
+"""
+Benchmarks for django-tables2.
+
+Run them from the root of the repository with ``python -m benchmarks``, see
+``python -m benchmarks --help`` for the options.
+"""
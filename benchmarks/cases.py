@@ -0,0 +1,239 @@
+"""
+The benchmarked cases.
+
+Every case is a function setting up the benchmark for the given size, returning
+the function to time. The arguments of the case function (``rows`` and/or
+``columns``) define the sizes it's run for.
+"""
+
+import datetime
+from functools import partial
+
+from django.core.files import File
+from django.core.paginator import Paginator
+from django.test import RequestFactory
+
+import django_tables2 as tables
+from django_tables2.export import StreamingTableExport, TableExport
+from django_tables2.paginators import EstimatedCountPaginator, KeysetPaginator, LazyPaginator
+from django_tables2.utils import A
+from tests.app.models import Occupation, Person
+
+BENCHMARKS = {}
+
+
+def benchmark(setup, name=None):
+    BENCHMARKS[name or setup.__name__] = setup
+    return setup
+
+
+def list_data(rows, columns):
+    return [{f"c{i}": f"value {n}.{i}" for i in range(columns)} for n in range(rows)]
+
+
+def list_table_class(columns, column_class=tables.Column, **kwargs):
+    attrs = {f"c{i}": column_class(**kwargs) for i in range(columns)}
+    return type("ListTable", (tables.Table,), attrs)
+
+
+def people(rows):
+    """Return a QuerySet of `rows` people, creating them if the database doesn't contain enough."""
+    missing = rows - Person.objects.count()
+    if missing > 0:
+        occupations = Occupation.objects.bulk_create(
+            Occupation(name=f"occupation {i}") for i in range(10)
+        )
+        created = Person.objects.bulk_create(
+            (
+                Person(
+                    first_name=f"first {i}",
+                    last_name=f"last {i}",
+                    occupation=occupations[i % len(occupations)],
+                )
+                for i in range(missing)
+            ),
+            batch_size=1000,
+        )
+        Friendship = Person.friends.through
+        Friendship.objects.bulk_create(
+            (
+                Friendship(from_person_id=person.pk, to_person_id=friend.pk)
+                for person, friend in zip(created[1:], created)
+            ),
+            batch_size=1000,
+        )
+
+    last = Person.objects.order_by("pk").values_list("pk", flat=True)[rows - 1]
+    return Person.objects.filter(pk__lte=last).order_by("pk")
+
+
+class PersonTable(tables.Table):
+    first_name = tables.Column(linkify=("person", [A("pk")]))
+    last_name = tables.Column()
+    occupation = tables.Column(accessor="occupation__name")
+
+    class Meta:
+        model = Person
+        fields = ("first_name", "last_name", "occupation")
+
+
+def render_rows(rows):
+    for row in rows:
+        for _value in row:
+            pass
+
+
+@benchmark
+def table_init(columns):
+    Table = list_table_class(columns)
+    data = list_data(10, columns)
+    return lambda: Table(data)
+
+
+@benchmark
+def table_init_queryset():
+    queryset = Person.objects.all()
+    return lambda: PersonTable(queryset)
+
+
+@benchmark
+def render_list_rows(rows, columns):
+    table = list_table_class(columns)(list_data(rows, columns))
+    return partial(render_rows, table.rows)
+
+
+@benchmark
+def render_queryset_rows(rows):
+    table = PersonTable(people(rows).select_related("occupation"))
+    table.rows.load()
+    return partial(render_rows, table.rows)
+
+
+@benchmark
+def order_list_data(rows, columns):
+    table = list_table_class(columns)(list_data(rows, columns))
+
+    def order():
+        table.order_by = "-c0"
+        table.order_by = "c0"
+
+    return order
+
+
+@benchmark
+def as_html(rows):
+    table = PersonTable(people(rows).select_related("occupation"))
+    request = RequestFactory().get("/")
+    return partial(table.as_html, request)
+
+
+@benchmark
+def pinned_rows(rows, columns):
+    pinned = list_data(10, columns)
+
+    class Table(list_table_class(columns)):
+        def get_top_pinned_data(self):
+            return pinned
+
+        def get_bottom_pinned_data(self):
+            return pinned
+
+    table = Table(list_data(rows, columns))
+    return partial(render_rows, table.rows)
+
+
+#: Built-in column types, with the arguments to create them and the value of the cells.
+COLUMN_TYPES = {
+    "column": (tables.Column, {}, "value"),
+    "boolean": (tables.BooleanColumn, {}, True),
+    "checkbox": (tables.CheckBoxColumn, {}, 1),
+    "date": (tables.DateColumn, {}, datetime.date(2025, 1, 31)),
+    "datetime": (tables.DateTimeColumn, {}, datetime.datetime(2025, 1, 31, 12, 30)),
+    "email": (tables.EmailColumn, {}, "person@example.com"),
+    "file": (tables.FileColumn, {"verify_exists": False}, File(None, name="files/receipt.pdf")),
+    "json": (tables.JSONColumn, {}, {"key": ["value", 1]}),
+    "link": (tables.LinkColumn, {"viewname": "person", "args": [1]}, "value"),
+    "linkify": (tables.Column, {"linkify": ("person", [1])}, "value"),
+    "template": (tables.TemplateColumn, {"template_code": "<b>{{ value }}</b>"}, "value"),
+    "time": (tables.TimeColumn, {}, datetime.time(12, 30)),
+    "url": (tables.URLColumn, {}, "https://example.com/"),
+}
+
+
+def column_type(column_class, kwargs, value, rows):
+    Table = list_table_class(1, column_class, **kwargs)
+    table = Table([{"c0": value}] * rows)
+    return partial(render_rows, table.rows)
+
+
+for name, (column_class, kwargs, value) in COLUMN_TYPES.items():
+    benchmark(partial(column_type, column_class, kwargs, value), name=f"column_{name}")
+
+
+@benchmark
+def column_manytomany(rows):
+    class Table(tables.Table):
+        friends = tables.ManyToManyColumn()
+
+    table = Table(people(rows).prefetch_related("friends"))
+    table.rows.load()
+    return partial(render_rows, table.rows)
+
+
+PAGINATORS = {
+    "paginator": Paginator,
+    "lazy": LazyPaginator,
+    "estimated": EstimatedCountPaginator,
+}
+
+
+def paginate(paginator_class, rows):
+    queryset = people(rows)
+    # a page in the middle, to include the cost of OFFSET.
+    page = max(rows // 25 // 2, 1)
+
+    def run():
+        table = PersonTable(queryset.all())
+        table.paginate(paginator_class=paginator_class, per_page=25, page=page)
+        render_rows(table.page.object_list)
+
+    return run
+
+
+for name, paginator_class in PAGINATORS.items():
+    benchmark(partial(paginate, paginator_class), name=f"paginate_{name}")
+
+
+@benchmark
+def paginate_keyset(rows):
+    queryset = people(rows)
+
+    def run():
+        table = PersonTable(queryset.all())
+        table.paginate(paginator_class=KeysetPaginator, per_page=25)
+        if table.page.has_next():
+            table.paginate(
+                paginator_class=KeysetPaginator, per_page=25, page=table.page.next_cursor
+            )
+        render_rows(table.page.object_list)
+
+    return run
+
+
+def export(export_format, rows):
+    queryset = people(rows).select_related("occupation")
+    return lambda: TableExport(export_format, PersonTable(queryset.all())).export()
+
+
+def streaming_export(export_format, rows):
+    queryset = people(rows).select_related("occupation")
+    return lambda: "".join(
+        StreamingTableExport(export_format, PersonTable(queryset.all())).export()
+    )
+
+
+for export_format in TableExport.FORMATS:
+    benchmark(partial(export, export_format), name=f"export_{export_format}")
+
+for export_format in StreamingTableExport.FORMATS:
+    benchmark(partial(streaming_export, export_format), name=f"export_streaming_{export_format}")
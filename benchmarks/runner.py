@@ -0,0 +1,136 @@
+"""
+Run the benchmarks of django-tables2.
+
+The results can be written to a JSON file, to compare them between commits::
+
+    python -m benchmarks --rows 1000 --columns 5 50 --output before.json
+    git checkout my-branch
+    python -m benchmarks --rows 1000 --columns 5 50 --output after.json --compare before.json
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import timeit
+
+
+def setup_django():
+    """Configure Django using the settings of the test app, with an (in-memory) database."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.app.settings")
+
+    import django
+    from django.db import connection
+
+    django.setup()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def get_cases(sizes, pattern=None):
+    """
+    Yield a ``(key, setup, kwargs)`` tuple for each case matching `pattern`, for each combination of sizes.
+
+    Arguments:
+        sizes (dict): lists of sizes to run the cases with, for each argument
+            of the case functions (``rows``, ``columns``).
+        pattern (str): regular expression matching the names of the cases to run.
+    """
+    from .cases import BENCHMARKS
+
+    for name, setup in BENCHMARKS.items():
+        if pattern and not re.search(pattern, name):
+            continue
+
+        arguments = list(inspect.signature(setup).parameters)
+        for values in itertools.product(*(sizes[argument] for argument in arguments)):
+            kwargs = dict(zip(arguments, values))
+            params = ",".join(f"{key}={value}" for key, value in kwargs.items())
+            yield (f"{name}[{params}]" if params else name), setup, kwargs
+
+
+def run_case(setup, kwargs, repeat):
+    """Return the timings of the case in seconds, timing its function `repeat` times."""
+    times = timeit.repeat(setup(**kwargs), number=1, repeat=repeat)
+    return {"min": min(times), "mean": sum(times) / len(times), "times": times}
+
+
+def run(sizes, pattern=None, repeat=3, stdout=None):
+    """Run the cases, returning a dict with the timings (or error) for each case."""
+    results = {}
+    for key, setup, kwargs in get_cases(sizes, pattern):
+        try:
+            results[key] = run_case(setup, kwargs, repeat)
+        except Exception as e:
+            results[key] = {"error": f"{type(e).__name__}: {e}"}
+
+        if stdout is not None:
+            result = results[key]
+            line = result["error"] if "error" in result else f"{result['min'] * 1000:.3f} ms"
+            stdout.write(f"{key}: {line}\n")
+    return results
+
+
+def get_metadata():
+    import django
+
+    import django_tables2
+
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "django_tables2": django_tables2.__version__,
+    }
+
+
+def compare(results, previous, stdout):
+    """Write the ratio of the minimum timings of `results` and `previous` for the cases in both."""
+    for key, result in results.items():
+        before = previous.get(key)
+        if before is None or "min" not in before or "min" not in result:
+            continue
+        ratio = result["min"] / before["min"] if before["min"] else float("inf")
+        stdout.write(
+            f"{key}: {before['min'] * 1000:.3f} ms -> {result['min'] * 1000:.3f} ms ({ratio:.2f}x)\n"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--columns", type=int, nargs="+", default=[5, 50, 200])
+    parser.add_argument("--repeat", type=int, default=3, help="number of timings of each case")
+    parser.add_argument("-k", "--pattern", help="only run the cases matching this regex")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare the results to those in this JSON file")
+    args = parser.parse_args(argv)
+
+    setup_django()
+    sizes = {"rows": args.rows, "columns": args.columns}
+    results = run(sizes, pattern=args.pattern, repeat=args.repeat, stdout=sys.stdout)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": get_metadata(), "results": results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)["results"]
+        sys.stdout.write(f"\nCompared to {args.compare}:\n")
+        compare(results, previous, sys.stdout)
@@ -14,10 +14,17 @@ from .columns import (
     URLColumn,
 )
 from .config import RequestConfig
-from .paginators import LazyPaginator
+from .paginators import EstimatedCountPaginator, KeysetPaginator, LazyPaginator
 from .tables import Table, table_factory
 from .utils import A
-from .views import MultiTableMixin, SingleTableMixin, SingleTableView
+from .views import (
+    AsyncMultiTableMixin,
+    AsyncSingleTableMixin,
+    AsyncSingleTableView,
+    MultiTableMixin,
+    SingleTableMixin,
+    SingleTableView,
+)
 
 __version__ = "2.8.0"
 
@@ -42,5 +49,10 @@ __all__ = (
     "SingleTableMixin",
     "SingleTableView",
     "MultiTableMixin",
+    "AsyncSingleTableMixin",
+    "AsyncSingleTableView",
+    "AsyncMultiTableMixin",
     "LazyPaginator",
+    "KeysetPaginator",
+    "EstimatedCountPaginator",
 )
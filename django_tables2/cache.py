@@ -0,0 +1,133 @@
+import hashlib
+from uuid import uuid4
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models.signals import post_delete, post_save
+
+
+class CountCache:
+    """
+    Cache the number of rows of a QuerySet using Django's cache framework.
+
+    Counting the rows of a large, filtered QuerySet can take longer than fetching
+    a page of it. `.TableQuerysetData` only caches the count for the lifetime of
+    one table instance, so every page navigation, sort click or export counts again.
+    A `CountCache` keeps the count around for `timeout` seconds::
+
+        class PersonTable(tables.Table):
+            class Meta:
+                model = Person
+                count_cache = CountCache(timeout=600, invalidate_on_change=True, models=[Person])
+
+    Counts are keyed by the database alias and the SQL (including parameters) of the
+    unordered QuerySet, so different filters are cached separately, and ordering
+    the table doesn't result in another count.
+
+    Arguments:
+        timeout (int): number of seconds to cache a count, passed to the cache backend.
+        cache_alias (str): alias of the cache in `settings.CACHES` to use.
+        key_prefix (str): prefix for all keys stored in the cache.
+        invalidate_on_change (bool): if `True`, cached counts for a model are invalidated
+            when an instance of that model is saved or deleted (using the ``post_save``
+            and ``post_delete`` signals). Changes not sending these signals, like
+            ``QuerySet.update()``, or changes to related models used in filters are not
+            detected and will only be visible after `timeout` expires.
+        models (iterable): the models to invalidate the counts of if `invalidate_on_change`
+            is `True`. By default, every save or delete of any model invalidates the counts
+            for that model, which costs a write to the cache for every save or delete in
+            the project (for each `CountCache` instance), so passing the models shown in
+            tables using this cache is recommended.
+
+    The version of the counts of a model is stored in the cache, so saving an instance
+    in one process invalidates the counts cached by all processes using the same cache,
+    even if the process saving the instance never counted that model itself. Versions
+    are random, so if the version of a model is evicted from the cache, the counts
+    cached before are not used anymore either.
+    """
+
+    def __init__(
+        self,
+        timeout=300,
+        cache_alias="default",
+        key_prefix="django_tables2.count",
+        invalidate_on_change=False,
+        models=None,
+    ):
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self.invalidate_on_change = invalidate_on_change
+        self.models = None
+        if models is not None:
+            self.models = {model._meta.concrete_model for model in models}
+
+        if invalidate_on_change:
+            post_save.connect(self._model_changed)
+            post_delete.connect(self._model_changed)
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _version_key(self, model):
+        return f"{self.key_prefix}:version:{model._meta.concrete_model._meta.label_lower}"
+
+    def _get_version(self, model):
+        key = self._version_key(model)
+        version = self.cache.get(key)
+        if version is None:
+            # never invalidated or evicted: start a new version, unless another process just did
+            version = uuid4().hex
+            if not self.cache.add(key, version, None):
+                version = self.cache.get(key, version)
+        return version
+
+    def _model_changed(self, sender, **kwargs):
+        if self.models is None or sender._meta.concrete_model in self.models:
+            self.invalidate(sender)
+
+    def invalidate(self, model):
+        """Invalidate all cached counts for QuerySets of `model`."""
+        self.cache.set(self._version_key(model), uuid4().hex, None)
+
+    def get_key(self, queryset):
+        """
+        Return the cache key for the count of `queryset`.
+
+        Returns `None` if the QuerySet can not result in any rows (and thus doesn't need a query).
+        """
+        query = queryset.order_by().query
+        try:
+            sql, params = query.get_compiler(using=queryset.db).as_sql()
+        except EmptyResultSet:
+            return None
+
+        digest = hashlib.sha256(f"{queryset.db}:{sql}:{params!r}".encode()).hexdigest()
+        version = self._get_version(queryset.model)
+        return f"{self.key_prefix}:{version}:{digest}"
+
+    def get_count(self, queryset):
+        """Return the number of rows for `queryset`, from the cache if possible."""
+        key = self.get_key(queryset)
+        if key is None:
+            return queryset.count()
+
+        count = self.cache.get(key)
+        if count is None:
+            count = queryset.count()
+            self.cache.set(key, count, self.timeout)
+        return count
+
+    async def aget_count(self, queryset):
+        """Async version of `get_count`, counting the rows using ``QuerySet.acount()``."""
+        key = await sync_to_async(self.get_key)(queryset)
+        if key is None:
+            return await queryset.acount()
+
+        count = await self.cache.aget(key)
+        if count is None:
+            count = await queryset.acount()
+            await self.cache.aset(key, count, self.timeout)
+        return count
@@ -635,6 +635,8 @@ class BoundColumn:
     @property
     def orderable(self):
         """Return whether this column supports ordering."""
+        if not self._table.data.orderable:
+            return False
         if self.column.orderable is not None:
             return self.column.orderable
         return self._table.orderable
@@ -1,5 +1,8 @@
+from asgiref.sync import sync_to_async
 from django.core.paginator import EmptyPage, PageNotAnInteger
 
+from .paginators import apage
+
 
 class RequestConfig:
     """
@@ -24,6 +27,10 @@ class RequestConfig:
 
                 RequestConfig(paginate={"paginator_class": LazyPaginator}).configure(table)
 
+            If the paginator class has a truthy ``cursor_based`` attribute (like
+            `.KeysetPaginator`), the value of the page query string field is passed
+            to the paginator as-is, rather than converted to an integer.
+
     """
 
     def __init__(self, request, paginate=True):
@@ -37,24 +44,8 @@ class RequestConfig:
         Arguments:
             table (`~.Table`): table to be configured
         """
-        table.request = self.request
-
-        order_by = self.request.GET.getlist(table.prefixed_order_by_field)
-        if order_by:
-            table.order_by = order_by
-        if self.paginate:
-            if hasattr(self.paginate, "items"):
-                kwargs = dict(self.paginate)
-            else:
-                kwargs = {}
-            # extract some options from the request
-            for arg in ("page", "per_page"):
-                name = getattr(table, f"prefixed_{arg}_field")
-                try:
-                    kwargs[arg] = int(self.request.GET[name])
-                except (ValueError, KeyError):
-                    pass
-
+        kwargs = self._configure(table)
+        if kwargs is not None:
             silent = kwargs.pop("silent", True)
             if not silent:
                 table.paginate(**kwargs)
@@ -67,3 +58,56 @@ class RequestConfig:
                     table.page = table.paginator.page(table.paginator.num_pages)
 
         return table
+
+    async def aconfigure(self, table):
+        """
+        Async version of `.configure`, which paginates the table using `~.Table.apaginate`.
+
+        Arguments:
+            table (`~.Table`): table to be configured
+        """
+        kwargs = self._configure(table)
+        if kwargs is not None:
+            silent = kwargs.pop("silent", True)
+            if not silent:
+                await table.apaginate(**kwargs)
+            else:
+                try:
+                    await table.apaginate(**kwargs)
+                except PageNotAnInteger:
+                    table.page = await apage(table.paginator, 1)
+                except EmptyPage:
+                    num_pages = await sync_to_async(getattr)(table.paginator, "num_pages")
+                    table.page = await apage(table.paginator, num_pages)
+
+        return table
+
+    def _configure(self, table):
+        """Apply the ordering from the request to `table`, return the keyword arguments to paginate it or `None`."""
+        table.request = self.request
+
+        order_by = self.request.GET.getlist(table.prefixed_order_by_field)
+        if order_by:
+            table.order_by = order_by
+        if not self.paginate:
+            return None
+
+        if hasattr(self.paginate, "items"):
+            kwargs = dict(self.paginate)
+        else:
+            kwargs = {}
+        # extract some options from the request
+        for arg in ("page", "per_page"):
+            name = getattr(table, f"prefixed_{arg}_field")
+            try:
+                kwargs[arg] = int(self.request.GET[name])
+            except (ValueError, KeyError):
+                pass
+
+        # cursor based paginators (like KeysetPaginator) identify pages with opaque strings
+        if getattr(kwargs.get("paginator_class"), "cursor_based", False):
+            page = self.request.GET.get(table.prefixed_page_field)
+            if page:
+                kwargs["page"] = page
+
+        return kwargs
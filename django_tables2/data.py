@@ -1,13 +1,34 @@
 import warnings
+from functools import lru_cache
+from itertools import islice
 
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.query import ModelIterable
+from django.db.models.query_utils import DeferredAttribute
 from django.utils.functional import cached_property
 
-from .utils import OrderBy, OrderByTuple, segment
+from .profiling import profile_phase
+from .utils import A, OrderBy, OrderByTuple, segment
+
+
+@lru_cache(maxsize=256)
+def infer_ordering(table_class, order_by, aliases):
+    """
+    Return the first order by aliases of a table class matching the ordering of a QuerySet.
+
+    Cached per table class, QuerySet ordering and order by aliases of the columns
+    (which can differ between instances of a table class, for example with
+    ``extra_columns`` or ``exclude``).
+    """
+    return next(segment(order_by, dict(aliases)), None)
 
 
 class TableData:
     """Base class for table data containers."""
 
+    # False if the records can not be ordered, which makes the table not orderable.
+    orderable = True
+
     def __init__(self, data):
         self.data = data
 
@@ -24,6 +45,20 @@ class TableData:
         """
         return iter(self.data)
 
+    def iterator(self, chunk_size=None):
+        """
+        Iterate over the table data without keeping all records in memory, if the data supports that.
+
+        Arguments:
+            chunk_size (int): number of records fetched at once, ignored for data
+                already in memory.
+        """
+        return iter(self)
+
+    async def acount(self):
+        """Return the number of records like `len()`, for use in async code."""
+        return len(self)
+
     def set_table(self, table):
         """
         `Table.__init__` calls this method to inject an instance of itself into the `TableData` instance.
@@ -121,6 +156,91 @@ class TableListData(TableData):
         self.data.sort(key=OrderByTuple(accessors).key)
 
 
+class TableIteratorData(TableData):
+    """
+    Table data container for one-pass iterables, like generators or file objects.
+
+    Records are pulled from the iterable lazily, so only the records actually
+    needed are consumed. Combined with `.LazyPaginator`, rendering page `n`
+    consumes at most ``per_page * (n + look_ahead) + 1`` records::
+
+        def read_log(path):
+            with open(path) as f:
+                for line in f:
+                    yield parse(line)
+
+        table = LogTable(TableIteratorData(read_log("/var/log/huge.log")))
+        table.paginate(paginator_class=LazyPaginator, page=3)
+
+    The length of the data is not known up front, so the default Django
+    `~django.core.paginator.Paginator` cannot be used. Ordering cannot be
+    applied to data that can only be iterated once either, so tables using it
+    are not orderable, and orderings (for example from the querystring) are ignored.
+
+    Since the data is consumed while iterating, every record can only be
+    retrieved once: slicing or iterating a second time continues where the
+    previous access stopped.
+    """
+
+    orderable = False
+
+    def __init__(self, data):
+        super().__init__(data)
+        self._iterator = iter(data)
+        self._position = 0
+
+    def __getitem__(self, key):
+        """Consume and return a list of records for a slice, a single record for an index."""
+        if isinstance(key, slice):
+            start, stop = key.start or 0, key.stop
+            if key.step not in (None, 1):
+                raise ValueError(f"{type(self).__name__} does not support slicing with a step")
+        else:
+            start, stop = key, key + 1
+
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError(f"{type(self).__name__} does not support negative indexing")
+        if start < self._position:
+            raise ValueError(
+                f"Records before index {self._position} have already been consumed from the iterable"
+            )
+
+        # skip records up to the start of the slice without keeping them around
+        for _ in islice(self._iterator, start - self._position):
+            self._position += 1
+        records = list(islice(self._iterator, None if stop is None else max(stop - start, 0)))
+        self._position += len(records)
+
+        if isinstance(key, slice):
+            return records
+        if not records:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return records[0]
+
+    def __iter__(self):
+        for record in self._iterator:
+            self._position += 1
+            yield record
+
+    def __len__(self):
+        raise TypeError(
+            f"The length of {type(self).__name__} is unknown, paginate it using LazyPaginator"
+        )
+
+    @property
+    def verbose_name(self):
+        return getattr(self.data, "verbose_name", super().verbose_name)
+
+    @property
+    def verbose_name_plural(self):
+        return getattr(self.data, "verbose_name_plural", super().verbose_name_plural)
+
+    def order_by(self, aliases):
+        """Refuse ordering, records from a one-pass iterable can not be sorted."""
+        if aliases:
+            raise ValueError(f"{type(self).__name__} can not be ordered")
+
+
 class TableQuerysetData(TableData):
     """Table data container for a QuerySet."""
 
@@ -134,18 +254,135 @@ class TableQuerysetData(TableData):
             and callable(data.order_by)
         )
 
+    def __getitem__(self, key):
+        """
+        Slice or index the QuerySet.
+
+        If `.Table.Meta.pagination_strategy` is ``"deferred_join"``, slices are
+        fetched in two steps: first the primary keys of the rows in the slice are
+        selected using the requested ordering, after which the full rows (including
+        ``select_related()``/``prefetch_related()``) are fetched for just those keys.
+        """
+        if isinstance(key, slice) and self._use_deferred_join():
+            pks = list(self.data.values_list("pk", flat=True)[key])
+            records = {record.pk: record for record in self.data.order_by().filter(pk__in=pks)}
+            return [records[pk] for pk in pks if pk in records]
+
+        return super().__getitem__(key)
+
+    def _use_deferred_join(self):
+        table = getattr(self, "table", None)
+        if table is None or table._meta.pagination_strategy != "deferred_join":
+            return False
+
+        # values() rows have no pk attribute, distinct/combined queries can not be filtered by pk.
+        query = self.data.query
+        return not (query.values_select or query.distinct or query.combinator)
+
+    def iterator(self, chunk_size=None):
+        """
+        Iterate over the QuerySet using `~django.db.models.query.QuerySet.iterator`.
+
+        The records are fetched `chunk_size` (defaults to 2000) at a time and are not
+        kept in the result cache of the QuerySet. ``prefetch_related()`` lookups are
+        applied to each chunk. If the QuerySet was already evaluated, its cached
+        results are used instead of querying again.
+        """
+        if self.data._result_cache is not None:
+            return iter(self.data)
+        return self.data.iterator(chunk_size=chunk_size or 2000)
+
+    def get_field_lookup(self, accessor):
+        """
+        Return the lookup to fetch the value for `accessor` using ``values_list()``, or `None`.
+
+        A lookup is only returned if resolving `accessor` on a record results in the
+        plain value of a model field: only forward foreign keys and one-to-one relations
+        are followed, and the final field is not a relation, has no choices (which
+        would be displayed using ``get_FOO_display()``) and no custom descriptor.
+        """
+        if self.data._iterable_class is not ModelIterable or self.data.query.combinator:
+            return None
+
+        model = self.model
+        bits = A(accessor).bits
+        for i, bit in enumerate(bits):
+            try:
+                field = model._meta.get_field(bit)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or bit != field.name:
+                return None
+            if i < len(bits) - 1:
+                if not (field.many_to_one or field.one_to_one):
+                    return None
+                model = field.related_model
+            elif (
+                field.is_relation
+                or field.choices
+                or field.descriptor_class is not DeferredAttribute
+            ):
+                return None
+
+        return "__".join(bits) if bits else None
+
+    def iterator_with_values(self, lookups, chunk_size=None):
+        """
+        Iterate over ``(record, values)`` pairs, where `values` is a list with the values for `lookups`.
+
+        Records are fetched in chunks like `.iterator`, the values are fetched using
+        one ``values_list()`` query for each chunk. `values` is `None` for records which
+        no longer exist when their values are fetched.
+        """
+        # the records are already filtered, so the values can be fetched using the primary keys.
+        queryset = self.model._base_manager.using(self.data.db).values_list("pk", *lookups)
+        records = self.iterator(chunk_size=chunk_size)
+        chunk_size = chunk_size or 2000
+        while chunk := list(islice(records, chunk_size)):
+            values = {
+                pk: values
+                for pk, *values in queryset.filter(pk__in=[record.pk for record in chunk])
+            }
+            for record in chunk:
+                yield record, values.get(record.pk)
+
     def __len__(self):
         """Length of the data (cached)."""
         if not hasattr(self, "_length") or self._length is None:
             if hasattr(self.table, "paginator"):
                 # for paginated tables, use QuerySet.count() as we are interested in total number of records.
-                self._length = self.data.count()
+                count_cache = self.table._meta.count_cache
+                with profile_phase(self.table, "count"):
+                    if count_cache is not None:
+                        self._length = count_cache.get_count(self.data)
+                    else:
+                        self._length = self.data.count()
             else:
                 # for non-paginated tables, use the length of the QuerySet
                 self._length = len(self.data)
 
         return self._length
 
+    async def acount(self):
+        """
+        Async version of `len()`, using ``QuerySet.acount()`` for paginated tables.
+
+        For tables which are not paginated, the QuerySet is evaluated using async
+        iteration. The length is cached like it is for `len()`.
+        """
+        if getattr(self, "_length", None) is None:
+            if hasattr(self.table, "paginator"):
+                count_cache = self.table._meta.count_cache
+                with profile_phase(self.table, "count"):
+                    if count_cache is not None:
+                        self._length = await count_cache.aget_count(self.data)
+                    else:
+                        self._length = await self.data.acount()
+            else:
+                self._length = len([record async for record in self.data])
+
+        return self._length
+
     def set_table(self, table):
         super().set_table(table)
         if (
@@ -168,13 +405,15 @@ class TableQuerysetData(TableData):
         This works by inspecting the actual underlying data. As such it's only
         supported for querysets.
         """
-        aliases = {}
-        for bound_column in self.table.columns:
-            aliases[bound_column.order_by_alias] = bound_column.order_by
+        aliases = tuple(
+            (bound_column.order_by_alias, bound_column.order_by)
+            for bound_column in self.table.columns
+        )
+        order_by = tuple(self.data.query.order_by)
         try:
-            return next(segment(self.data.query.order_by, aliases))
-        except StopIteration:
-            pass
+            return infer_ordering(type(self.table), order_by, aliases)
+        except TypeError:  # unhashable expression in the ordering
+            return next(segment(order_by, dict(aliases)), None)
 
     def order_by(self, aliases):
         """
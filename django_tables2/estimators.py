@@ -0,0 +1,92 @@
+import json
+
+from django.core.exceptions import EmptyResultSet
+from django.db import DatabaseError, connections
+
+
+def _get_sql(queryset):
+    """Return the SQL and parameters for the unordered `queryset`."""
+    return queryset.order_by().query.get_compiler(using=queryset.db).as_sql()
+
+
+class StatisticsEstimator:
+    """
+    Estimate the number of rows of a QuerySet using the statistics kept by the database.
+
+    - On PostgreSQL, the row estimate of the query planner is used (``EXPLAIN``),
+      which takes filters into account.
+    - On SQLite, the row count of the table stored in ``sqlite_stat1`` is used,
+      which is only available after running ``ANALYZE``, and only for QuerySets
+      without filters.
+
+    For other databases, or if no statistics are available, `None` is returned.
+    """
+
+    def __call__(self, queryset):
+        vendor = connections[queryset.db].vendor
+        try:
+            if vendor == "postgresql":
+                return self.estimate_postgresql(queryset)
+            if vendor == "sqlite":
+                return self.estimate_sqlite(queryset)
+        except (DatabaseError, EmptyResultSet):
+            pass
+        return None
+
+    def estimate_postgresql(self, queryset):
+        sql, params = _get_sql(queryset)
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def estimate_sqlite(self, queryset):
+        query = queryset.query
+        if query.where or query.distinct or query.combinator or query.is_sliced:
+            return None
+
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+
+        # the first number in stat is the number of rows in the table.
+        return int(row[0].split()[0]) if row else None
+
+
+class SampledEstimator:
+    """
+    Estimate the number of rows of a QuerySet by measuring its selectivity on a sample.
+
+    The QuerySet is counted for the first `sample_size` rows of the table, after which
+    the fraction of matching rows is multiplied by the (estimated) size of the whole
+    table. If the table has fewer than `sample_size` rows, the count is exact.
+
+    Note that the sample is not random, it's the first rows the database returns,
+    so the estimate might be off if the filtered rows are not evenly distributed.
+
+    Arguments:
+        sample_size (int): number of rows in the sample.
+        table_estimator (callable): estimator used for the number of rows in the
+            table, defaults to `.StatisticsEstimator`.
+    """
+
+    def __init__(self, sample_size=1000, table_estimator=None):
+        self.sample_size = sample_size
+        self.table_estimator = table_estimator or StatisticsEstimator()
+
+    def __call__(self, queryset):
+        table = queryset.model._default_manager.using(queryset.db).all()
+        sample = list(table.order_by().values_list("pk", flat=True)[: self.sample_size])
+        matches = queryset.order_by().filter(pk__in=sample).count()
+        if len(sample) < self.sample_size:
+            return matches
+
+        total = self.table_estimator(table)
+        if total is None:
+            return None
+        return round(total * matches / len(sample))
@@ -1,4 +1,17 @@
 from .export import TableExport
-from .views import ExportMixin
+from .jobs import ExportJob, ExportJobStatus, ThreadPoolRunner
+from .parallel import TableSpec, parallel_as_values
+from .streaming import StreamingTableExport
+from .views import ExportJobMixin, ExportMixin
 
-__all__ = ("TableExport", "ExportMixin")
+__all__ = (
+    "TableExport",
+    "StreamingTableExport",
+    "ExportJob",
+    "ExportJobStatus",
+    "ThreadPoolRunner",
+    "ExportMixin",
+    "ExportJobMixin",
+    "TableSpec",
+    "parallel_as_values",
+)
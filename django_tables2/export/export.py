@@ -1,5 +1,11 @@
+import re
+import tempfile
+
 from django.core.exceptions import ImproperlyConfigured
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse
+
+from ..data import TableQuerysetData
+from .parallel import parallel_as_values
 
 try:
     from tablib import Dataset
@@ -8,6 +14,13 @@ except ImportError:  # pragma: no cover
         "You must have tablib installed in order to use the django-tables2 export functionality"
     )
 
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font
+except ImportError:  # pragma: no cover
+    Workbook = None
+
 
 class TableExport:
     """
@@ -22,6 +35,23 @@ class TableExport:
 
         dataset_kwargs (dictionary): passed as `**kwargs` to `tablib.Dataset` constructor
 
+        chunk_size (int): number of records fetched at once when exporting QuerySet data
+
+        xlsx_write_only_threshold (int): minimum number of rows to export `xlsx` using
+            the write-only mode of ``openpyxl``, defaults to the class attribute with
+            the same name (10000). Set the class attribute to `None` to disable it.
+
+        parallel (bool): if `True`, the values are rendered in parallel using
+            `.parallel_as_values`.
+
+        executor (`~concurrent.futures.Executor`): executor used for a parallel export,
+            defaults to a process pool.
+
+    XLSX exports with at least `xlsx_write_only_threshold` rows are not converted to
+    a `tablib.Dataset`, but the rows are written to a temporary file one by one, using
+    a write-only ``openpyxl`` workbook. This keeps memory usage low for large exports,
+    but the column widths are not adapted to the contents. Data of which the number of
+    rows is unknown (like `.TableIteratorData`) is always converted to a `tablib.Dataset`.
     """
 
     CSV = "csv"
@@ -44,16 +74,67 @@ class TableExport:
         YAML: "text/yaml; charset=utf-8",
     }
 
-    def __init__(self, export_format, table, exclude_columns=None, dataset_kwargs=None):
+    xlsx_write_only_threshold = 10000
+
+    def __init__(
+        self,
+        export_format,
+        table,
+        exclude_columns=None,
+        dataset_kwargs=None,
+        chunk_size=2000,
+        xlsx_write_only_threshold=None,
+        parallel=False,
+        executor=None,
+    ):
         if not self.is_valid_format(export_format):
             raise TypeError(f'Export format "{export_format}" is not supported.')
 
         self.format = export_format
-        self.dataset = self.table_to_dataset(table, exclude_columns, dataset_kwargs)
-
-    def table_to_dataset(self, table, exclude_columns, dataset_kwargs=None):
-        """Transform a table to a tablib dataset."""
+        self.chunk_size = chunk_size
+        self.parallel = parallel
+        self.executor = executor
+        if xlsx_write_only_threshold is not None:
+            self.xlsx_write_only_threshold = xlsx_write_only_threshold
+
+        if self.use_xlsx_write_only(table):
+            # rows are only written when the export is requested.
+            self.table = table
+            self.exclude_columns = exclude_columns
+            self.title = self.get_dataset_kwargs(table, dataset_kwargs).get("title")
+            self.dataset = None
+        else:
+            self.dataset = self.table_to_dataset(table, exclude_columns, dataset_kwargs)
+
+    def use_xlsx_write_only(self, table):
+        """Return True if `table` should be exported using a write-only ``openpyxl`` workbook."""
+        if self.format != self.XLSX or self.xlsx_write_only_threshold is None or Workbook is None:
+            return False
+
+        rows = self.get_row_count(table)
+        return rows is not None and rows >= self.xlsx_write_only_threshold
+
+    def get_row_count(self, table):
+        """
+        Return the number of rows of `table`, `None` if it can't be known without consuming the data.
 
+        The (cached) count of paginated tables is reused, QuerySets of other tables are
+        counted using ``count()`` rather than fetching all records.
+        """
+        data = table.data
+        if (
+            isinstance(data, TableQuerysetData)
+            and not hasattr(table, "paginator")
+            and getattr(data, "_length", None) is None
+            and data.data._result_cache is None
+        ):
+            return data.data.count()
+        try:
+            return len(data)
+        except TypeError:  # for example TableIteratorData
+            return None
+
+    def get_dataset_kwargs(self, table, dataset_kwargs=None):
         def default_dataset_title():
             try:
                 return table.Meta.model._meta.verbose_name_plural.title()
@@ -62,8 +143,20 @@ class TableExport:
 
         kwargs = {"title": default_dataset_title()}
         kwargs.update(dataset_kwargs or {})
-        dataset = Dataset(**kwargs)
-        for i, row in enumerate(table.as_values(exclude_columns=exclude_columns)):
+        return kwargs
+
+    def table_values(self, table, exclude_columns):
+        """Return the row iterator of `table`, see `.Table.as_values`."""
+        if self.parallel:
+            return parallel_as_values(
+                table, exclude_columns, chunk_size=self.chunk_size, executor=self.executor
+            )
+        return table.as_values(exclude_columns=exclude_columns, chunk_size=self.chunk_size)
+
+    def table_to_dataset(self, table, exclude_columns, dataset_kwargs=None):
+        """Transform a table to a tablib dataset."""
+        dataset = Dataset(**self.get_dataset_kwargs(table, dataset_kwargs))
+        for i, row in enumerate(self.table_values(table, exclude_columns)):
             if i == 0:
                 dataset.headers = row
             else:
@@ -79,18 +172,67 @@ class TableExport:
         """Return the content type for the current export format."""
         return self.FORMATS[self.format]
 
+    def write_xlsx(self, file):
+        """Write the rows of the table to `file` using a write-only ``openpyxl`` workbook."""
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(
+            re.sub(r"[\\*?:/\[\]]", "-", self.title)[:31] if self.title else "Tablib Dataset"
+        )
+        # same layout as tablib: bold headers, frozen below the headers and wrapped multi-line text.
+        sheet.freeze_panes = "A2"
+        bold = Font(bold=True)
+        wrap_text = Alignment(wrap_text=True)
+
+        def write_only_cell(value, font=None):
+            cell = WriteOnlyCell(sheet)
+            try:
+                cell.value = value
+            except ValueError:
+                cell.value = str(value)
+            if font is not None:
+                cell.font = font
+            elif "\n" in str(value):
+                cell.alignment = wrap_text
+            return cell
+
+        rows = self.table_values(self.table, self.exclude_columns)
+        sheet.append([write_only_cell(value, bold) for value in next(rows)])
+        for row in rows:
+            sheet.append([write_only_cell(value) for value in row])
+        workbook.save(file)
+
     def export(self):
         """Return the string/bytes for the current export format."""
+        if self.dataset is None:
+            with tempfile.TemporaryFile() as file:
+                self.write_xlsx(file)
+                file.seek(0)
+                return file.read()
+
         return self.dataset.export(self.format)
 
     def response(self, filename=None):
         """
         Build and return a `HttpResponse` containing the exported data.
 
+        Write-only XLSX exports are written to a temporary file, which is streamed using a
+        `~django.http.FileResponse`.
+
         Arguments:
             filename (str): if not `None`, the filename is attached to the
                 `Content-Disposition` header of the response.
         """
+        if self.dataset is None:
+            file = tempfile.TemporaryFile()
+            self.write_xlsx(file)
+            file.seek(0)
+            return FileResponse(
+                file,
+                content_type=self.content_type(),
+                as_attachment=filename is not None,
+                filename=filename,
+            )
+
         response = HttpResponse(content_type=self.content_type())
         if filename is not None:
             response["Content-Disposition"] = f'attachment; filename="{filename}"'
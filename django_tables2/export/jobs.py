@@ -0,0 +1,416 @@
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import connections
+from django.http import FileResponse, HttpResponse
+from django.utils import timezone
+
+from ..data import TableQuerysetData
+from .export import TableExport
+from .streaming import StreamingTableExport
+
+
+class ExportJobCancelled(Exception):
+    """Raised in the worker when the export job is cancelled."""
+
+
+class ExportJobStatus:
+    """
+    Status of an `.ExportJob`, stored in Django's cache so it can be read from any process.
+
+    Attributes:
+        job_id (str): identifier of the job.
+        state (str): one of `pending`, `running`, `finished`, `failed` or `cancelled`.
+        rows (int): number of rows exported so far.
+        total (int): total number of rows to export, `None` if unknown.
+        name (str): name of the exported file in the storage, once finished.
+        filename (str): filename to use for the download.
+        content_type (str): content type of the exported file.
+        error (str): description of the error, if the job failed.
+        owner: primary key of the user who started the job, if any.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    FIELDS = (
+        "job_id",
+        "state",
+        "rows",
+        "total",
+        "name",
+        "filename",
+        "content_type",
+        "error",
+        "owner",
+    )
+
+    def __init__(
+        self,
+        job_id,
+        state=PENDING,
+        rows=0,
+        total=None,
+        name=None,
+        filename=None,
+        content_type=None,
+        error=None,
+        owner=None,
+    ):
+        self.job_id = job_id
+        self.state = state
+        self.rows = rows
+        self.total = total
+        self.name = name
+        self.filename = filename
+        self.content_type = content_type
+        self.error = error
+        self.owner = owner
+
+    @property
+    def progress(self):
+        """Fraction of the rows exported, `None` if the total number of rows is unknown."""
+        if self.state == self.FINISHED:
+            return 1.0
+        if not self.total:
+            return None
+        return min(self.rows / self.total, 1.0)
+
+    @property
+    def is_done(self):
+        return self.state in (self.FINISHED, self.FAILED, self.CANCELLED)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS} | {"progress": self.progress}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data[field] for field in cls.FIELDS})
+
+
+class ExportJob:
+    """
+    Export a table to a file in a `~django.core.files.storage.Storage`, outside of the request/response cycle.
+
+    The state of the table (its class, data, ordering, ``exclude``, ``sequence`` and
+    ``extra_columns``) is taken from `table` when the job is created, the export is
+    done when `run` is called, usually by a worker thread (see `.ThreadPoolRunner`).
+    Progress and cancellation are communicated through an `.ExportJobStatus` in
+    Django's cache, using the job's `id`.
+
+    The exported file is kept in the storage for `timeout` seconds, like the status.
+    Before exporting, `run` deletes the files of earlier jobs which are older than
+    that, see `delete_expired`. `delete` deletes the file and status of a job.
+
+    Rows of the formats supported by `.StreamingTableExport` are written to a
+    temporary spool file while they are exported. Other formats are exported
+    using `.TableExport`, which can only be cancelled before it starts.
+
+    Arguments:
+        table (`~.Table`): instance of the table to export the data from.
+        export_format (str): one of the formats supported by `.TableExport` or
+            `.StreamingTableExport`.
+        exclude_columns (iterable): list of column names to exclude from the export.
+        dataset_kwargs (dictionary): passed as `**kwargs` to `tablib.Dataset` constructor.
+        filename (str): filename for the download, defaults to ``table.<export_format>``.
+        table_kwargs (dictionary): additional keyword arguments to create the table
+            in the worker.
+        storage (`~django.core.files.storage.Storage`): storage to save the exported
+            file to, defaults to ``default_storage``.
+        cache_alias (str): alias of the cache in `settings.CACHES` to store the status in.
+        timeout (int): number of seconds the status is kept in the cache, and the
+            exported file in the storage.
+        chunk_size (int): number of rows exported between updates of the status.
+        owner: primary key of the user starting the job.
+    """
+
+    cache_key_prefix = "django_tables2.export_job"
+    storage_prefix = "django_tables2/exports"
+
+    def __init__(
+        self,
+        table,
+        export_format,
+        exclude_columns=None,
+        dataset_kwargs=None,
+        filename=None,
+        table_kwargs=None,
+        storage=None,
+        cache_alias="default",
+        timeout=3600,
+        chunk_size=2000,
+        owner=None,
+    ):
+        if not (
+            TableExport.is_valid_format(export_format)
+            or StreamingTableExport.is_valid_format(export_format)
+        ):
+            raise TypeError(f'Export format "{export_format}" is not supported.')
+
+        self.id = uuid4().hex
+        self.format = export_format
+        self.exclude_columns = exclude_columns
+        self.dataset_kwargs = dataset_kwargs
+        self.filename = filename or f"table.{export_format}"
+        self.storage = storage or default_storage
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+
+        # Snapshot of the table: the data is cloned, so evaluating it in the worker
+        # doesn't affect the table used in the request.
+        self.table_class = type(table)
+        data = table.data.data
+        self.data = data.all() if isinstance(table.data, TableQuerysetData) else data
+        self.table_kwargs = {
+            "order_by": table.order_by,
+            "exclude": table.exclude,
+            "sequence": table.sequence,
+            "extra_columns": table.extra_columns,
+        }
+        self.table_kwargs.update(table_kwargs or {})
+
+        self.save_status(ExportJobStatus(self.id, filename=self.filename, owner=owner))
+
+    @classmethod
+    def get_cache_key(cls, job_id, suffix="status"):
+        return f"{cls.cache_key_prefix}:{job_id}:{suffix}"
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @classmethod
+    def get_status(cls, job_id, cache_alias="default"):
+        """Return the `.ExportJobStatus` for `job_id`, or `None` if it doesn't exist (anymore)."""
+        data = caches[cache_alias].get(cls.get_cache_key(job_id))
+        return None if data is None else ExportJobStatus.from_dict(data)
+
+    @classmethod
+    def cancel(cls, job_id, cache_alias="default", timeout=3600):
+        """Request cancellation of the job, which is checked by the worker after each chunk of rows."""
+        caches[cache_alias].set(cls.get_cache_key(job_id, "cancel"), True, timeout)
+
+    @classmethod
+    def get_storage_dir(cls, job_id):
+        return f"{cls.storage_prefix}/{job_id}"
+
+    @classmethod
+    def delete(cls, job_id, storage=None, cache_alias="default"):
+        """Delete the exported file and the status of the job `job_id`."""
+        storage = storage or default_storage
+        directory = cls.get_storage_dir(job_id)
+        try:
+            _, files = storage.listdir(directory)
+        except FileNotFoundError:
+            files = []
+        for name in files:
+            storage.delete(f"{directory}/{name}")
+        caches[cache_alias].delete_many(
+            [cls.get_cache_key(job_id), cls.get_cache_key(job_id, "cancel")]
+        )
+
+    @classmethod
+    def delete_expired(cls, storage=None, max_age=3600):
+        """Delete the exported files in `storage` which are older than `max_age` seconds."""
+        storage = storage or default_storage
+        try:
+            job_ids, _ = storage.listdir(cls.storage_prefix)
+        except FileNotFoundError:
+            return
+        expired = timezone.now() - timedelta(seconds=max_age)
+        for job_id in job_ids:
+            directory = cls.get_storage_dir(job_id)
+            for name in storage.listdir(directory)[1]:
+                if storage.get_modified_time(f"{directory}/{name}") < expired:
+                    storage.delete(f"{directory}/{name}")
+
+    @property
+    def status(self):
+        return self.get_status(self.id, self.cache_alias)
+
+    def save_status(self, status):
+        self.cache.set(self.get_cache_key(self.id), status.as_dict(), self.timeout)
+
+    def is_cancelled(self):
+        return bool(self.cache.get(self.get_cache_key(self.id, "cancel")))
+
+    def get_table(self):
+        return self.table_class(self.data, **self.table_kwargs)
+
+    def get_total(self, table):
+        if isinstance(table.data, TableQuerysetData):
+            return table.data.data.count()
+        return len(table.data)
+
+    def get_storage_name(self):
+        return f"{self.get_storage_dir(self.id)}/{self.filename}"
+
+    def run(self):
+        """Export the table to the storage, updating the status while doing so."""
+        status = self.status or ExportJobStatus(self.id, filename=self.filename)
+        try:
+            if self.is_cancelled():
+                raise ExportJobCancelled()
+
+            self.delete_expired(self.storage, max_age=self.timeout)
+            table = self.get_table()
+            status.state = ExportJobStatus.RUNNING
+            status.total = self.get_total(table)
+            self.save_status(status)
+
+            with tempfile.TemporaryFile() as spool:
+                status.content_type = self.write(table, spool, status)
+                spool.seek(0)
+                status.name = self.storage.save(self.get_storage_name(), File(spool))
+            status.state = ExportJobStatus.FINISHED
+        except ExportJobCancelled:
+            status.state = ExportJobStatus.CANCELLED
+        except Exception as e:
+            status.state = ExportJobStatus.FAILED
+            status.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.save_status(status)
+
+        return status
+
+    def write(self, table, spool, status):
+        """Write the export of `table` to the file `spool` and return the content type."""
+        if not StreamingTableExport.is_valid_format(self.format):
+            exporter = TableExport(
+                self.format,
+                table,
+                exclude_columns=self.exclude_columns,
+                dataset_kwargs=self.dataset_kwargs,
+                chunk_size=self.chunk_size,
+            )
+            if exporter.dataset is None:
+                exporter.write_xlsx(spool)
+            else:
+                content = exporter.export()
+                spool.write(content if isinstance(content, bytes) else content.encode())
+            status.rows = status.total
+            return exporter.content_type()
+
+        exporter = StreamingTableExport(
+            self.format, table, exclude_columns=self.exclude_columns, chunk_size=self.chunk_size
+        )
+        # jsonl has no header line
+        header_lines = 0 if self.format == StreamingTableExport.JSONL else 1
+        for i, line in enumerate(exporter.export(), start=1 - header_lines):
+            spool.write(line.encode())
+            if i and i % self.chunk_size == 0:
+                if self.is_cancelled():
+                    raise ExportJobCancelled()
+                status.rows = i
+                self.save_status(status)
+        status.rows = status.total
+        return exporter.content_type()
+
+
+class ThreadPoolRunner:
+    """
+    Run `.ExportJob` instances in a pool of worker threads in the current process.
+
+    Arguments:
+        max_workers (int): maximum number of jobs running at the same time.
+    """
+
+    def __init__(self, max_workers=2):
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="django_tables2_export")
+
+    def submit(self, job):
+        """Schedule `job`, returns a `~concurrent.futures.Future`."""
+        return self.executor.submit(self.run, job)
+
+    @staticmethod
+    def run(job):
+        try:
+            return job.run()
+        finally:
+            # worker threads have their own database connections, which Django doesn't close.
+            connections.close_all()
+
+
+_default_runner = None
+
+
+def get_default_runner():
+    """Return the `.ThreadPoolRunner` used if no runner is configured."""
+    global _default_runner
+    if _default_runner is None:
+        _default_runner = ThreadPoolRunner()
+    return _default_runner
+
+
+class RangeFile:
+    """File-like object reading at most `length` bytes from `file`, starting at `start`."""
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def file_response(request, storage, name, filename=None, content_type=None):
+    """
+    Return a `~django.http.FileResponse` for the file `name` in `storage`.
+
+    Single byte ranges requested with the ``Range`` header are supported, which allows
+    clients to resume an interrupted download. Other ranges are ignored.
+    """
+    size = storage.size(name)
+    file = storage.open(name, "rb")
+    start, end = 0, size - 1
+
+    match = RANGE_RE.match(request.headers.get("Range", "").strip())
+    if match and any(match.groups()):
+        first, last = match.groups()
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            # suffix range, the last N bytes
+            start = max(size - int(last), 0)
+        if start >= size or start > end:
+            file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    partial = (start, end) != (0, size - 1)
+    response = FileResponse(
+        RangeFile(file, start, end - start + 1) if partial else file,
+        as_attachment=True,
+        filename=filename,
+        content_type=content_type,
+        status=206 if partial else 200,
+    )
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Length"] = str(end - start + 1)
+    if partial:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
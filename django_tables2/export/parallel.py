@@ -0,0 +1,168 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from django.apps import apps
+from django.db import connections
+from django.utils.encoding import force_str
+
+from ..data import TableQuerysetData
+from ..rows import BoundRow
+
+
+class TableSpec:
+    """
+    Picklable description of a table with QuerySet data, used to export a part of its rows in another process.
+
+    Pickling a QuerySet evaluates it, so only its class, `query` and the lookups passed to
+    ``prefetch_related()`` are pickled. The table class and the QuerySet class must be
+    importable by their module and name. The columns of the table (``exclude``,
+    ``sequence`` and ``extra_columns``) are kept, so extra columns must be picklable.
+
+    Arguments:
+        table (`~.Table`): the table to describe.
+        exclude_columns (iterable): list of column names to exclude from the export.
+        table_kwargs (dictionary): additional keyword arguments to create the table.
+    """
+
+    def __init__(self, table, exclude_columns=None, table_kwargs=None):
+        queryset = table.data.data
+        self.table_class = type(table)
+        self.queryset_class = type(queryset)
+        self.model = queryset.model
+        self.db = queryset.db
+        self.query = queryset.query
+        self.prefetch_related_lookups = queryset._prefetch_related_lookups
+        self.exclude_columns = exclude_columns
+        self.table_kwargs = {
+            "exclude": table.exclude,
+            "sequence": table.sequence,
+            "extra_columns": table.extra_columns,
+        }
+        self.table_kwargs.update(table_kwargs or {})
+
+    def get_queryset(self):
+        queryset = self.queryset_class(model=self.model, query=self.query, using=self.db)
+        return queryset.prefetch_related(*self.prefetch_related_lookups)
+
+    def get_table(self, pks):
+        """Return a table for the records with primary keys `pks`, in the order of `pks`."""
+        records = {
+            record.pk: record for record in self.get_queryset().order_by().filter(pk__in=pks)
+        }
+        # the records are already ordered, so don't let the table order them again.
+        return self.table_class(
+            [records[pk] for pk in pks if pk in records], order_by=(), **self.table_kwargs
+        )
+
+
+def export_chunk(spec, pks):
+    """Return the exported values for the records with primary keys `pks`."""
+    table = spec.get_table(pks)
+    columns = table._get_export_columns(spec.exclude_columns)
+    return [table._row_values(BoundRow(record, table=table), columns) for record in table.data]
+
+
+def init_worker():
+    """
+    Prepare a worker process to use the database.
+
+    Forked workers inherit the database connections of the parent process. These are
+    discarded without closing them (which would affect the parent), so each worker opens
+    its own connections. Workers which are not forked need to set up Django first.
+    """
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+    for connection in connections.all(initialized_only=True):
+        connection.connection = None
+
+
+def can_export_parallel(table):
+    """Return True if the rows of `table` can be exported using `parallel_as_values`."""
+    if not isinstance(table.data, TableQuerysetData):
+        return False
+    query = table.data.data.query
+    return not (query.is_sliced or query.combinator or query.values_select)
+
+
+def map_chunks(executor, spec, chunks, max_pending):
+    """
+    Yield the results of `export_chunk` for `chunks` in order, with at most `max_pending` chunks submitted at once.
+
+    This bounds the number of exported chunks kept in memory if the results are
+    consumed slowly, for example by a streaming response to a slow client.
+    """
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(export_chunk, spec, chunk))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def parallel_as_values(
+    table,
+    exclude_columns=None,
+    chunk_size=2000,
+    executor=None,
+    table_kwargs=None,
+    max_pending=None,
+):
+    """
+    Return a row iterator like `.Table.as_values`, rendering the values of chunks of rows in parallel.
+
+    The ordered list of primary keys is split into chunks of `chunk_size`, each chunk is
+    exported by a worker, recreating the table from a `.TableSpec` for the rows in that
+    chunk. The rows are returned in the original order. This is useful if the values of
+    the columns are expensive to compute, for example using ``value_FOO`` methods.
+
+    For tables which can not be exported in parallel (data which is not a QuerySet, or a
+    sliced or combined QuerySet), this falls back to `.Table.as_values`.
+
+    Arguments:
+        table (`~.Table`): the table to export.
+        exclude_columns (iterable): list of column names to exclude from the export.
+        chunk_size (int): number of rows exported by a worker at once.
+        executor (`~concurrent.futures.Executor`): executor to run the workers, defaults
+            to a `~concurrent.futures.ProcessPoolExecutor` which is shut down afterwards.
+        table_kwargs (dictionary): additional keyword arguments to create the table
+            in the workers.
+        max_pending (int): maximum number of chunks submitted to the executor and not
+            yet returned, defaults to twice the number of workers of the executor.
+    """
+    if not can_export_parallel(table):
+        yield from table.as_values(exclude_columns=exclude_columns, chunk_size=chunk_size)
+        return
+
+    columns = table._get_export_columns(exclude_columns)
+    yield [force_str(column.header, strings_only=True) for column in columns]
+
+    pinned_data = table.rows.pinned_data
+    for row in table.rows.generator_pinned_row(pinned_data.get("top")):
+        yield table._row_values(row, columns)
+
+    pks = list(table.data.data.values_list("pk", flat=True))
+    chunks = [pks[i : i + chunk_size] for i in range(0, len(pks), chunk_size)]
+    spec = TableSpec(table, exclude_columns=exclude_columns, table_kwargs=table_kwargs)
+
+    def export_chunks(executor):
+        workers = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+        for rows in map_chunks(executor, spec, chunks, max_pending or 2 * workers):
+            yield from rows
+
+    if executor is None:
+        with ProcessPoolExecutor(initializer=init_worker) as executor:
+            yield from export_chunks(executor)
+    else:
+        yield from export_chunks(executor)
+
+    for row in table.rows.generator_pinned_row(pinned_data.get("bottom")):
+        yield table._row_values(row, columns)
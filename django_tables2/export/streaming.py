@@ -0,0 +1,123 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+from .parallel import parallel_as_values
+
+
+class Echo:
+    """File-like object returning the written value instead of storing it, for use with `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
+class StreamingTableExport:
+    """
+    Export data from a table row by row, without building the complete export in memory.
+
+    Only row-oriented formats can be streamed. The exported data is written to a
+    `~django.http.StreamingHttpResponse` as soon as a row is available, so the
+    first bytes are sent before the complete table has been exported.
+
+    Arguments:
+        export_format (str): one of `csv, jsonl, tsv`
+
+        table (`~.Table`): instance of the table to export the data from
+
+        exclude_columns (iterable): list of column names to exclude from the export
+
+        chunk_size (int): number of records fetched at once when exporting QuerySet data
+
+        parallel (bool): if `True`, the values are rendered in parallel using
+            `.parallel_as_values`.
+
+        executor (`~concurrent.futures.Executor`): executor used for a parallel export,
+            defaults to a process pool.
+    """
+
+    CSV = "csv"
+    JSONL = "jsonl"
+    TSV = "tsv"
+
+    FORMATS = {
+        CSV: "text/csv; charset=utf-8",
+        JSONL: "application/jsonl; charset=utf-8",
+        TSV: "text/tsv; charset=utf-8",
+    }
+
+    def __init__(
+        self,
+        export_format,
+        table,
+        exclude_columns=None,
+        chunk_size=2000,
+        parallel=False,
+        executor=None,
+    ):
+        if not self.is_valid_format(export_format):
+            raise TypeError(f'Export format "{export_format}" is not supported.')
+
+        self.format = export_format
+        self.table = table
+        self.exclude_columns = exclude_columns
+        self.chunk_size = chunk_size
+        self.parallel = parallel
+        self.executor = executor
+
+    @classmethod
+    def is_valid_format(cls, export_format):
+        """Return True if `export_format` is one of the supported export formats."""
+        return export_format is not None and export_format in cls.FORMATS.keys()
+
+    def content_type(self):
+        """Return the content type for the current export format."""
+        return self.FORMATS[self.format]
+
+    def export(self):
+        """Return an iterator of strings for the current export format, one for each row."""
+        if self.parallel:
+            rows = parallel_as_values(
+                self.table, self.exclude_columns, chunk_size=self.chunk_size, executor=self.executor
+            )
+        else:
+            rows = self.table.as_values(
+                exclude_columns=self.exclude_columns, chunk_size=self.chunk_size
+            )
+        if self.format == self.JSONL:
+            return self.export_jsonl(rows)
+
+        writer = csv.writer(Echo(), delimiter="\t" if self.format == self.TSV else ",")
+        return (writer.writerow(row) for row in rows)
+
+    def export_jsonl(self, rows):
+        headers = next(rows)
+        for row in rows:
+            yield json.dumps(dict(zip(headers, row)), cls=DjangoJSONEncoder) + "\n"
+
+    def response(self, filename=None, gzip=False):
+        """
+        Build and return a `StreamingHttpResponse` containing the exported data.
+
+        Arguments:
+            filename (str): if not `None`, the filename is attached to the
+                `Content-Disposition` header of the response.
+            gzip (bool): if `True`, the exported data is compressed while it's
+                streamed and the `Content-Encoding` header is set accordingly.
+        """
+        content = (row.encode() for row in self.export())
+        if gzip:
+            content = compress_sequence(content)
+
+        response = StreamingHttpResponse(content, content_type=self.content_type())
+        if filename is not None:
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        if gzip:
+            response["Content-Encoding"] = "gzip"
+            patch_vary_headers(response, ("Accept-Encoding",))
+
+        return response
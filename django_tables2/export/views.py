@@ -1,4 +1,9 @@
+from django.core.files.storage import default_storage
+from django.http import Http404, JsonResponse
+
 from .export import TableExport
+from .jobs import ExportJob, file_response, get_default_runner
+from .streaming import StreamingTableExport
 
 
 class ExportMixin:
@@ -25,6 +30,17 @@ class ExportMixin:
         dataset_kwargs (dictionary): passed as `**kwargs` to `tablib.Dataset` constructor::
 
             dataset_kwargs = {"title": "My custom tab title"}
+        export_streaming (bool): if `True`, formats supported by `streaming_export_class`
+            (csv, tsv and jsonl by default) are streamed row by row using a
+            `~django.http.StreamingHttpResponse` instead of being built in memory.
+        export_gzip (bool): if `True`, streamed exports are compressed when the client
+            accepts gzip encoding.
+        streaming_export_class (StreamingTableExport): Allows using a custom implementation
+            of `StreamingTableExport`.
+        export_parallel (bool): if `True`, the values of the rows are rendered in parallel
+            worker processes, see `.parallel_as_values`.
+        export_executor (Executor): executor used for parallel exports, defaults to a
+            `~concurrent.futures.ProcessPoolExecutor`.
     """
 
     export_class = TableExport
@@ -32,6 +48,11 @@ class ExportMixin:
     export_trigger_param = "_export"
     exclude_columns = ()
     dataset_kwargs = None
+    export_streaming = False
+    export_gzip = False
+    streaming_export_class = StreamingTableExport
+    export_parallel = False
+    export_executor = None
 
     export_formats = (TableExport.CSV,)
 
@@ -41,19 +62,141 @@ class ExportMixin:
     def get_dataset_kwargs(self):
         return self.dataset_kwargs
 
+    def get_export_kwargs(self):
+        """Return keyword arguments passed to `export_class` and `streaming_export_class`."""
+        if not self.export_parallel:
+            return {}
+        return {"parallel": True, "executor": self.export_executor}
+
+    def use_streaming_export(self, export_format):
+        return self.export_streaming and self.streaming_export_class.is_valid_format(export_format)
+
+    def create_streaming_export(self, export_format):
+        exporter = self.streaming_export_class(
+            export_format=export_format,
+            table=self.get_table(**self.get_table_kwargs()),
+            exclude_columns=self.exclude_columns,
+            **self.get_export_kwargs(),
+        )
+        gzip = self.export_gzip and "gzip" in self.request.headers.get("Accept-Encoding", "")
+
+        return exporter.response(filename=self.get_export_filename(export_format), gzip=gzip)
+
     def create_export(self, export_format):
+        if self.use_streaming_export(export_format):
+            return self.create_streaming_export(export_format)
+
         exporter = self.export_class(
             export_format=export_format,
             table=self.get_table(**self.get_table_kwargs()),
             exclude_columns=self.exclude_columns,
             dataset_kwargs=self.get_dataset_kwargs(),
+            **self.get_export_kwargs(),
         )
 
         return exporter.response(filename=self.get_export_filename(export_format))
 
     def render_to_response(self, context, **kwargs):
         export_format = self.request.GET.get(self.export_trigger_param, None)
-        if self.export_class.is_valid_format(export_format):
+        if self.export_class.is_valid_format(export_format) or self.use_streaming_export(
+            export_format
+        ):
             return self.create_export(export_format)
 
         return super().render_to_response(context, **kwargs)
+
+
+class ExportJobMixin(ExportMixin):
+    """
+    Export the table data in the background using an `.ExportJob`, instead of during the request.
+
+    Requesting an export (``?_export=csv``) starts a job and returns a JSON response with
+    status code 202, describing the status of the job and containing the ``url`` to poll
+    for updates. Once the job is finished, that url responds with the exported file,
+    supporting ``Range`` requests to resume interrupted downloads. Adding ``_cancel=1``
+    to the url cancels the job.
+
+    In addition to the attributes of `ExportMixin`:
+
+    Attributes:
+        export_job_class (ExportJob): Allows using a custom implementation of `ExportJob`.
+        export_job_param (str): name of the GET attribute containing the id of the job.
+        export_cancel_param (str): name of the GET attribute to cancel a job.
+        export_storage (Storage): storage to save the exports to, defaults to ``default_storage``.
+        export_runner: object with a ``submit(job)`` method starting the job, defaults to
+            a `.ThreadPoolRunner`.
+    """
+
+    export_job_class = ExportJob
+    export_job_param = "_export_job"
+    export_cancel_param = "_cancel"
+    export_storage = None
+    export_runner = None
+
+    def get_export_runner(self):
+        return self.export_runner or get_default_runner()
+
+    def get_export_owner(self):
+        user = getattr(self.request, "user", None)
+        return user.pk if user is not None and user.is_authenticated else None
+
+    def create_export_job(self, export_format):
+        table_kwargs = self.get_table_kwargs()
+        table = self.get_table(**table_kwargs)
+        # the ordering of the table is taken from the request, not from the kwargs
+        table_kwargs.pop("order_by", None)
+        return self.export_job_class(
+            table=table,
+            export_format=export_format,
+            exclude_columns=self.exclude_columns,
+            dataset_kwargs=self.get_dataset_kwargs(),
+            filename=self.get_export_filename(export_format),
+            table_kwargs=table_kwargs,
+            storage=self.export_storage,
+            owner=self.get_export_owner(),
+        )
+
+    def create_export(self, export_format):
+        job = self.create_export_job(export_format)
+        self.get_export_runner().submit(job)
+        return self.export_job_response(job.status, status=202)
+
+    def export_job_response(self, job_status, **kwargs):
+        params = self.request.GET.copy()
+        params.pop(self.export_trigger_param, None)
+        params.pop(self.export_cancel_param, None)
+        params[self.export_job_param] = job_status.job_id
+
+        data = {
+            key: getattr(job_status, key)
+            for key in ("job_id", "state", "rows", "total", "progress", "filename", "error")
+        }
+        data["url"] = f"{self.request.path}?{params.urlencode()}"
+        return JsonResponse(data, **kwargs)
+
+    def get_export_job(self, job_id):
+        job_status = self.export_job_class.get_status(job_id)
+        if job_status is None or job_status.owner != self.get_export_owner():
+            raise Http404("Export job does not exist")
+
+        if self.request.GET.get(self.export_cancel_param) and not job_status.is_done:
+            self.export_job_class.cancel(job_id)
+            return self.export_job_response(job_status)
+
+        if job_status.state == job_status.FINISHED:
+            return file_response(
+                self.request,
+                self.export_storage or default_storage,
+                job_status.name,
+                filename=job_status.filename,
+                content_type=job_status.content_type,
+            )
+
+        return self.export_job_response(job_status)
+
+    def render_to_response(self, context, **kwargs):
+        job_id = self.request.GET.get(self.export_job_param, None)
+        if job_id:
+            return self.get_export_job(job_id)
+
+        return super().render_to_response(context, **kwargs)
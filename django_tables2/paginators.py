@@ -1,6 +1,60 @@
+import base64
+import binascii
+import datetime
+import json
+from math import ceil
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
+from .data import TableData, TableQuerysetData
+from .estimators import StatisticsEstimator
+from .rows import BoundRows
+from .utils import Accessor, OrderBy
+
+
+class CursorJSONEncoder(DjangoJSONEncoder):
+    """JSON encoder for cursors, keeping the microseconds of times (which `DjangoJSONEncoder` drops)."""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def _get_queryset(object_list):
+    """
+    Return the `~django.db.models.query.QuerySet` backing `object_list`, or `None`.
+
+    `object_list` is what `.Table.paginate` passes to the paginator: the `.BoundRows`
+    of a table, but paginators can also be used with a plain QuerySet.
+    """
+    data = object_list.data if isinstance(object_list, BoundRows) else object_list
+    if isinstance(data, TableData):
+        data = data.data
+    return data if isinstance(data, models.QuerySet) else None
+
+
+def _slicing_queries(object_list):
+    """Return True if slicing `object_list` fetches the records, like the deferred join strategy does."""
+    data = object_list.data if isinstance(object_list, BoundRows) else object_list
+    return isinstance(data, TableQuerysetData) and data._use_deferred_join()
+
+
+async def _aload(object_list):
+    """Return `object_list` with the records of a QuerySet fetched using async iteration."""
+    if isinstance(object_list, BoundRows):
+        return await object_list.aload()
+    if isinstance(object_list, models.QuerySet):
+        return [record async for record in object_list]
+    return object_list
+
 
 class LazyPaginator(Paginator):
     """
@@ -19,7 +73,9 @@ class LazyPaginator(Paginator):
     .. note::
 
         The number of records fetched for each page is `per_page * look_ahead + 1`, so increasing
-        the value for `look_ahead` makes the view a bit more expensive.
+        the value for `look_ahead` makes the view a bit more expensive. For QuerySets with
+        `look_ahead` larger than 1, only the current page is fetched as full rows, the rows
+        following it are counted using a second query fetching just their primary keys.
 
     So::
 
@@ -75,6 +131,25 @@ class LazyPaginator(Paginator):
         return number
 
     def page(self, number):
+        number, rows, probe = self._get_page_rows(number)
+        objects = list(rows)
+        objects_count = len(objects)
+        if probe is not None and objects_count == self.per_page + self.orphans:
+            objects_count += self.probe(*probe)
+        return self._get_lazy_page(objects, objects_count, number)
+
+    async def apage(self, number):
+        """Async version of `page`, fetching the records using async iteration."""
+        if _slicing_queries(self.object_list):
+            return await sync_to_async(self.page)(number)
+        number, rows, probe = self._get_page_rows(number)
+        objects = list(await _aload(rows))
+        objects_count = len(objects)
+        if probe is not None and objects_count == self.per_page + self.orphans:
+            objects_count += await self.aprobe(*probe)
+        return self._get_lazy_page(objects, objects_count, number)
+
+    def _get_page_rows(self, number):
         # Number might be None, because the total number of pages is not known in this paginator.
         # If an unknown page is requested, serve the first page.
         number = self.validate_number(number or 1)
@@ -82,8 +157,13 @@ class LazyPaginator(Paginator):
         top = bottom + self.per_page
         # Retrieve more objects to check if there is a next page.
         look_ahead_items = (self.look_ahead - 1) * self.per_page + 1
-        objects = list(self.object_list[bottom : top + self.orphans + look_ahead_items])
-        objects_count = len(objects)
+        queryset = self._get_probe_queryset() if look_ahead_items > 1 else None
+        if queryset is None:
+            return number, self.object_list[bottom : top + self.orphans + look_ahead_items], None
+        probe = (queryset, top + self.orphans, look_ahead_items)
+        return number, self.object_list[bottom : top + self.orphans], probe
+
+    def _get_lazy_page(self, objects, objects_count, number):
         if objects_count > (self.per_page + self.orphans):
             # If another page is found, increase the total number of pages.
             self._num_pages = number + (objects_count // self.per_page)
@@ -98,6 +178,27 @@ class LazyPaginator(Paginator):
             self._final_num_pages = number
         return Page(objects, number, self)
 
+    def _get_probe_queryset(self):
+        queryset = _get_queryset(self.object_list)
+        if queryset is None or queryset._fields is not None or queryset.query.combinator:
+            return None
+        return queryset
+
+    def probe(self, queryset, offset, limit):
+        """
+        Return the number of rows (up to `limit`) following the first `offset` rows of `queryset`.
+
+        Only the primary keys of these rows are fetched, so looking ahead multiple pages
+        doesn't require fetching the full rows.
+        """
+        return len(queryset.values_list("pk", flat=True)[offset : offset + limit])
+
+    async def aprobe(self, queryset, offset, limit):
+        """Async version of `probe`."""
+        return len(
+            [pk async for pk in queryset.values_list("pk", flat=True)[offset : offset + limit]]
+        )
+
     def is_last_page(self, number):
         return number == self._final_num_pages
 
@@ -115,3 +216,432 @@ class LazyPaginator(Paginator):
         raise NotImplementedError
 
     page_range = property(_get_page_range)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator using an estimate of the number of rows instead of an exact count for large QuerySets.
+
+    For very large tables, the exact count is expensive, while `.LazyPaginator` doesn't
+    know the total number of pages at all. This paginator asks an *estimator* for the
+    number of rows first. If the estimate is below `exact_threshold`, counting the rows
+    is cheap enough and the exact count is used. Otherwise, the estimate is used for
+    `count` and `num_pages`, and `is_estimated` is `True`, which the pagination templates
+    use to render the number of results as approximate.
+
+    An estimator is a callable accepting a QuerySet and returning the estimated number
+    of rows, or `None` if it can not estimate (in which case the rows are counted).
+    The estimators in `django_tables2.estimators` are:
+
+     - `~.estimators.StatisticsEstimator` (default), using the statistics of the
+       database (PostgreSQL planner estimates or SQLite's ``sqlite_stat1``).
+     - `~.estimators.SampledEstimator`, counting on a sample of the table.
+
+    Usage with `~.SingleTableView`::
+
+        class LogListView(SingleTableView):
+            table_class = LogTable
+            paginator_class = EstimatedCountPaginator
+            table_pagination = {"exact_threshold": 50000}
+
+    Because an estimate might be smaller than the real number of rows, pages after the
+    estimated last page can be requested as long as they contain rows.
+
+    Arguments:
+        estimator (callable): estimator to use.
+        exact_threshold (int): count the rows if the estimate is below this number.
+    """
+
+    exact_threshold = 10000
+
+    def __init__(self, object_list, per_page, estimator=None, exact_threshold=None, **kwargs):
+        self.estimator = estimator or StatisticsEstimator()
+        if exact_threshold is not None:
+            self.exact_threshold = exact_threshold
+        self._num_pages = None
+        self._final_num_pages = None
+        super().__init__(object_list, per_page, **kwargs)
+
+    @cached_property
+    def estimate(self):
+        """Return the estimated number of rows, or `None` if the rows should be counted."""
+        queryset = _get_queryset(self.object_list)
+        estimate = self.estimator(queryset) if queryset is not None else None
+        if estimate is None or estimate < self.exact_threshold:
+            return None
+        return estimate
+
+    @property
+    def is_estimated(self):
+        """Return `True` if `count` is an estimate."""
+        return self.estimate is not None
+
+    @cached_property
+    def count(self):
+        if self.is_estimated:
+            return self.estimate
+        return super().count
+
+    @property
+    def num_pages(self):
+        if self._num_pages is not None:
+            return self._num_pages
+        return super().num_pages
+
+    def validate_number(self, number):
+        if not self.is_estimated:
+            return super().validate_number(number)
+
+        # Don't check the upper bound, the actual number of pages might be larger than estimated.
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        if not self.is_estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        # Retrieve one more object to check if there is a next page.
+        objects = list(self.object_list[bottom : top + 1])
+        if not objects and number != 1:
+            # The estimate was too large, the rows are counted to find the real last page.
+            count = len(self.object_list)
+            self._num_pages = self._final_num_pages = max(1, ceil(count / self.per_page))
+            raise EmptyPage(_("That page contains no results"))
+
+        if len(objects) > self.per_page:
+            self._num_pages = max(super().num_pages, number + 1)
+        else:
+            # This is the last page, the number of pages is no longer an estimate.
+            self._num_pages = self._final_num_pages = number
+        return self._get_page(objects[: self.per_page], number, self)
+
+    def is_last_page(self, number):
+        return not self.is_estimated or number == self._final_num_pages
+
+
+class KeysetPage(Page):
+    """
+    A page of a `.KeysetPaginator`.
+
+    `next_page_number()` and `previous_page_number()` return opaque cursors rather
+    than page numbers, so the pagination templates render cursor links without changes.
+    """
+
+    def __init__(self, object_list, number, paginator, next_cursor=None, previous_cursor=None):
+        super().__init__(object_list, number, paginator)
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def next_page_number(self):
+        if not self.has_next():
+            raise EmptyPage(_("That page contains no results"))
+        return self.next_cursor
+
+    def previous_page_number(self):
+        if not self.has_previous():
+            raise EmptyPage(_("That page number is less than 1"))
+        return self.previous_cursor
+
+    def start_index(self):
+        if len(self) == 0:
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self):
+        return self.start_index() + len(self) - 1 if len(self) else 0
+
+
+class KeysetPaginator(Paginator):
+    """
+    Paginate a QuerySet using keyset (or *seek*) pagination instead of ``OFFSET``.
+
+    Rather than skipping ``(page - 1) * per_page`` rows, every page is fetched with
+    a ``WHERE`` clause selecting the rows after (or before) the last row of the
+    previous page, which keeps deep pages as fast as the first one on large tables.
+
+    The table's current ordering is used for the seek predicate. As that ordering
+    is applied to the QuerySet through `.BoundColumn.order_by`, it is read from the
+    QuerySet (falling back to the model's ``Meta.ordering``). The primary key is
+    added as a tie-breaker if it's not part of the ordering already. Both ascending
+    and descending (also mixed) orderings are supported. Orderings which can't be used
+    to seek, because they contain expressions or nullable fields (or a row has a
+    ``NULL`` value in an ordered field), are paginated using ``OFFSET`` instead.
+
+    Instead of page numbers, pages are identified by opaque cursors, which are used
+    in the ``page`` query string field by `.RequestConfig`. A cursor contains the
+    ordering it was created for, a cursor for another ordering (for example after
+    ordering the table by another column) or with values which are not valid for
+    the ordered fields raises `~django.core.paginator.PageNotAnInteger`, for which
+    `.RequestConfig` shows the first page. Because the cursor contains the number
+    of the page, ``page.number`` and ``paginator.num_pages``
+    behave like they do with `.LazyPaginator`: the total number of pages is not known.
+
+    Usage with `~.SingleTableView`::
+
+        class UserListView(SingleTableView):
+            table_class = UserTable
+            table_data = User.objects.all()
+            paginator_class = KeysetPaginator
+
+    Or with `~.RequestConfig`::
+
+        RequestConfig(paginate={"paginator_class": KeysetPaginator}).configure(table)
+
+    .. note::
+
+        ``orphans`` is not supported, and the page range is not rendered in the
+        pagination templates, just the *previous* and *next* links.
+    """
+
+    #: Tells `.RequestConfig` to pass the raw value of the page query string field.
+    cursor_based = True
+
+    NEXT = "n"
+    PREVIOUS = "p"
+    OFFSET = "o"
+
+    def __init__(self, object_list, per_page, **kwargs):
+        self._num_pages = None
+        super().__init__(object_list, per_page, **kwargs)
+
+    def _check_object_list_is_ordered(self):
+        # The pk tie-breaker added in get_ordering() always makes the ordering deterministic.
+        pass
+
+    def get_raw_ordering(self, queryset):
+        """Return the ordering of `queryset`, falling back to the model's ``Meta.ordering``."""
+        ordering = queryset.query.order_by
+        if not ordering and queryset.query.default_ordering:
+            ordering = queryset.model._meta.ordering
+        return list(ordering)
+
+    def get_ordering(self, queryset):
+        """
+        Return the list of `.OrderBy` keys used to seek, ending with the primary key.
+
+        Returns `None` if the ordering can't be used to seek: if it contains expressions
+        or ordered fields which can be ``NULL`` (including nullable relations).
+        """
+        keys = []
+        for item in self.get_raw_ordering(queryset):
+            if not isinstance(item, str) or item.startswith("?"):
+                return None
+            key = OrderBy(item)
+            if self.is_nullable(queryset.model, key.bare.for_queryset()):
+                return None
+            keys.append(key)
+
+        pk = queryset.model._meta.pk
+        if not any(key.bare in ("pk", pk.name, pk.attname) for key in keys):
+            keys.append(OrderBy("pk"))
+        return keys
+
+    @staticmethod
+    def is_nullable(model, lookup):
+        """Return True if the field `lookup` of `model` can be ``NULL`` (or is not a field)."""
+        for name in lookup.split("__"):
+            if model is None:
+                return True
+            try:
+                field = model._meta.pk if name == "pk" else model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return True
+            if field.null or (field.is_relation and not field.concrete):
+                return True
+            model = field.related_model
+        return False
+
+    def encode_cursor(self, number, direction, ordering, values):
+        payload = json.dumps([number, direction, ordering, values], cls=CursorJSONEncoder)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            number, direction, ordering, values = json.loads(payload)
+            if not (
+                isinstance(number, int)
+                and number >= 1
+                and direction in (self.NEXT, self.PREVIOUS, self.OFFSET)
+                and isinstance(ordering, list)
+                and isinstance(values, list)
+            ):
+                raise ValueError
+        except (binascii.Error, TypeError, ValueError):
+            raise PageNotAnInteger(_("That page cursor is not valid"))
+        return number, direction, ordering, values
+
+    def get_values(self, record, keys):
+        values = []
+        for key in keys:
+            value = Accessor(key.bare.for_queryset()).resolve(record)
+            if isinstance(value, models.Model):
+                value = value.pk
+            values.append(value)
+        return values
+
+    def get_cursor(self, number, direction, ordering, keys, record):
+        """Return the cursor for page `number`, seeking from `record` if possible."""
+        values = None if keys is None else self.get_values(record, keys)
+        if values is None or None in values:
+            return self.encode_cursor(number, self.OFFSET, ordering, [])
+        return self.encode_cursor(number, direction, ordering, values)
+
+    def seek_filter(self, keys, values, reverse):
+        """
+        Return a `~django.db.models.Q` selecting the rows after the ones identified by `values`.
+
+        For ordering ``(a, -b, pk)`` this is ``a > x OR (a = x AND b < y) OR (a = x AND b = y AND pk > z)``,
+        with all comparisons flipped if `reverse` is `True`.
+        """
+        if len(values) != len(keys) or None in values:
+            raise PageNotAnInteger(_("That page cursor is not valid"))
+
+        seek, equal = Q(), {}
+        for key, value in zip(keys, values):
+            field = key.bare.for_queryset()
+            lookup = "lt" if key.is_descending != reverse else "gt"
+            seek |= Q(**equal, **{f"{field}__{lookup}": value})
+            equal[field] = value
+        return seek
+
+    def seek_page(self, queryset, keys, number, direction, values):
+        """Return the records, page number and whether there are next/previous pages, seeking from `values`."""
+        reverse = direction == self.PREVIOUS
+        queryset = queryset.order_by(
+            *((key.opposite if reverse else key).for_queryset() for key in keys)
+        )
+        if values is not None:
+            try:
+                queryset = queryset.filter(self.seek_filter(keys, values, reverse))
+            except (TypeError, ValueError, ValidationError):
+                raise PageNotAnInteger(_("That page cursor is not valid"))
+
+        records = list(queryset[: self.per_page + 1])
+        has_more = len(records) > self.per_page
+        records = records[: self.per_page]
+        if reverse:
+            records.reverse()
+
+        if not records and values is not None:
+            raise EmptyPage(_("That page contains no results"))
+
+        if reverse:
+            has_next, has_previous = True, has_more
+            if not has_previous:
+                number = 1
+        else:
+            has_next, has_previous = has_more, values is not None
+            number = max(number, 2) if has_previous else 1
+        return records, number, has_next, has_previous
+
+    def offset_page(self, queryset, keys, number):
+        """Return the records, page number and whether there are next/previous pages, using ``OFFSET``."""
+        if keys is None:
+            queryset = queryset.order_by(*self.get_raw_ordering(queryset), "pk")
+        else:
+            queryset = queryset.order_by(*(key.for_queryset() for key in keys))
+
+        offset = (number - 1) * self.per_page
+        records = list(queryset[offset : offset + self.per_page + 1])
+        has_more = len(records) > self.per_page
+        records = records[: self.per_page]
+        if not records and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+        return records, number, has_more, number > 1
+
+    def page(self, number):
+        queryset = _get_queryset(self.object_list)
+        if queryset is None:
+            raise TypeError(f"{type(self).__name__} can only paginate QuerySet data")
+
+        # Anything but a cursor (like the default page=1) results in the first page.
+        if isinstance(number, str) and number not in ("", "1"):
+            number, direction, cursor_ordering, values = self.decode_cursor(number)
+        else:
+            number, direction, cursor_ordering, values = 1, self.NEXT, None, None
+
+        ordering = [str(item) for item in self.get_raw_ordering(queryset)]
+        if cursor_ordering is not None and cursor_ordering != ordering:
+            # the cursor was created for another ordering
+            raise PageNotAnInteger(_("That page cursor is not valid"))
+
+        keys = self.get_ordering(queryset)
+        if direction == self.OFFSET or (keys is None and values is None):
+            records, number, has_next, has_previous = self.offset_page(queryset, keys, number)
+        elif keys is None:
+            raise PageNotAnInteger(_("That page cursor is not valid"))
+        else:
+            records, number, has_next, has_previous = self.seek_page(
+                queryset, keys, number, direction, values
+            )
+
+        next_cursor = previous_cursor = None
+        if has_next and records:
+            next_cursor = self.get_cursor(number + 1, self.NEXT, ordering, keys, records[-1])
+        if has_previous and records:
+            previous_cursor = self.get_cursor(number - 1, self.PREVIOUS, ordering, keys, records[0])
+        self._num_pages = number + 1 if next_cursor else number
+
+        if isinstance(self.object_list, BoundRows):
+            records = BoundRows(
+                data=records, table=self.object_list.table, pinned_data=self.object_list.pinned_data
+            )
+        return KeysetPage(records, number, self, next_cursor, previous_cursor)
+
+    def _get_count(self):
+        raise NotImplementedError
+
+    count = property(_get_count)
+
+    def _get_num_pages(self):
+        return self._num_pages
+
+    num_pages = property(_get_num_pages)
+
+    def _get_page_range(self):
+        raise NotImplementedError
+
+    page_range = property(_get_page_range)
+
+
+async def apage(paginator, number):
+    """
+    Return page `number` of `paginator`, like ``paginator.page(number)``, for use in async code.
+
+    If the paginator has an ``apage()`` method (like `.LazyPaginator`), it is used.
+    For Django's `~django.core.paginator.Paginator`, the rows are counted using
+    ``acount()`` and the records for the page are fetched using async iteration.
+    Other paginators are called in a thread using ``sync_to_async``, after which the
+    records of the page are fetched like they are for `~django.core.paginator.Paginator`.
+    """
+    if hasattr(paginator, "apage"):
+        return await paginator.apage(number)
+
+    object_list = paginator.object_list
+    if type(paginator).count is not Paginator.count or _slicing_queries(object_list):
+        page = await sync_to_async(paginator.page)(number)
+    else:
+        if "count" not in vars(paginator) and hasattr(object_list, "acount"):
+            # Paginator.count is a cached property, so it's used by page() and num_pages.
+            paginator.count = await object_list.acount()
+        page = paginator.page(number)
+
+    page.object_list = await _aload(page.object_list)
+    return page
@@ -0,0 +1,187 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.dispatch import Signal
+
+from .utils import call_with_appropriate
+
+#: Sent after a profiled table is rendered, with the arguments ``table`` and ``profile``
+#: (a `.TableProfile`). The sender is the class of the table.
+table_profiled = Signal()
+
+_active_profiles = ContextVar("django_tables2_profiles", default=None)
+
+
+class Timing:
+    """Total wall time (in seconds) and number of calls of a measured part."""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+
+    def add(self, seconds):
+        self.seconds += seconds
+        self.calls += 1
+
+    def as_dict(self):
+        return {"seconds": self.seconds, "calls": self.calls}
+
+
+class TableProfile:
+    """
+    Wall time and number of calls of the phases of building and rendering a table.
+
+    The phases are:
+
+    - ``construction``: ``Table.__init__``, including the ordering and configuration
+      done by it.
+    - ``ordering``: ordering the data.
+    - ``count``: counting the records of QuerySet data.
+    - ``fetch``: fetching the records of the rows to render.
+    - ``render``: rendering the template, including the cells.
+
+    For each column, the time spent rendering its cells is split in:
+
+    - ``accessor``: resolving the value of the cell using the accessor of the column.
+    - ``render``: calling the ``render`` method of the column (or ``render_FOO`` of the table).
+    - ``linkify``: wrapping the rendered value in a link.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.phases = {}
+        self.columns = {}
+
+    @classmethod
+    def for_table(cls, table):
+        """
+        Return a new profile for `table` if profiling is enabled, `None` otherwise.
+
+        Profiling is enabled using the ``DJANGO_TABLES2_PROFILING`` setting or
+        inside a `.profile_tables` block.
+        """
+        profiles = _active_profiles.get()
+        if profiles is None and not getattr(settings, "DJANGO_TABLES2_PROFILING", False):
+            return None
+
+        profile = cls(table)
+        if profiles is not None:
+            profiles.append(profile)
+        return profile
+
+    def add(self, phase, seconds):
+        self.phases.setdefault(phase, Timing()).add(seconds)
+
+    def add_column(self, name, part, seconds):
+        self.columns.setdefault(name, {}).setdefault(part, Timing()).add(seconds)
+
+    @contextmanager
+    def phase(self, phase):
+        """Add the time spent in the block to `phase`."""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - start)
+
+    def get_cell(self, row, bound_column):
+        """Render the cell of `bound_column` for `row` like `.BoundRow.get_cell`, timing its parts."""
+        render_seconds = 0.0
+
+        def render_func(bound_column, value=None):
+            nonlocal render_seconds
+            kwargs = row._optional_cell_arguments(bound_column, value)
+            start = perf_counter()
+            content = call_with_appropriate(bound_column.render, kwargs)
+            rendered = perf_counter()
+            self.add_column(bound_column.name, "render", rendered - start)
+            if bound_column.link:
+                content = bound_column.link(content, **kwargs)
+                self.add_column(bound_column.name, "linkify", perf_counter() - rendered)
+            render_seconds = perf_counter() - start
+            return content
+
+        start = perf_counter()
+        content = row._get_and_render_with(
+            bound_column, render_func=render_func, default=bound_column.default
+        )
+        self.add_column(bound_column.name, "accessor", perf_counter() - start - render_seconds)
+        return content
+
+    def as_dict(self):
+        """Return the timings as a dictionary, which can be serialized to JSON."""
+        return {
+            "table": type(self.table).__name__,
+            "phases": {phase: timing.as_dict() for phase, timing in self.phases.items()},
+            "columns": {
+                name: {part: timing.as_dict() for part, timing in parts.items()}
+                for name, parts in self.columns.items()
+            },
+        }
+
+    def report(self):
+        """Return the timings as text, with a line for each phase and each part of a column."""
+        lines = [f"{type(self.table).__name__}:"]
+        for phase, timing in self.phases.items():
+            lines.append(f"  {phase}: {timing.seconds * 1000:.3f} ms ({timing.calls} calls)")
+        for name, parts in self.columns.items():
+            for part, timing in parts.items():
+                lines.append(
+                    f"  {name}.{part}: {timing.seconds * 1000:.3f} ms ({timing.calls} calls)"
+                )
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+@contextmanager
+def profile_tables():
+    """
+    Profile the tables created inside the block, yielding the list their `.TableProfile` are added to.
+
+    Example::
+
+        with profile_tables() as profiles:
+            table = PersonTable(Person.objects.all())
+            table.as_html(request)
+
+        for profile in profiles:
+            print(profile.report())
+    """
+    profiles = []
+    token = _active_profiles.set(profiles)
+    try:
+        yield profiles
+    finally:
+        _active_profiles.reset(token)
+
+
+def profile_phase(table, phase):
+    """Return a context manager adding the time spent in it to `phase` if `table` is profiled."""
+    profile = getattr(table, "_profile", None)
+    return nullcontext() if profile is None else profile.phase(phase)
+
+
+@contextmanager
+def profile_render(table):
+    """
+    Time rendering `table` if it is profiled and send `table_profiled` afterwards.
+
+    The records of the rows to render are fetched before rendering, so the time
+    spent querying the database is measured separately.
+    """
+    profile = getattr(table, "_profile", None)
+    if profile is None:
+        yield
+        return
+
+    load = getattr(table.paginated_rows, "load", None)
+    if load is not None:
+        with profile.phase("fetch"):
+            load()
+    with profile.phase("render"):
+        yield
+    table_profiled.send(sender=type(table), table=table, profile=profile)
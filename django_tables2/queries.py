@@ -0,0 +1,153 @@
+import warnings
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import connections
+
+from .utils import Accessor
+
+
+class NPlusOneWarning(UserWarning):
+    """Warning issued by `.QueryDetector` for columns querying the database for each row."""
+
+
+class NPlusOneError(Exception):
+    """Raised by `.QueryDetector` for columns querying the database for each row."""
+
+
+def suggest_lookup(model, accessor):
+    """
+    Return a suggestion to fetch the relations followed by `accessor` together with the records of `model`.
+
+    Returns `None` if `accessor` doesn't follow a relation of `model`.
+    """
+    if model is None:
+        return None
+
+    lookup, prefetch = [], False
+    for bit in Accessor(accessor).bits:
+        try:
+            field = model._meta.get_field(bit)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        lookup.append(bit)
+        prefetch = prefetch or field.many_to_many or field.one_to_many
+        model = field.related_model
+
+    if not lookup:
+        return None
+    method = "prefetch_related" if prefetch else "select_related"
+    return f"{method}({'__'.join(lookup)!r})"
+
+
+class QueryDetector:
+    """
+    Detect columns of a table which query the database while rendering the cell of each row (N+1 queries).
+
+    The queries executed while rendering a cell are attributed to its column using
+    ``connection.execute_wrapper()``. After the table is rendered (or exported), the
+    detector warns (or raises) for each column which queried the database for more
+    than `threshold` of the rows, naming the SQL of one of the queries and, if the
+    accessor of the column follows a relation, a ``select_related()`` or
+    ``prefetch_related()`` lookup to fetch the related records with the rows.
+
+    Detection is enabled with the ``DJANGO_TABLES2_QUERY_DETECTION`` setting, which
+    is either ``"warn"`` or ``"raise"``, and only if ``DEBUG`` is `True`.
+
+    Arguments:
+        table (`~.Table`): the table to detect the queries for.
+        action (str): ``"warn"`` to issue a `.NPlusOneWarning`, ``"raise"`` to raise
+            `.NPlusOneError`.
+        threshold (float): the share of the rows which may query the database.
+    """
+
+    ACTIONS = ("warn", "raise")
+
+    #: minimum number of rows querying the database for a column to be reported.
+    min_rows = 2
+
+    def __init__(self, table, action="warn", threshold=0.5):
+        if action not in self.ACTIONS:
+            raise ImproperlyConfigured(
+                f"Query detection action must be one of {self.ACTIONS}, not {action!r}"
+            )
+        self.table = table
+        self.action = action
+        self.threshold = threshold
+        self.reset()
+
+    @classmethod
+    def for_table(cls, table):
+        """Return a detector for `table` if query detection is enabled, `None` otherwise."""
+        action = getattr(settings, "DJANGO_TABLES2_QUERY_DETECTION", None)
+        if action is None or not settings.DEBUG:
+            return None
+        threshold = getattr(settings, "DJANGO_TABLES2_QUERY_DETECTION_THRESHOLD", 0.5)
+        return cls(table, action=action, threshold=threshold)
+
+    def reset(self):
+        self.rows = {}
+        self.queries = {}
+
+    @contextmanager
+    def watch(self, bound_column):
+        """Attribute the queries executed in the block to `bound_column`."""
+        executed = []
+
+        def wrapper(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(wrapper))
+            yield
+
+        name = bound_column.name
+        self.rows[name] = self.rows.get(name, 0) + 1
+        if executed:
+            rows, _, _ = self.queries.get(name, (0, None, None))
+            self.queries[name] = (rows + 1, executed[0], bound_column.accessor)
+
+    def get_messages(self):
+        """Return a message for each column querying the database for too many rows."""
+        messages = []
+        for name, (rows, sql, accessor) in self.queries.items():
+            total = self.rows[name]
+            if rows < self.min_rows or rows <= self.threshold * total:
+                continue
+
+            lookup = suggest_lookup(getattr(self.table.data, "model", None), accessor)
+            if lookup is None:
+                suggestion = (
+                    "Use select_related() or prefetch_related() on the table data to fetch "
+                    "the records used to render it together with the rows."
+                )
+            else:
+                suggestion = f"Use {lookup} on the table data to fetch them together with the rows."
+            messages.append(
+                f"Column {name!r} of {type(self.table).__name__} queried the database for "
+                f"{rows} of {total} rows, for example: {sql}. {suggestion}"
+            )
+        return messages
+
+    def check(self):
+        """Warn or raise for the columns querying the database for too many rows since the last check."""
+        messages = self.get_messages()
+        self.reset()
+        for message in messages:
+            if self.action == "raise":
+                raise NPlusOneError(message)
+            warnings.warn(message, NPlusOneWarning)
+
+
+@contextmanager
+def detect_queries(table):
+    """Check the queries attributed to the columns of `table` after the block, if detection is enabled."""
+    yield
+    detector = getattr(table, "_query_detector", None)
+    if detector is not None:
+        detector.check()
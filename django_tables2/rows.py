@@ -3,12 +3,15 @@ from django.db import models
 
 from .columns.linkcolumn import BaseLinkColumn
 from .columns.manytomanycolumn import ManyToManyColumn
+from .data import TableData
 from .utils import A, AttributeDict, call_with_appropriate, computed_values
 
 
 class CellAccessor:
     """Access cell contents on a row object (see `BoundRow`)."""
 
+    __slots__ = ("row",)
+
     def __init__(self, row):
         self.row = row
 
@@ -75,18 +78,27 @@ class BoundRow:
         record: a single record from the :term:`table data` that is used to
             populate the row. A record could be a `~django.db.Model` object, a
             `dict`, or something else.
+        row_counter (int): the number of the row, defaults to the next value of
+            the table's counter.
 
     """
 
-    def __init__(self, record, table):
+    __slots__ = ("_record", "_table", "row_counter", "cells")
+
+    def __init__(self, record, table, row_counter=None):
         self._record = record
         self._table = table
 
-        self.row_counter = next(table._counter)
+        self.row_counter = next(table._counter) if row_counter is None else row_counter
 
         # support accessing cells from a template: {{ row.cells.column_name }}
         self.cells = CellAccessor(self)
 
+    def _bind(self, record, row_counter):
+        """Point the row to another record, to reuse it while iterating (see `.BoundRows.iterator`)."""
+        self._record = record
+        self.row_counter = row_counter
+
     @property
     def table(self):
         """The `.Table` this row is part of."""
@@ -106,6 +118,15 @@ class BoundRow:
         """Return the attributes for a certain row."""
         cssClass = self.get_even_odd_css_class()
 
+        # fast path for attributes without callables, the other attributes are rendered once.
+        static_attrs = self._table.row_attrs
+        parts = static_attrs._static_parts() if isinstance(static_attrs, AttributeDict) else None
+        if parts is not None:
+            static_class = parts[1]
+            return static_attrs.with_class(
+                f"{static_class} {cssClass}" if static_class else cssClass
+            )
+
         row_attrs = computed_values(
             self._table.row_attrs, kwargs=dict(table=self._table, record=self._record)
         )
@@ -135,6 +156,14 @@ class BoundRow:
             yield value
 
     def _get_and_render_with(self, bound_column, render_func, default):
+        detector = self._table._query_detector
+        if detector is not None:
+            with detector.watch(bound_column):
+                return self._resolve_and_render(bound_column, render_func, default)
+
+        return self._resolve_and_render(bound_column, render_func, default)
+
+    def _resolve_and_render(self, bound_column, render_func, default):
         value = None
         accessor = A(bound_column.accessor)
         column = bound_column.column
@@ -184,6 +213,8 @@ class BoundRow:
     def get_cell(self, name):
         """Return the final rendered html for a cell in the row, given the name of a column."""
         bound_column = self.table.columns[name]
+        if self._table._profile is not None:
+            return self._table._profile.get_cell(self, bound_column)
 
         return self._get_and_render_with(
             bound_column, render_func=self._call_render, default=bound_column.default
@@ -231,6 +262,8 @@ class BoundRow:
 class BoundPinnedRow(BoundRow):
     """A *pinned* row in a table."""
 
+    __slots__ = ()
+
     @property
     def attrs(self):
         """
@@ -241,9 +274,17 @@ class BoundPinnedRow(BoundRow):
         Return:
             AttributeDict: Attributes for pinned rows.
         """
+        static_attrs = self._table.pinned_row_attrs
+        parts = static_attrs._static_parts() if isinstance(static_attrs, AttributeDict) else None
+        if parts is not None:
+            static_class = parts[1]
+            return static_attrs.with_class(
+                " ".join([self.get_even_odd_css_class(), "pinned-row", static_class or ""])
+            )
+
         row_attrs = computed_values(self._table.pinned_row_attrs, kwargs={"record": self._record})
         css_class = " ".join(
-            [self.get_even_odd_css_class(), "pinned-row", row_attrs.get("class", "")]
+            [self.get_even_odd_css_class(), "pinned-row", row_attrs.get("class") or ""]
         )
         row_attrs["class"] = css_class
         return AttributeDict(row_attrs)
@@ -291,23 +332,87 @@ class BoundRows:
                 yield BoundPinnedRow(pinned_record, table=self.table)
 
     def __iter__(self):
+        return self._iter_records(self.data)
+
+    def iterator(self, chunk_size=None, reuse_row=False):
+        """
+        Iterate over the rows like `iter()`, without keeping all records in memory.
+
+        Uses `.TableData.iterator` to fetch QuerySet records in chunks of `chunk_size`.
+        Pinned rows are included like they are when iterating normally.
+
+        If `reuse_row` is `True`, a single `.BoundRow` is pointed at each record in
+        turn, rather than creating a row for every record. Only use this if the rows
+        are not kept after moving on to the next row, like when exporting.
+        """
+        data = self.data
+        if isinstance(data, TableData):
+            data = data.iterator(chunk_size=chunk_size)
+        return self._iter_records(data, reuse_row=reuse_row)
+
+    def _iter_records(self, records, reuse_row=False):
         # Top pinned rows
         yield from self.generator_pinned_row(self.pinned_data.get("top"))
 
-        for record in self.data:
-            yield BoundRow(record, table=self.table)
+        table = self.table
+        counter = table._counter
+        if reuse_row:
+            row = None
+            for record in records:
+                if row is None:
+                    row = BoundRow(record, table=table, row_counter=next(counter))
+                else:
+                    row._bind(record, next(counter))
+                yield row
+        else:
+            for record in records:
+                yield BoundRow(record, table=table, row_counter=next(counter))
 
         # Bottom pinned rows
         yield from self.generator_pinned_row(self.pinned_data.get("bottom"))
 
     def __len__(self):
-        length = len(self.data)
+        return len(self.data) + self._pinned_length()
+
+    def _pinned_length(self):
         pinned_top = self.pinned_data.get("top")
         pinned_bottom = self.pinned_data.get("bottom")
-        length += 0 if pinned_top is None else len(pinned_top)
+        length = 0 if pinned_top is None else len(pinned_top)
         length += 0 if pinned_bottom is None else len(pinned_bottom)
         return length
 
+    async def acount(self):
+        """Return the number of rows like `len()`, using `.TableData.acount` to count the records."""
+        if isinstance(self.data, TableData):
+            length = await self.data.acount()
+        else:
+            length = len(self.data)
+        return length + self._pinned_length()
+
+    def load(self):
+        """
+        Fetch the records of QuerySet data (like the slice for a page) at once.
+
+        Iterating the rows afterwards, for example while rendering the table, doesn't
+        query the database for the records anymore.
+        """
+        if isinstance(self.data, models.QuerySet):
+            self.data = list(self.data)
+        elif isinstance(self.data, TableData) and isinstance(self.data.data, models.QuerySet):
+            # evaluate the QuerySet, filling its result cache
+            len(self.data.data)
+        return self
+
+    async def aload(self):
+        """Async version of `load`, fetching the records using async iteration."""
+        if isinstance(self.data, models.QuerySet):
+            self.data = [record async for record in self.data]
+        elif isinstance(self.data, TableData) and isinstance(self.data.data, models.QuerySet):
+            # async iteration fills the result cache of the QuerySet
+            async for _record in self.data.data:
+                pass
+        return self
+
     def __getitem__(self, key):
         """Return a new `~.BoundRows` instance for a slice, a single `~.BoundRow` instance for an index."""
         if isinstance(key, slice):
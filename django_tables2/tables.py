@@ -1,18 +1,33 @@
 import copy
 from collections import OrderedDict
+from functools import lru_cache
 from itertools import count
+from time import perf_counter
 
 from django.conf import settings
 from django.core.paginator import Paginator
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.template.context import make_context
 from django.template.loader import get_template
 from django.utils.encoding import force_str
+from django.utils.safestring import mark_safe
 
 from .columns import BoundColumns, Column, library
 from .config import RequestConfig
-from .data import TableData
-from .rows import BoundRows
-from .utils import Accessor, AttributeDict, OrderBy, OrderByTuple, Sequence
+from .data import TableData, TableQuerysetData
+from .paginators import apage
+from .profiling import TableProfile, profile_phase, profile_render
+from .queries import QueryDetector, detect_queries
+from .rows import BoundRow, BoundRows
+from .utils import (
+    Accessor,
+    AttributeDict,
+    OrderBy,
+    OrderByTuple,
+    Sequence,
+    get_template_block,
+)
 
 
 class DeclarativeColumnsMetaclass(type):
@@ -114,6 +129,8 @@ class TableOptions:
         options (`.Table.Meta`): options for a table from `.Table.Meta`
     """
 
+    PAGINATION_STRATEGIES = ("offset", "deferred_join")
+
     def __init__(self, options, class_name):
         super().__init__()
         self._check_types(options, class_name)
@@ -142,6 +159,13 @@ class TableOptions:
         self.order_by_field = getattr(options, "order_by_field", "sort")
         self.page_field = getattr(options, "page_field", "page")
         self.per_page = getattr(options, "per_page", 25)
+        self.count_cache = getattr(options, "count_cache", None)
+        self.pagination_strategy = getattr(options, "pagination_strategy", "offset")
+        if self.pagination_strategy not in self.PAGINATION_STRATEGIES:
+            allowed = ", ".join(self.PAGINATION_STRATEGIES)
+            raise ValueError(
+                f"{class_name}.pagination_strategy = {self.pagination_strategy!r}, but must be one of ({allowed})"
+            )
         self.per_page_field = getattr(options, "per_page_field", "per_page")
         self.prefix = getattr(options, "prefix", "")
         self.show_header = getattr(options, "show_header", True)
@@ -163,7 +187,14 @@ class TableOptions:
             (int,): ["per_page"],
             (tuple, list, set): ["fields", "sequence", "exclude", "localize", "unlocalize"],
             (tuple, list, set, dict): ["linkify"],
-            str: ["template_name", "prefix", "order_by_field", "page_field", "per_page_field"],
+            str: [
+                "template_name",
+                "prefix",
+                "order_by_field",
+                "page_field",
+                "per_page_field",
+                "pagination_strategy",
+            ],
             (dict,): ["attrs", "row_attrs", "pinned_row_attrs"],
             (tuple, list, str): ["order_by"],
             (type(models.Model),): ["model"],
@@ -279,8 +310,13 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
         if data is None:
             raise TypeError(f"Argument data to {type(self).__name__} is required")
 
+        self._profile = TableProfile.for_table(self)
+        self._query_detector = QueryDetector.for_table(self)
+        start = perf_counter()
+
         self.exclude = exclude or self._meta.exclude
         self.sequence = sequence
+        self.extra_columns = extra_columns
         self.data = TableData.from_data(data=data)
         self.data.set_table(self)
 
@@ -367,6 +403,9 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
 
         self._counter = count()
 
+        if self._profile is not None:
+            self._profile.add("construction", perf_counter() - start)
+
     def get_top_pinned_data(self):
         """
         Return data for top pinned rows containing data for each row.
@@ -449,14 +488,49 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
         context = {"table": self, "request": request}
 
         self.before_render(request)
-        return template.render(context)
+        with profile_render(self), detect_queries(self):
+            return template.render(context)
+
+    def as_fragment(self, request, template_name="django_tables2/fragment.html"):
+        """
+        Render only the rows of the current page and a link to the next page, adding `request` to the context.
+
+        The rows are rendered using the ``table.tbody.row`` block of the table's
+        template (see `.template_name`), the header and footer are not rendered.
+        This is useful to load more rows into an existing table, for example for
+        infinite scrolling or using HTMX.
+
+        Arguments:
+            request: the request to render the rows for.
+            template_name (str): template rendering the rows (available as `rows`
+                in its context) and the link to the next page.
+        """
+        self._counter = count()
+        template = get_template(self.template_name).template
+        context = make_context({"table": self, "request": request}, request)
 
-    def as_values(self, exclude_columns=None):
+        self.before_render(request)
+        with profile_render(self), detect_queries(self):
+            with context.render_context.push_state(template), context.bind_template(template):
+                block = get_template_block(template, "table.tbody.row", context)
+                rows = []
+                for row in self.paginated_rows:
+                    with context.push(row=row):
+                        rows.append(block.render(context))
+
+            return get_template(template_name).render(
+                {"table": self, "rows": mark_safe("".join(rows))}, request
+            )
+
+    def as_values(self, exclude_columns=None, chunk_size=None):
         """
         Return a row iterator of the data which would be shown in the table where the first row is the table headers.
 
         Arguments:
             exclude_columns (iterable): columns to exclude in the data iterator.
+            chunk_size (int): if not `None`, QuerySet data is fetched in chunks of
+                this size using `.BoundRows.iterator`, rather than keeping all records
+                in memory until the iteration is finished.
 
         This can be used to output the table data as CSV, excel, for example using the `~.export.ExportMixin`.
 
@@ -476,22 +550,174 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
         the value when `as_values()` is called.
 
         Note that any invisible columns will be part of the row iterator.
+
+        For QuerySet data, the values of columns showing a plain model field (a `.Column`
+        without custom `render`/`value` methods or :ref:`table.render_FOO`/`value_FOO`
+        methods) are fetched using ``values_list()``, rather than from the records.
+        """
+        columns = self._get_export_columns(exclude_columns)
+
+        yield [force_str(column.header, strings_only=True) for column in columns]
+
+        lookups = self._get_field_lookups(columns)
+        with detect_queries(self):
+            if lookups:
+                yield from self._as_values_with_lookups(columns, lookups, chunk_size)
+                return
+
+            # the rows are not kept, so a single row object is reused for all records.
+            if chunk_size is None:
+                rows = self.rows._iter_records(self.rows.data, reuse_row=True)
+            else:
+                rows = self.rows.iterator(chunk_size=chunk_size, reuse_row=True)
+            for row in rows:
+                yield self._row_values(row, columns)
+
+    def as_dicts(self, exclude_columns=None):
+        """
+        Return an iterator of dicts mapping column names to values, for the rows shown in the table.
+
+        The values are those returned by `as_values` (using :ref:`table.value_FOO` methods),
+        for the rows of the current page if the table is paginated, for all rows otherwise.
+        Like in the HTML, columns with ``visible=False`` are left out.
+
+        Arguments:
+            exclude_columns (iterable): columns to exclude from the dicts.
+        """
+        columns = self._get_visible_columns(exclude_columns)
+        names = [column.name for column in columns]
+        with detect_queries(self):
+            for row in self.paginated_rows:
+                yield dict(zip(names, self._row_values(row, columns)))
+
+    def as_json(self, exclude_columns=None):
+        """
+        Return an iterator of strings which together form a JSON document describing the table.
+
+        The document is encoded while iterating, row by row, so it can be streamed. It
+        contains these keys:
+
+        - ``columns``: a list of objects with the ``name``, ``header`` and ``orderable``
+          attributes of each visible column,
+        - ``rows``: the rows of the current page, as returned by `as_dicts`,
+        - ``page``: information about the current page, `null` if not paginated,
+        - ``ordering``: list of order by aliases currently applied to the table.
+
+        Arguments:
+            exclude_columns (iterable): columns to exclude from the document.
         """
+        encode = DjangoJSONEncoder().encode
+        columns = [
+            {
+                "name": column.name,
+                "header": force_str(column.header),
+                "orderable": column.orderable,
+            }
+            for column in self._get_visible_columns(exclude_columns)
+        ]
+        yield f'{{"columns": {encode(columns)}, "rows": ['
+        for i, row in enumerate(self.as_dicts(exclude_columns=exclude_columns)):
+            yield f"{', ' if i else ''}{encode(row)}"
+
+        ordering = list(self.order_by) if self.order_by else []
+        yield f'], "page": {encode(self._get_page_info())}, "ordering": {encode(ordering)}}}'
+
+    def _get_page_info(self):
+        if not hasattr(self, "page"):
+            return None
+
+        page, paginator = self.page, self.paginator
+        try:
+            count = paginator.count
+        except NotImplementedError:
+            # paginators like LazyPaginator don't know the number of rows.
+            count = None
+        return {
+            "number": page.number,
+            "per_page": paginator.per_page,
+            "count": count,
+            "count_is_estimated": bool(getattr(paginator, "is_estimated", False)),
+            "num_pages": None if count is None else paginator.num_pages,
+            "next": page.next_page_number() if page.has_next() else None,
+            "previous": page.previous_page_number() if page.has_previous() else None,
+        }
+
+    def _get_export_columns(self, exclude_columns=None):
         if exclude_columns is None:
             exclude_columns = ()
 
-        columns = [
+        return [
             column
             for column in self.columns.iterall()
             if not (column.column.exclude_from_export or column.name in exclude_columns)
         ]
 
-        yield [force_str(column.header, strings_only=True) for column in columns]
+    def _get_visible_columns(self, exclude_columns=None):
+        return [column for column in self._get_export_columns(exclude_columns) if column.visible]
+
+    def _row_values(self, row, columns):
+        return [force_str(row.get_cell_value(column.name), strings_only=True) for column in columns]
+
+    def _get_field_lookups(self, columns):
+        """Return a dict mapping column names to ``values_list()`` lookups for columns showing plain model fields."""
+        if not isinstance(self.data, TableQuerysetData) or self.data.data._result_cache is not None:
+            return {}
+
+        lookups = {}
+        for bound_column in columns:
+            column = bound_column.column
+            if (
+                type(column).render is not Column.render
+                or type(column).value is not Column.value
+                or hasattr(self, f"render_{bound_column.name}")
+                or hasattr(self, f"value_{bound_column.name}")
+            ):
+                continue
+            lookup = self.data.get_field_lookup(bound_column.accessor)
+            if lookup is not None:
+                lookups[bound_column.name] = lookup
+        return lookups
+
+    def _as_values_with_lookups(self, columns, lookups, chunk_size):
+        def field_value(column, value):
+            return (
+                None if value in column.column.empty_values else force_str(value, strings_only=True)
+            )
+
+        pinned_data = self.rows.pinned_data
+        for row in self.rows.generator_pinned_row(pinned_data.get("top")):
+            yield self._row_values(row, columns)
+
+        if len(lookups) == len(columns):
+            # The primary key is selected (and discarded) too, so a DISTINCT QuerySet
+            # keeps rows with the same values for these columns.
+            values_list = self.data.data.values_list("pk", *lookups.values())
+            if chunk_size is not None:
+                values_list = values_list.iterator(chunk_size=chunk_size)
+            for _, *values in values_list:
+                yield [field_value(column, value) for column, value in zip(columns, values)]
+        else:
+            positions = {name: i for i, name in enumerate(lookups)}
+            row = None
+            for record, values in self.data.iterator_with_values(lookups.values(), chunk_size):
+                if row is None:
+                    row = BoundRow(record, table=self)
+                else:
+                    row._bind(record, next(self._counter))
+                if values is None:
+                    yield self._row_values(row, columns)
+                    continue
+                yield [
+                    (
+                        field_value(column, values[positions[column.name]])
+                        if column.name in positions
+                        else force_str(row.get_cell_value(column.name), strings_only=True)
+                    )
+                    for column in columns
+                ]
 
-        for row in self.rows:
-            yield [
-                force_str(row.get_cell_value(column.name), strings_only=True) for column in columns
-            ]
+        for row in self.rows.generator_pinned_row(pinned_data.get("bottom")):
+            yield self._row_values(row, columns)
 
     def has_footer(self):
         """Return True if any of the columns define a ``_footer`` attribute or a ``render_footer()`` method."""
@@ -529,7 +755,8 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
             if name in self.columns and self.columns[name].orderable:
                 valid.append(alias)
         self._order_by = OrderByTuple(valid)
-        self.data.order_by(self._order_by)
+        with profile_phase(self, "ordering"):
+            self.data.order_by(self._order_by)
 
     @property
     def order_by_field(self):
@@ -571,6 +798,23 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
 
         return self
 
+    async def apaginate(self, paginator_class=Paginator, per_page=None, page=1, *args, **kwargs):
+        """
+        Async version of `.paginate`, for use in async views.
+
+        The rows are counted using ``QuerySet.acount()`` and the records for the
+        current page are fetched using async iteration (which also applies
+        ``prefetch_related()`` lookups), see `~.paginators.apage`. Rendering the
+        table afterwards doesn't need to query the database for the records of the page.
+
+        Accepts the same arguments and raises the same exceptions as `.paginate`.
+        """
+        per_page = per_page or self._meta.per_page
+        self.paginator = paginator_class(self.rows, per_page, *args, **kwargs)
+        self.page = await apage(self.paginator, page)
+
+        return self
+
     @property
     def per_page_field(self):
         return (
@@ -614,6 +858,8 @@ class Table(metaclass=DeclarativeColumnsMetaclass):
 
     @property
     def orderable(self):
+        if not self.data.orderable:
+            return False
         if self._orderable is not None:
             return self._orderable
         else:
@@ -686,6 +932,9 @@ def table_factory(model, table=Table, fields=None, exclude=None, localize=None):
             class Meta:
                 model = model
 
+    The generated classes are cached, calling `table_factory` again with the same
+    arguments returns the same class, so it should not be modified.
+
     Arguments:
         model (`~django.db.models.Model`): Model associated with the new table
         table (`.Table`): Base Table class used to create the new one
@@ -693,6 +942,19 @@ def table_factory(model, table=Table, fields=None, exclude=None, localize=None):
         exclude (list of str): Fields exclude in tables
         localize (list of str): Fields to localize
     """
+
+    def freeze(value):
+        return tuple(value) if isinstance(value, list) else value
+
+    args = (model, table, freeze(fields), freeze(exclude), freeze(localize))
+    try:
+        return _table_factory(*args)
+    except TypeError:  # unhashable arguments, for example a set of fields
+        return _table_factory.__wrapped__(*args)
+
+
+@lru_cache(maxsize=256)
+def _table_factory(model, table, fields, exclude, localize):
     attrs = {"model": model}
     if fields is not None:
         attrs["fields"] = fields
@@ -11,11 +11,14 @@ from django.utils.html import escape
 from django.utils.http import urlencode
 
 import django_tables2 as tables
-from django_tables2.paginators import LazyPaginator
+from django_tables2.paginators import EstimatedCountPaginator, KeysetPaginator, LazyPaginator
+from django_tables2.profiling import profile_render
+from django_tables2.queries import detect_queries
 from django_tables2.utils import AttributeDict
 
 register = template.Library()
 kwarg_re = re.compile(r"(?:(.+)=)?(.+)")
+QUERYSTRING_CACHE_KEY = "django_tables2.querystring_replace"
 context_processor_error_msg = (
     "Tag {%% %s %%} requires django.template.context_processors.request to be "
     "in the template configuration in "
@@ -55,19 +58,27 @@ class QuerystringReplaceNode(Node):
         if "request" not in context:
             raise ImproperlyConfigured(context_processor_error_msg % "querystring_replace")
 
-        params = dict(context["request"].GET)
+        updates = {}
         for key, value in self.updates.items():
             if isinstance(key, str):
-                params[key] = value
+                updates[key] = value
                 continue
             key = key.resolve(context)
             value = value.resolve(context)
             if key not in ("", None):
-                params[key] = value
-        for removal in self.removals:
-            params.pop(removal.resolve(context), None)
+                updates[key] = value
 
-        value = escape("?" + urlencode(params, doseq=True))
+        if len(updates) == 1 and not self.removals:
+            # links to order or paginate a table replace a single parameter.
+            querystring = replace_querystring_param(context, *updates.popitem())
+        else:
+            params = dict(context["request"].GET)
+            params.update(updates)
+            for removal in self.removals:
+                params.pop(removal.resolve(context), None)
+            querystring = urlencode(params, doseq=True)
+
+        value = escape("?" + querystring)
 
         if self.asvar:
             context[str(self.asvar)] = value
@@ -76,6 +87,29 @@ class QuerystringReplaceNode(Node):
             return value
 
 
+def replace_querystring_param(context, key, value):
+    """
+    Return the query string of the request in `context`, with the parameter `key` replaced by `value`.
+
+    The result is equal to encoding ``request.GET`` after replacing `key`, but the
+    parameters before and after `key` are only encoded once per template rendering for
+    each `key`, rather than for every link: rendering a table creates a link for every
+    orderable column and page.
+    """
+    cache = context.render_context.setdefault(QUERYSTRING_CACHE_KEY, {})
+    if key not in cache:
+        params = list(context["request"].GET.lists())
+        index = next((i for i, (name, _) in enumerate(params) if name == key), len(params))
+        cache[key] = (
+            urlencode(params[:index], doseq=True),
+            urlencode(params[index + 1 :], doseq=True),
+        )
+
+    before, after = cache[key]
+    parts = (before, urlencode({key: value}, doseq=True), after)
+    return "&".join(part for part in parts if part)
+
+
 # {% querystring_replace "name"="abc" "age"=15 as=qs %}
 @register.tag
 def querystring_replace(parser, token):
@@ -165,7 +199,8 @@ class RenderTableNode(Node):
             table.context = context
             table.before_render(request)
 
-            return template.render(context={"table": table}, request=request)
+            with profile_render(table), detect_queries(table):
+                return template.render(context={"table": table}, request=request)
         finally:
             del table.context
 
@@ -243,6 +278,9 @@ def table_page_range(page, paginator):
      - always containing the first, last and current page.
      - containing one or two '...' to skip ranges between first/last and current.
 
+    If the number of pages is not known exactly (for `.LazyPaginator` and
+    `.EstimatedCountPaginator`), the list ends with '...'.
+
     Example:
         {% for p in table.page|table_page_range:table.paginator %}
             {{ p }}
@@ -250,6 +288,10 @@ def table_page_range(page, paginator):
     """
     page_range = getattr(settings, "DJANGO_TABLES2_PAGE_RANGE", 10)
 
+    # pages of a cursor based paginator can only be reached using the previous/next links.
+    if isinstance(paginator, KeysetPaginator):
+        return []
+
     num_pages = paginator.num_pages
     if num_pages <= page_range:
         return range(1, num_pages + 1)
@@ -269,6 +311,13 @@ def table_page_range(page, paginator):
         ret = list(ret)[:-2] + ["...", num_pages]
     if isinstance(paginator, LazyPaginator) and not paginator.is_last_page(page.number):
         ret.append("...")
+    if isinstance(paginator, EstimatedCountPaginator) and not paginator.is_last_page(page.number):
+        # The number of pages is an estimate, so don't link to the (estimated) last page.
+        ret = list(ret)
+        if ret[-1] == num_pages and num_pages != page.number:
+            ret.pop()
+        if ret[-1] != "...":
+            ret.append("...")
     return ret
 
 
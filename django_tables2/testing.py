@@ -0,0 +1,165 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from .data import TableQuerysetData
+
+
+def get_export_formats():
+    """Return the export formats which can be used with the installed packages."""
+    try:
+        from tablib.exceptions import UnsupportedFormat
+        from tablib.formats import registry
+
+        from .export import StreamingTableExport, TableExport
+    except (ImportError, ImproperlyConfigured):
+        return ()
+
+    formats = []
+    for export_format in TableExport.FORMATS:
+        try:
+            registry.get_format(export_format)
+        except UnsupportedFormat:
+            continue
+        formats.append(export_format)
+    formats.extend(
+        export_format
+        for export_format in StreamingTableExport.FORMATS
+        if not TableExport.is_valid_format(export_format)
+    )
+    return tuple(formats)
+
+
+def export_table(table, export_format):
+    from .export import StreamingTableExport, TableExport
+
+    if TableExport.is_valid_format(export_format):
+        return TableExport(export_format, table).export()
+    return "".join(StreamingTableExport(export_format, table).export())
+
+
+class TableQueries:
+    """
+    The queries executed while rendering a table, for each phase.
+
+    The phases are ``html`` (`.Table.as_html`, rendering the current page if the table
+    is paginated), ``values`` (`.Table.as_values`) and ``export_<format>`` for each
+    export format.
+
+    Attributes:
+        phases (dict): the list of SQL of the queries executed in each phase.
+        rows (dict): the number of rows rendered in each phase.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.rows = {}
+
+    def counts(self):
+        """Return a dict with the number of queries executed in each phase."""
+        return {phase: len(queries) for phase, queries in self.phases.items()}
+
+    def over_budget(self, max_queries, per_row=0):
+        """Return the phases executing more than ``max_queries + per_row * rows`` queries."""
+        return [
+            phase
+            for phase, queries in self.phases.items()
+            if len(queries) > max_queries + per_row * self.rows[phase]
+        ]
+
+    def report(self, phases=None):
+        """Return a description of the queries executed in `phases` (all phases by default)."""
+        lines = []
+        for phase in self.phases if phases is None else phases:
+            queries = self.phases[phase]
+            lines.append(f"{phase}: {len(queries)} queries for {self.rows[phase]} rows")
+            lines.extend(f"    {i}. {sql}" for i, sql in enumerate(queries, start=1))
+        return "\n".join(lines)
+
+
+def capture_table_queries(table, request=None, export_formats=None, using=None):
+    """
+    Render `table` as HTML, as values and in every export format, capturing the queries of each phase.
+
+    The QuerySet of the table is cloned before each phase, so the records aren't
+    reused from an earlier phase.
+
+    Arguments:
+        table (`~.Table`): the table to render.
+        request: the request to render the HTML with, defaults to a ``GET`` request for ``/``.
+        export_formats (iterable): the export formats to render, defaults to all formats
+            supported by the installed packages.
+        using (str): alias of the database to capture the queries of, defaults to
+            the database of the table's QuerySet.
+
+    Returns:
+        `.TableQueries`
+    """
+    if using is None:
+        using = getattr(table.data.data, "db", DEFAULT_DB_ALIAS)
+    if export_formats is None:
+        export_formats = get_export_formats()
+
+    result = TableQueries()
+
+    def capture(phase, func, paginated=False):
+        if isinstance(table.data, TableQuerysetData):
+            table.data.data = table.data.data.all()
+        with CaptureQueriesContext(connections[using]) as context:
+            func()
+        result.phases[phase] = [query["sql"] for query in context.captured_queries]
+        result.rows[phase] = len(table.paginated_rows if paginated else table.rows)
+
+    capture("html", lambda: table.as_html(request or RequestFactory().get("/")), paginated=True)
+    capture("values", lambda: list(table.as_values()))
+    for export_format in export_formats:
+        capture(f"export_{export_format}", lambda: export_table(table, export_format))
+
+    return result
+
+
+def assert_table_query_budget(table, max_queries, per_row=0, **kwargs):
+    """
+    Assert rendering `table` executes at most ``max_queries + per_row * rows`` queries in every phase.
+
+    `rows` is the number of rows rendered in the phase, so with the default `per_row=0`,
+    the number of queries must not depend on the number of rows. This guards against
+    columns querying the database for each row (N+1 queries)::
+
+        def test_person_table_queries(self):
+            table = PersonTable(Person.objects.select_related("occupation"))
+            assert_table_query_budget(table, max_queries=3)
+
+    Keyword arguments are passed to `.capture_table_queries`. Raises `AssertionError`
+    listing the queries of the phases over budget, returns the `.TableQueries` otherwise.
+    """
+    queries = capture_table_queries(table, **kwargs)
+    over_budget = queries.over_budget(max_queries, per_row=per_row)
+    if over_budget:
+        budget = f"{max_queries} + {per_row} per row" if per_row else str(max_queries)
+        raise AssertionError(
+            f"{type(table).__name__} executed more queries than its budget of {budget}:\n"
+            + queries.report(over_budget)
+        )
+    return queries
+
+
+class TableTestCase:
+    """
+    Mixin for `~django.test.TestCase` to check the number of queries executed by tables.
+
+    Example::
+
+        class PersonTableTest(TableTestCase, TestCase):
+            def test_queries(self):
+                table = PersonTable(Person.objects.select_related("occupation"))
+                self.assertTableQueryBudget(table, max_queries=3)
+    """
+
+    def assertTableQueryBudget(self, table, max_queries, per_row=0, **kwargs):
+        """Fail if rendering `table` executes more queries than the budget, see `.assert_table_query_budget`."""
+        try:
+            return assert_table_query_budget(table, max_queries, per_row=per_row, **kwargs)
+        except AssertionError as e:
+            raise self.failureException(str(e)) from None
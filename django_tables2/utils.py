@@ -6,7 +6,9 @@ from itertools import chain
 
 from django.core.exceptions import FieldDoesNotExist
 from django.db import models
-from django.utils.html import format_html_join
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+from django.utils.html import conditional_escape, format_html_join
+from django.utils.safestring import mark_safe
 
 
 class Sequence(list):
@@ -451,16 +453,117 @@ class AttributeDict(OrderedDict):
 
     The returned string is marked safe, so it can be used safely in a template.
     See `.as_html` for a usage example.
+
+    If none of the values is callable (or may change, like a lazy translation),
+    the HTML is cached until the dict is modified.
     """
 
     blacklist = ("th", "td", "_ordering", "thead", "tbody", "tfoot")
 
+    def __init__(self, *args, **kwargs):
+        self._cache = {}
+        super().__init__(*args, **kwargs)
+
+    def __reduce__(self):
+        # Copies (and unpickled dicts) get a cache of their own.
+        cls, args, state, *rest = super().__reduce__()
+        state = {key: value for key, value in (state or {}).items() if key != "_cache"}
+        return (cls, args, state or None, *rest)
+
+    def __setitem__(self, key, value):
+        self._cache.clear()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._cache.clear()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._cache.clear()
+        return super().__ior__(other)
+
+    def clear(self):
+        self._cache.clear()
+        super().clear()
+
+    def pop(self, *args):
+        self._cache.clear()
+        return super().pop(*args)
+
+    def popitem(self, last=True):
+        self._cache.clear()
+        return super().popitem(last=last)
+
+    def setdefault(self, key, default=None):
+        self._cache.clear()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self._cache.clear()
+        super().update(*args, **kwargs)
+
+    def move_to_end(self, key, last=True):
+        self._cache.clear()
+        super().move_to_end(key, last=last)
+
     def _iteritems(self):
         for key, v in self.items():
             value = v() if callable(v) else v
             if key not in self.blacklist and value is not None:
                 yield (key, value)
 
+    def _is_static(self):
+        """Return True if rendering the attributes always results in the same HTML."""
+        static = self._cache.get("static")
+        if static is None:
+            static = self._cache["static"] = all(
+                key in self.blacklist or value is None or isinstance(value, (str, int, float))
+                for key, value in self.items()
+            )
+        return static
+
+    def _static_parts(self):
+        """
+        Return the HTML of the attributes before and after ``class`` and the value of ``class``.
+
+        Returns `None` if the attributes are not static. The parts are used by
+        `.with_class` to render the HTML for another ``class`` without rendering
+        the other attributes again.
+        """
+        if not self._is_static():
+            return None
+        if "parts" not in self._cache:
+            before, after, seen_class = [], [], False
+            for key, value in self.items():
+                if key == "class":
+                    seen_class = True
+                elif key not in self.blacklist and value is not None:
+                    (after if seen_class else before).append((key, value))
+            self._cache["parts"] = (
+                format_html_join(" ", '{}="{}"', before),
+                self.get("class"),
+                format_html_join(" ", '{}="{}"', after),
+            )
+        return self._cache["parts"]
+
+    def with_class(self, css_class):
+        """
+        Return a copy of the attributes with ``class`` set to `css_class`.
+
+        For static attributes, the HTML of the copy is composed of the cached HTML of
+        the other attributes, which makes this cheap to do for every row of a table.
+        """
+        attrs = type(self)(self)
+        attrs["class"] = css_class
+        parts = self._static_parts()
+        if parts is not None and isinstance(css_class, str):
+            before, _, after = parts
+            html = f'class="{conditional_escape(css_class)}"'
+            attrs._cache["html"] = mark_safe(
+                " ".join(part for part in (before, html, after) if part)
+            )
+        return attrs
+
     def as_html(self):
         """
         Render to HTML tag attributes.
@@ -477,7 +580,12 @@ class AttributeDict(OrderedDict):
         returns: `~django.utils.safestring.SafeUnicode` object
 
         """
-        return format_html_join(" ", '{}="{}"', self._iteritems())
+        html = self._cache.get("html")
+        if html is None:
+            html = format_html_join(" ", '{}="{}"', self._iteritems())
+            if self._is_static():
+                self._cache["html"] = html
+        return html
 
 
 def segment(sequence, aliases):
@@ -497,24 +605,43 @@ def segment(sequence, aliases):
     """
     if not (sequence or aliases):
         return
+    sequence = tuple(sequence)
+
+    # Index the aliases and their opposites by the first key of their parts, so
+    # only the aliases matching the next key of the sequence are tried. The
+    # position in `variants` keeps the order in which the aliases are tried.
+    variants, index, unkeyed = [], {}, []
     for alias, parts in aliases.items():
-        variants = {
-            # alias: order by tuple
-            alias: OrderByTuple(parts),
-            OrderBy(alias).opposite: OrderByTuple(parts).opposite,
-        }
-        for valias, vparts in variants.items():
-            if list(sequence[: len(vparts)]) == list(vparts):
-                tail_aliases = dict(aliases)
-                del tail_aliases[alias]
-                tail_sequence = sequence[len(vparts) :]
-                if tail_sequence:
-                    for tail in segment(tail_sequence, tail_aliases):
-                        yield tuple(chain([valias], tail))
-                    else:
-                        continue
-                else:
-                    yield tuple([valias])
+        parts = OrderByTuple(parts)
+        for valias, vparts in ((alias, parts), (OrderBy(alias).opposite, parts.opposite)):
+            variant = (len(variants), alias, valias, tuple(vparts))
+            variants.append(variant)
+            if vparts:
+                index.setdefault(vparts[0], []).append(variant)
+            else:
+                unkeyed.append(variant)
+
+    def candidates(position):
+        try:
+            keyed = index.get(sequence[position], []) if position < len(sequence) else []
+        except TypeError:  # unhashable expression
+            keyed = []
+        return sorted(keyed + unkeyed) if unkeyed else keyed
+
+    def match(position, used):
+        for _, alias, valias, vparts in candidates(position):
+            end = position + len(vparts)
+            if alias in used or sequence[position:end] != vparts:
+                continue
+            if end == len(sequence):
+                yield (valias,)
+                continue
+            used.add(alias)
+            for tail in match(end, used):
+                yield (valias, *tail)
+            used.discard(alias)
+
+    yield from match(0, set())
 
 
 def signature(fn):
@@ -609,3 +736,33 @@ def computed_values(d, kwargs=None):
             v = computed_values(v, kwargs=kwargs)
         result[k] = v
     return result
+
+
+def get_template_block(template, name, context):
+    """
+    Return the block called `name` of `template`, taking ``{% extends %}`` into account.
+
+    The blocks of `template` and the templates it extends are registered in the
+    render context of `context`, like ``{% extends %}`` does, so rendering the
+    returned node renders the most specific version of the block (including
+    ``{{ block.super }}``). `context` must be bound to `template`.
+
+    Arguments:
+        template (`django.template.base.Template`): the template to find the block in.
+        name (str): name of the block.
+        context (`django.template.Context`): the context used to render the block.
+    """
+    block_context = BlockContext()
+    context.render_context[BLOCK_CONTEXT_KEY] = block_context
+    while template is not None:
+        nodelist = template.nodelist
+        block_context.add_blocks(
+            {node.name: node for node in nodelist.get_nodes_by_type(BlockNode)}
+        )
+        extends = next((node for node in nodelist if isinstance(node, ExtendsNode)), None)
+        template = None if extends is None else extends.get_parent(context)
+
+    block = block_context.get_block(name)
+    if block is None:
+        raise ValueError(f"Block {name!r} not found in template {context.template.origin.name!r}")
+    return block
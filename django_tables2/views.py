@@ -1,11 +1,28 @@
-from itertools import count
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers, set_response_etag
+from django.utils.translation import gettext as _
 from django.views.generic.list import ListView
 
 from . import tables
 from .config import RequestConfig
+from .rows import BoundRows
+
+
+async def aiterate(iterable, batch_size=100):
+    """Yield the items of the synchronous `iterable`, consuming it in batches in a thread."""
+    iterator = iter(iterable)
+    next_batch = sync_to_async(lambda: list(islice(iterator, batch_size)))
+    while batch := await next_batch():
+        for item in batch:
+            yield item
 
 
 class TableMixinBase:
@@ -90,6 +107,18 @@ class SingleTableMixin(TableMixinBase):
 
             If you want to use a non-standard paginator for example, you can add a key
             `paginator_class` to the dict, containing a custom `Paginator` class.
+        table_fragment_param (str): name of the GET attribute requesting only the rows of
+            the current page, rendered using `.Table.as_fragment` (default: '_fragment').
+        table_fragment_header (str): name of the request header requesting only the rows
+            of the current page (default: 'X-Table-Fragment'). Responses vary on this
+            header.
+        table_fragment_template_name (str): template rendering the rows of a fragment
+            request, see `.Table.as_fragment`.
+        table_json_param (str): name of the GET attribute requesting the table as JSON,
+            rendered using `.Table.as_json` (default: `None`, set it to for example
+            '_json' to enable this). Paginated tables are returned with an ``ETag`` header
+            (and ``304 Not Modified`` if it matches ``If-None-Match``), other tables are
+            streamed.
 
     This mixin plays nice with the Django's ``.MultipleObjectMixin`` by using
     ``.get_queryset`` as a fall back for the table data source.
@@ -97,6 +126,10 @@ class SingleTableMixin(TableMixinBase):
 
     table_class = None
     table_data = None
+    table_fragment_param = "_fragment"
+    table_fragment_header = "X-Table-Fragment"
+    table_fragment_template_name = "django_tables2/fragment.html"
+    table_json_param = None
 
     def get_table_class(self):
         """Return the class to use for the table."""
@@ -148,10 +181,46 @@ class SingleTableMixin(TableMixinBase):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """Overridden version of `.TemplateResponseMixin` to inject the table into the template's context."""
         context = super().get_context_data(**kwargs)
-        table = self.get_table(**self.get_table_kwargs())
-        context[self.get_context_table_name(table)] = table
+        self.table = self.get_table(**self.get_table_kwargs())
+        context[self.get_context_table_name(self.table)] = self.table
         return context
 
+    def is_fragment_request(self):
+        """Return `True` if only the rows of the current page should be rendered."""
+        if self.table_fragment_param and self.table_fragment_param in self.request.GET:
+            return True
+        return bool(
+            self.table_fragment_header and self.request.headers.get(self.table_fragment_header)
+        )
+
+    def is_json_request(self):
+        """Return `True` if the table should be rendered as JSON."""
+        return bool(self.table_json_param and self.table_json_param in self.request.GET)
+
+    def render_table_json(self):
+        """Return a response containing `.Table.as_json` for the table."""
+        content = self.table.as_json()
+        if not hasattr(self.table, "page"):
+            return StreamingHttpResponse(content, content_type="application/json")
+
+        response = HttpResponse("".join(content), content_type="application/json")
+        set_response_etag(response)
+        return get_conditional_response(self.request, etag=response["ETag"], response=response)
+
+    def render_to_response(self, context, **response_kwargs):
+        """Render the table as JSON or only its rows for fragment requests, the full template otherwise."""
+        if self.is_json_request():
+            return self.render_table_json()
+        if self.is_fragment_request():
+            response = HttpResponse(
+                self.table.as_fragment(self.request, self.table_fragment_template_name)
+            )
+        else:
+            response = super().render_to_response(context, **response_kwargs)
+        if self.table_fragment_header:
+            patch_vary_headers(response, (self.table_fragment_header,))
+        return response
+
 
 class SingleTableView(SingleTableMixin, ListView):
     """
@@ -161,6 +230,99 @@ class SingleTableView(SingleTableMixin, ListView):
     """
 
 
+class AsyncSingleTableMixin(SingleTableMixin):
+    """
+    Async version of `.SingleTableMixin`, for use in async views.
+
+    The table is configured using `.RequestConfig.aconfigure`, so the rows are
+    counted and the records of the current page are fetched using the async ORM.
+    Rendering the table is done synchronously, like it is for other templates.
+
+    Use `aget_context_data` rather than ``get_context_data``, the ``get()`` handler of
+    this mixin does so. JSON and fragment requests are rendered in a thread by
+    `arender_to_response`, as the columns may access the database.
+    """
+
+    async def aget_table(self, **kwargs):
+        """Async version of `.SingleTableMixin.get_table`."""
+        table_class = self.get_table_class()
+        table = table_class(data=self.get_table_data(), **kwargs)
+        return await RequestConfig(
+            self.request, paginate=self.get_table_pagination(table)
+        ).aconfigure(table)
+
+    async def aget_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Async version of `.SingleTableMixin.get_context_data`."""
+        self.table = await self.aget_table(**self.get_table_kwargs())
+        # skip SingleTableMixin.get_context_data, which would create another table.
+        context = super(SingleTableMixin, self).get_context_data(**kwargs)
+        context[self.get_context_table_name(self.table)] = self.table
+        return context
+
+    async def arender_table_json(self):
+        """
+        Async version of `.SingleTableMixin.render_table_json`.
+
+        The JSON of paginated tables is rendered in a thread using ``sync_to_async``,
+        for other tables the streamed JSON is rendered in a thread in batches of rows.
+        """
+        if hasattr(self.table, "page"):
+            return await sync_to_async(self.render_table_json)()
+        return StreamingHttpResponse(
+            aiterate(self.table.as_json()), content_type="application/json"
+        )
+
+    async def arender_to_response(self, context, **response_kwargs):
+        """
+        Async version of `.SingleTableMixin.render_to_response`.
+
+        The full page is a ``TemplateResponse``, which Django renders in a thread. The
+        JSON and the rows of fragment requests are rendered in a thread using
+        ``sync_to_async``.
+        """
+        if self.is_json_request():
+            return await self.arender_table_json()
+        if self.is_fragment_request():
+            return await sync_to_async(self.render_to_response)(context, **response_kwargs)
+        return self.render_to_response(context, **response_kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        context = await self.aget_context_data(**kwargs)
+        return await self.arender_to_response(context)
+
+
+class AsyncSingleTableView(AsyncSingleTableMixin, ListView):
+    """
+    Async version of `.SingleTableView`.
+
+    The ``paginator``, ``page_obj`` and ``is_paginated`` context variables of
+    ``ListView`` are taken from the table, rather than paginating the QuerySet
+    again, ``object_list`` is the unpaginated QuerySet.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = self.get_queryset()
+        if not self.get_allow_empty():
+            if hasattr(self.object_list, "aexists"):
+                is_empty = not await self.object_list.aexists()
+            else:
+                is_empty = not self.object_list
+            if is_empty:
+                raise Http404(
+                    _("Empty list and “%(class_name)s.allow_empty” is False.")
+                    % {"class_name": type(self).__name__}
+                )
+        context = await self.aget_context_data()
+        return await self.arender_to_response(context)
+
+    def paginate_queryset(self, queryset, page_size):
+        """Return the pagination of the table, which is already fetched."""
+        page = getattr(self.table, "page", None)
+        if page is None:
+            return (None, None, queryset, False)
+        return (self.table.paginator, page, queryset, page.has_other_pages())
+
+
 class MultiTableMixin(TableMixinBase):
     """
     Add a list with multiple Table object's to the context. Typically used with
@@ -182,12 +344,18 @@ class MultiTableMixin(TableMixinBase):
             different for each table in the view. Default is 'table_{}-'.
         context_table_name(str): name of the table's template variable (default:
             'tables')
+        table_concurrency(int): if larger than 1, the tables are configured (counting
+            and fetching the records of their current page) concurrently, by at most
+            this number of worker threads. Each worker thread uses its own database
+            connections, which are closed afterwards. Default is `None`: the tables
+            are configured one after another.
 
     .. versionadded:: 1.2.3
     """
 
     tables = None
     tables_data = None
+    table_concurrency = None
 
     table_prefix = "table_{}-"
 
@@ -216,14 +384,93 @@ class MultiTableMixin(TableMixinBase):
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         tables = self.get_tables()
+        self.apply_table_prefixes(tables)
+
+        workers = self.get_table_workers(tables)
+        if workers is None:
+            for table in tables:
+                self.configure_table(table)
+        else:
+            with ThreadPoolExecutor(workers, thread_name_prefix="django_tables2") as executor:
+                # consume the results to raise any exceptions from the workers
+                list(executor.map(self.configure_table_in_thread, tables))
 
-        # apply prefixes and execute requestConfig for each table
+        for table in tables:
+            context[self.get_context_table_name(table)] = list(tables)
+
+        return context
+
+    def apply_table_prefixes(self, tables):
+        """Set the prefix of each table in `tables` which doesn't have one, using `table_prefix`."""
         table_counter = count()
         for table in tables:
             table.prefix = table.prefix or self.table_prefix.format(next(table_counter))
 
-            RequestConfig(self.request, paginate=self.get_table_pagination(table)).configure(table)
+    def get_table_workers(self, tables):
+        """Return the number of worker threads to configure `tables` with, `None` to do so serially."""
+        if not self.table_concurrency or self.table_concurrency < 2 or len(tables) < 2:
+            return None
+        return min(self.table_concurrency, len(tables))
+
+    def configure_table(self, table):
+        """Configure `table` using `.RequestConfig` and fetch the records it shows."""
+        RequestConfig(self.request, paginate=self.get_table_pagination(table)).configure(table)
+        if isinstance(table.paginated_rows, BoundRows):
+            table.paginated_rows.load()
 
+    def configure_table_in_thread(self, table):
+        try:
+            self.configure_table(table)
+        finally:
+            # worker threads have their own database connections, which Django doesn't close.
+            connections.close_all()
+
+
+class AsyncMultiTableMixin(MultiTableMixin):
+    """
+    Async version of `.MultiTableMixin`, for use in async views.
+
+    Each table is configured using `.RequestConfig.aconfigure`, see `.AsyncSingleTableMixin`.
+    With `table_concurrency`, the tables are configured concurrently in worker threads,
+    which are awaited using ``asyncio.gather()``. Queries using the async ORM are run
+    one after another, so this is the only way to run the queries for the tables at
+    the same time.
+    """
+
+    async def aget_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Async version of `.MultiTableMixin.get_context_data`."""
+        # skip MultiTableMixin.get_context_data, which would configure the tables synchronously.
+        context = super(MultiTableMixin, self).get_context_data(**kwargs)
+        tables = self.get_tables()
+        self.apply_table_prefixes(tables)
+
+        workers = self.get_table_workers(tables)
+        if workers is None:
+            for table in tables:
+                await self.aconfigure_table(table)
+        else:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(workers, thread_name_prefix="django_tables2") as executor:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(executor, self.configure_table_in_thread, table)
+                        for table in tables
+                    )
+                )
+
+        for table in tables:
             context[self.get_context_table_name(table)] = list(tables)
 
         return context
+
+    async def aconfigure_table(self, table):
+        """Async version of `.MultiTableMixin.configure_table`."""
+        await RequestConfig(self.request, paginate=self.get_table_pagination(table)).aconfigure(
+            table
+        )
+        if isinstance(table.paginated_rows, BoundRows):
+            await table.paginated_rows.aload()
+
+    async def get(self, request, *args, **kwargs):
+        context = await self.aget_context_data(**kwargs)
+        return self.render_to_response(context)
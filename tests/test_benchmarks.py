@@ -0,0 +1,37 @@
+import io
+
+from django.test import TestCase
+
+from benchmarks.runner import compare, get_cases, run
+
+
+class BenchmarksTest(TestCase):
+    def test_cases_run(self):
+        """Run every benchmark once with tiny sizes, to make sure they keep working."""
+        results = run({"rows": [30], "columns": [2]}, repeat=1)
+
+        self.assertIn("table_init[columns=2]", results)
+        self.assertIn("render_list_rows[rows=30,columns=2]", results)
+        self.assertIn("table_init_queryset", results)
+        # formats depending on packages which aren't installed can't be benchmarked.
+        errors = {
+            key: result["error"]
+            for key, result in results.items()
+            if "error" in result and "UnsupportedFormat" not in result["error"]
+        }
+        self.assertEqual(errors, {})
+
+    def test_pattern(self):
+        cases = get_cases({"rows": [10, 100], "columns": [5]}, pattern="^paginate_lazy$")
+        self.assertEqual(
+            [key for key, *_ in cases], ["paginate_lazy[rows=10]", "paginate_lazy[rows=100]"]
+        )
+
+    def test_compare(self):
+        stdout = io.StringIO()
+        compare(
+            {"a": {"min": 0.003}, "b": {"min": 0.001}, "c": {"error": "ValueError"}},
+            {"a": {"min": 0.002}, "c": {"min": 0.001}},
+            stdout,
+        )
+        self.assertEqual(stdout.getvalue(), "a: 2.000 ms -> 3.000 ms (1.50x)\n")
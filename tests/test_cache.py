@@ -0,0 +1,120 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+import django_tables2 as tables
+from django_tables2.cache import CountCache
+
+from .app.models import Person, PersonProxy, Region
+
+
+class CountCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(20):
+            Person.objects.create(first_name=f"first {i}", last_name="foo" if i % 2 else "bar")
+
+    def setUp(self):
+        cache.clear()
+
+    def get_table_class(self, count_cache):
+        class PersonTable(tables.Table):
+            first_name = tables.Column()
+            last_name = tables.Column()
+
+            class Meta:
+                pass
+
+        PersonTable._meta.count_cache = count_cache
+        return PersonTable
+
+    def test_count_is_cached_between_tables(self):
+        PersonTable = self.get_table_class(CountCache())
+
+        with self.assertNumQueries(2):
+            table = PersonTable(Person.objects.all()).paginate(per_page=5)
+            list(table.page.object_list)
+        self.assertEqual(table.paginator.count, 20)
+
+        # Ordering doesn't influence the cache key, so only the page is fetched
+        with self.assertNumQueries(1):
+            table = PersonTable(Person.objects.all(), order_by="-first_name").paginate(
+                per_page=5, page=2
+            )
+            list(table.page.object_list)
+        self.assertEqual(table.paginator.num_pages, 4)
+
+    def test_filters_are_cached_separately(self):
+        count_cache = CountCache()
+        self.assertEqual(count_cache.get_count(Person.objects.filter(last_name="foo")), 10)
+        self.assertEqual(count_cache.get_count(Person.objects.filter(first_name="first 1")), 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(count_cache.get_count(Person.objects.filter(last_name="foo")), 10)
+
+    def test_empty_queryset(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(CountCache().get_count(Person.objects.none()), 0)
+
+    def test_timeout(self):
+        count_cache = CountCache(timeout=0)
+        count_cache.get_count(Person.objects.all())
+        with self.assertNumQueries(1):
+            count_cache.get_count(Person.objects.all())
+
+    def test_invalidate(self):
+        count_cache = CountCache()
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+        Person.objects.filter(first_name="first 1").update(first_name="changed")
+
+        # proxy models share the counts of their concrete model
+        count_cache.invalidate(PersonProxy)
+        with self.assertNumQueries(1):
+            count_cache.get_count(Person.objects.all())
+
+    def test_evicted_version(self):
+        count_cache = CountCache(invalidate_on_change=True)
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+        Person.objects.create(first_name="new")
+
+        # without the version of the model, earlier counts can not be trusted
+        cache.delete(count_cache._version_key(Person))
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 21)
+        with self.assertNumQueries(0):
+            self.assertEqual(count_cache.get_count(Person.objects.all()), 21)
+
+    def test_invalidate_on_change(self):
+        count_cache = CountCache(invalidate_on_change=True)
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+
+        Person.objects.create(first_name="new")
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 21)
+
+        Person.objects.get(first_name="new").delete()
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+
+    def test_invalidate_on_change_in_other_process(self):
+        # the cache instance handling the signal (in another worker process) never counted.
+        count_cache = CountCache()
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+        other = CountCache(invalidate_on_change=True)
+
+        Person.objects.create(first_name="new")
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 21)
+        self.assertEqual(other.get_count(Person.objects.all()), 21)
+
+    def test_invalidate_on_change_models(self):
+        count_cache = CountCache(invalidate_on_change=True, models=[PersonProxy])
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+        self.assertEqual(count_cache.get_count(Region.objects.all()), 0)
+
+        Region.objects.create(name="new")
+        self.assertEqual(count_cache.get_count(Region.objects.all()), 0)
+        Person.objects.create(first_name="new")
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 21)
+
+    def test_no_invalidation_by_default(self):
+        count_cache = CountCache()
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
+
+        Person.objects.create(first_name="new")
+        self.assertEqual(count_cache.get_count(Person.objects.all()), 20)
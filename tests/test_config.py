@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, Mock
 
+from asgiref.sync import async_to_sync
 from django.core.paginator import EmptyPage, PageNotAnInteger
 from django.test import SimpleTestCase, TestCase
 
@@ -64,6 +65,22 @@ class ConfigTest(SimpleTestCase):
 
         table.paginator.page.assert_called_with(987)
 
+    def test_aconfigure(self):
+        class NameTable(Table):
+            name = Column()
+
+        table = NameTable([{"name": i} for i in range(30)])
+        request = build_request("/?page=5&sort=-name")
+
+        async_to_sync(RequestConfig(request, paginate={"per_page": 10}).aconfigure)(table)
+        # silent by default, the last page is shown
+        self.assertEqual(table.page.number, 3)
+        self.assertEqual(table.order_by, ("-name",))
+        self.assertIs(table.request, request)
+
+        with self.assertRaises(EmptyPage):
+            async_to_sync(RequestConfig(request, paginate={"silent": False}).aconfigure)(table)
+
     def test_passing_request_to_constructor(self):
         """Table constructor should call RequestConfig if a request is passed."""
         request = build_request("/?page=1&sort=abc")
@@ -1,16 +1,22 @@
 """Test the core table functionality."""
 
 import copy
+import datetime
 import itertools
+import json
+import tracemalloc
 
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connection
 from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils.translation import gettext_lazy, override
 
 import django_tables2 as tables
+from django_tables2.data import TableQuerysetData
 from django_tables2.tables import DeclarativeColumnsMetaclass
 
-from .app.models import Occupation, Person
+from .app.models import Occupation, Person, Region
 from .utils import build_request, parse
 
 request = build_request("/")
@@ -717,3 +723,237 @@ class RowAttrsTest(SimpleTestCase):
         html = table.as_html(request)
         td = parse(html).find(".//tbody/tr[1]/td[1]")
         self.assertEqual(td.attrib, {"data-column-name": "alpha"})
+
+
+class AsValuesChunkedTest(TestCase):
+    class PersonTable(tables.Table):
+        first_name = tables.Column()
+        last_name = tables.Column()
+        occupation = tables.Column()
+
+    def create_people(self, count):
+        occupation = Occupation.objects.create(name="Carpenter")
+        Person.objects.bulk_create(
+            Person(first_name=f"first {i}", last_name="x" * 100, occupation=occupation)
+            for i in range(count)
+        )
+
+    def peak_memory(self, values):
+        tracemalloc.start()
+        try:
+            for row in values:
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_same_values(self):
+        self.create_people(25)
+        queryset = Person.objects.select_related("occupation").order_by("-first_name")
+        self.assertEqual(
+            list(self.PersonTable(queryset).as_values(chunk_size=10)),
+            list(self.PersonTable(queryset.all()).as_values()),
+        )
+
+    def test_ordering_and_pinned_rows(self):
+        class Table(self.PersonTable):
+            def get_top_pinned_data(self):
+                return [{"first_name": "top"}]
+
+        self.create_people(5)
+        table = Table(Person.objects.all(), order_by="-first_name")
+        values = list(table.as_values(chunk_size=2))
+        self.assertEqual(
+            [row[0] for row in values],
+            ["First name", "top"] + [f"first {i}" for i in range(4, -1, -1)],
+        )
+
+    def test_memory_independent_of_size(self):
+        self.create_people(400)
+        small = self.peak_memory(
+            self.PersonTable(Person.objects.order_by("pk")[:100]).as_values(chunk_size=50)
+        )
+        chunked = self.peak_memory(
+            self.PersonTable(Person.objects.order_by("pk")).as_values(chunk_size=50)
+        )
+        unchunked = self.peak_memory(self.PersonTable(Person.objects.order_by("pk")).as_values())
+
+        self.assertLess(chunked, small * 2)
+        self.assertLess(chunked * 2, unchunked)
+
+
+class AsValuesFieldLookupTest(TestCase):
+    class PersonTable(tables.Table):
+        first_name = tables.Column()
+        last_name = tables.Column()
+        trans_test = tables.Column()
+        occupation = tables.Column(accessor="occupation__name", verbose_name="Occupation")
+        region = tables.Column(accessor="occupation__region__name", verbose_name="Region")
+
+    @classmethod
+    def setUpTestData(cls):
+        region = Region.objects.create(name="Zuid-Holland")
+        occupation = Occupation.objects.create(name="Carpenter", region=region)
+        for i in range(5):
+            Person.objects.create(
+                first_name=f"first {i}",
+                last_name=f"last {i}",
+                occupation=occupation if i % 2 else None,
+            )
+
+    def assertValues(self, table_class, num_queries, **kwargs):
+        queryset = Person.objects.order_by("-first_name")
+        with self.assertNumQueries(num_queries):
+            values = list(table_class(queryset).as_values(**kwargs))
+
+        # the same values as for a list of model instances, which are always processed per cell
+        self.assertEqual(values[1:], list(table_class(list(queryset)).as_values(**kwargs))[1:])
+        return values
+
+    def test_field_lookups(self):
+        data = TableQuerysetData(Person.objects.all())
+        self.assertEqual(data.get_field_lookup("first_name"), "first_name")
+        self.assertEqual(
+            data.get_field_lookup("occupation__region__name"), "occupation__region__name"
+        )
+        # relations, fields with choices or a custom descriptor, reverse relations and non-fields
+        self.assertIsNone(data.get_field_lookup("occupation"))
+        self.assertIsNone(data.get_field_lookup("occupation__boolean_with_choices"))
+        self.assertIsNone(data.get_field_lookup("friends__first_name"))
+        self.assertIsNone(data.get_field_lookup("region__name"))
+        self.assertIsNone(data.get_field_lookup("name"))
+        self.assertIsNone(data.get_field_lookup("foreign_key"))
+
+        self.assertIsNone(TableQuerysetData(Person.objects.values()).get_field_lookup("first_name"))
+
+    def test_all_field_columns(self):
+        values = self.assertValues(self.PersonTable, 1)
+        self.assertEqual(values[1], ["first 4", "last 4", None, None, None])
+        self.assertEqual(values[2], ["first 3", "last 3", None, "Carpenter", "Zuid-Holland"])
+
+        self.assertValues(self.PersonTable, 1, chunk_size=2)
+
+    def test_distinct_queryset(self):
+        class Table(tables.Table):
+            last_name = tables.Column()
+
+        Person.objects.update(last_name="same")
+        queryset = Person.objects.filter(first_name__startswith="first").distinct()
+        with self.assertNumQueries(1):
+            values = list(Table(queryset).as_values())
+        self.assertEqual(values[1:], [["same"]] * 5)
+
+    def test_exclude_columns(self):
+        class Table(self.PersonTable):
+            class Meta:
+                exclude = ("trans_test",)
+
+        with CaptureQueriesContext(connection) as context:
+            values = list(Table(Person.objects.all()).as_values(exclude_columns=("last_name",)))
+        self.assertEqual(values[0], ["First name", "Occupation", "Region"])
+        self.assertNotIn("last_name", context.captured_queries[0]["sql"])
+        self.assertNotIn("trans_test", context.captured_queries[0]["sql"])
+
+    def test_mixed_columns(self):
+        class Table(self.PersonTable):
+            name = tables.Column()
+            boolean = tables.BooleanColumn(accessor="occupation__boolean")
+
+            def value_first_name(self, value):
+                return value.upper()
+
+        # records, field values for each chunk and the occupation for each record with `boolean`
+        self.assertValues(Table, 1 + 1 + 2)
+        self.assertValues(Table, 1 + 3 + 2, chunk_size=2)
+
+    def test_pinned_rows(self):
+        class Table(self.PersonTable):
+            def get_top_pinned_data(self):
+                return [{"first_name": "top"}]
+
+            def get_bottom_pinned_data(self):
+                return [{"first_name": "bottom"}]
+
+        values = self.assertValues(Table, 1)
+        self.assertEqual([row[0] for row in (values[1], values[-1])], ["top", "bottom"])
+
+
+class AsJsonTest(SimpleTestCase):
+    class Table(tables.Table):
+        name = tables.Column(verbose_name="Full name")
+        country = tables.Column(orderable=False)
+        born = tables.DateColumn()
+        secret = tables.Column(visible=False, default="hidden")
+        buttons = tables.Column(exclude_from_export=True, empty_values=())
+
+        def value_name(self, value):
+            return value.upper()
+
+    DATA = [
+        {"name": "Adrian", "country": "Australia", "born": datetime.date(1990, 1, 2)},
+        {"name": "Audrey", "country": "Chile", "born": None},
+        {"name": "Bassie", "country": "Belgium", "born": datetime.date(1980, 3, 4)},
+    ]
+
+    def test_as_dicts(self):
+        table = self.Table(self.DATA, order_by="-name")
+        self.assertEqual(
+            list(table.as_dicts(exclude_columns=("born",))),
+            [
+                {"name": "BASSIE", "country": "Belgium"},
+                {"name": "AUDREY", "country": "Chile"},
+                {"name": "ADRIAN", "country": "Australia"},
+            ],
+        )
+
+        # only the rows of the current page
+        table.paginate(per_page=2, page=2)
+        self.assertEqual(
+            list(table.as_dicts()),
+            [{"name": "ADRIAN", "country": "Australia", "born": "1990-01-02"}],
+        )
+
+    def test_as_json(self):
+        table = self.Table(self.DATA, order_by="-name")
+        content = table.as_json()
+        self.assertIsInstance(next(content), str)
+        data = json.loads("".join(table.as_json()))
+        self.assertEqual(
+            data["columns"],
+            [
+                {"name": "name", "header": "Full name", "orderable": True},
+                {"name": "country", "header": "Country", "orderable": False},
+                {"name": "born", "header": "Born", "orderable": True},
+            ],
+        )
+        self.assertEqual(len(data["rows"]), 3)
+        self.assertEqual(
+            data["rows"][2], {"name": "ADRIAN", "country": "Australia", "born": "1990-01-02"}
+        )
+        # like as_values(), empty values are the default of the column
+        self.assertEqual(data["rows"][1]["born"], "—")
+        # columns with visible=False are not in the document
+        self.assertNotIn("hidden", "".join(table.as_json()))
+        self.assertIsNone(data["page"])
+        self.assertEqual(data["ordering"], ["-name"])
+
+    def test_as_json_paginated(self):
+        table = self.Table(self.DATA).paginate(per_page=2, page=2)
+        data = json.loads("".join(table.as_json()))
+        self.assertEqual(data["ordering"], [])
+        self.assertEqual(
+            data["page"],
+            {
+                "number": 2,
+                "per_page": 2,
+                "count": 3,
+                "count_is_estimated": False,
+                "num_pages": 2,
+                "next": None,
+                "previous": 1,
+            },
+        )
+
+        table = self.Table(self.DATA).paginate(paginator_class=tables.LazyPaginator, per_page=2)
+        page = json.loads("".join(table.as_json()))["page"]
+        self.assertEqual((page["count"], page["num_pages"], page["next"]), (None, None, 2))
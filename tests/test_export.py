@@ -1,25 +1,34 @@
+import gzip
 import json
+import multiprocessing
 import os
+import pickle
+from concurrent.futures import Future
 from datetime import date, datetime, time
+from io import BytesIO
 from tempfile import NamedTemporaryFile
 from unittest import skipIf
 
 import pytz
 import yaml
 from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, models
 from django.shortcuts import render
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase
 from openpyxl import load_workbook
 
 import django_tables2 as tables
 from django_tables2 import A
 from django_tables2.config import RequestConfig
+from django_tables2.data import TableIteratorData
 
 from .app.models import Occupation, Person, Region
 from .utils import build_request
 
 try:
     from django_tables2.export.export import TableExport
+    from django_tables2.export.parallel import TableSpec, export_chunk, parallel_as_values
+    from django_tables2.export.streaming import StreamingTableExport
     from django_tables2.export.views import ExportMixin
 except ImproperlyConfigured:
     TableExport = None
@@ -396,3 +405,318 @@ class UnicodeExportViewTest(TestCase):
         exporter = TableExport("xls", Table([]))
         # this would fail if the header contains unicode and string converstion is attempted.
         exporter.export()
+
+
+@skipIf(TableExport is None, "Tablib is required to run the export tests")
+class StreamingExportTest(TestCase):
+    class View(View):
+        export_streaming = True
+
+    def setUp(self):
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name)
+
+    def test_should_raise_error_for_unsupported_file_type(self):
+        with self.assertRaisesMessage(TypeError, 'Export format "xlsx" is not supported.'):
+            StreamingTableExport(table=Table([]), export_format="xlsx")
+
+    def test_same_output_as_table_export(self):
+        table = Table(Person.objects.all())
+        for export_format in ("csv", "tsv"):
+            exporter = StreamingTableExport(export_format, table)
+            self.assertEqual("".join(exporter.export()), TableExport(export_format, table).export())
+
+    def test_view_should_stream_csv(self):
+        response = self.View.as_view()(build_request("/?_export=csv"))
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="table.csv"')
+        self.assertEqual(response.getvalue().decode("utf8"), EXPECTED_CSV)
+
+    def test_view_should_stream_jsonl(self):
+        response = self.View.as_view()(build_request("/?_export=jsonl"))
+        self.assertTrue(response.streaming)
+        lines = response.getvalue().decode("utf8").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], EXPECTED_JSON)
+
+    def test_view_should_not_stream_other_formats(self):
+        response = self.View.as_view()(build_request("/?_export=json"))
+        self.assertFalse(response.streaming)
+        self.assertEqual(json.loads(response.getvalue().decode("utf8")), EXPECTED_JSON)
+
+        # jsonl is only available if streaming is enabled
+        response = View.as_view()(build_request("/?_export=jsonl"))
+        self.assertFalse(response.streaming)
+        self.assertNotIn("Content-Disposition", response)
+
+    def test_gzip(self):
+        class View(self.View):
+            export_gzip = True
+
+        response = View.as_view()(build_request("/?_export=csv"))
+        self.assertNotIn("Content-Encoding", response)
+
+        request = build_request("/?_export=csv")
+        request.META["HTTP_ACCEPT_ENCODING"] = "gzip, deflate"
+        response = View.as_view()(request)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(response.getvalue()).decode("utf8"), EXPECTED_CSV)
+
+    def test_rows_rendered_lazily(self):
+        rendered = []
+
+        class Table(tables.Table):
+            first_name = tables.Column()
+
+            def value_first_name(self, value):
+                rendered.append(value)
+                return value
+
+        response = StreamingTableExport("csv", Table(Person.objects.all())).response()
+        self.assertEqual(rendered, [])
+        content = iter(response)
+        next(content)  # headers
+        next(content)
+        self.assertEqual(rendered, ["Yildiz"])
+
+
+@skipIf(TableExport is None, "Tablib is required to run the export tests")
+class WriteOnlyXlsxExportTest(TestCase):
+    def setUp(self):
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name)
+        Person.objects.create(first_name="Multi\nline", last_name="Name")
+
+    def load(self, content):
+        workbook = load_workbook(BytesIO(content))
+        return workbook.worksheets[0]
+
+    def test_threshold(self):
+        class PersonTable(Table):
+            class Meta:
+                model = Person
+
+        table = PersonTable(Person.objects.all())
+        self.assertIsNotNone(TableExport("xlsx", table, xlsx_write_only_threshold=5).dataset)
+        self.assertIsNone(TableExport("xlsx", table, xlsx_write_only_threshold=4).dataset)
+        self.assertIsNotNone(TableExport("ods", table, xlsx_write_only_threshold=0).dataset)
+        self.assertIsNone(
+            TableExport("xlsx", Table(NAMES_LIST_OF_DICTS * 2), xlsx_write_only_threshold=6).dataset
+        )
+
+    def test_unknown_length(self):
+        table = Table(TableIteratorData(iter(NAMES_LIST_OF_DICTS)), orderable=False)
+        exporter = TableExport("xlsx", table, xlsx_write_only_threshold=0)
+        self.assertEqual(len(exporter.dataset), 3)
+        self.assertEqual(self.load(exporter.export())["A2"].value, "Yildiz")
+
+    def test_paginated_count_is_reused(self):
+        table = Table(Person.objects.all())
+        table.paginate(per_page=2)
+        with self.assertNumQueries(0):
+            self.assertIsNone(TableExport("xlsx", table, xlsx_write_only_threshold=4).dataset)
+
+    def test_same_content_as_tablib(self):
+        class PersonTable(Table):
+            class Meta:
+                model = Person
+
+        table = PersonTable(Person.objects.all())
+        tablib_sheet = self.load(TableExport("xlsx", table).export())
+        exporter = TableExport("xlsx", table, xlsx_write_only_threshold=0)
+        self.assertIsNone(exporter.dataset)
+        sheet = self.load(exporter.export())
+
+        self.assertEqual(sheet.title, tablib_sheet.title)
+        self.assertEqual(sheet.title, "People")
+        self.assertEqual(sheet.freeze_panes, "A2")
+        self.assertEqual(
+            list(sheet.iter_rows(values_only=True)), list(tablib_sheet.iter_rows(values_only=True))
+        )
+        self.assertTrue(sheet["A1"].font.bold)
+        self.assertFalse(sheet["A2"].font.bold)
+        self.assertTrue(sheet["A5"].alignment.wrap_text)
+
+    def test_response(self):
+        exporter = TableExport("xlsx", Table(Person.objects.all()), xlsx_write_only_threshold=0)
+        response = exporter.response(filename="people.xlsx")
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], TableExport.FORMATS["xlsx"])
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="people.xlsx"')
+
+        sheet = self.load(b"".join(response.streaming_content))
+        self.assertEqual(sheet.title, "Export Data")
+        self.assertEqual(sheet["A2"].value, "Yildiz")
+
+
+class ParallelTable(tables.Table):
+    first_name = tables.Column()
+    last_name = tables.Column()
+    occupation = tables.Column(accessor="occupation__name")
+
+    def value_first_name(self, value):
+        return value.upper()
+
+    def get_top_pinned_data(self):
+        return [{"first_name": "top"}]
+
+
+class FriendsTable(tables.Table):
+    first_name = tables.Column()
+    friends = tables.ManyToManyColumn(transform=lambda person: person.first_name)
+
+
+class PersonQuerySet(models.QuerySet):
+    pass
+
+
+class PicklingExecutor:
+    """Executor running in the current process, but pickling the arguments like a process pool."""
+
+    _max_workers = 1
+
+    def __init__(self):
+        self.calls = []
+        self.futures = []
+
+    def submit(self, fn, *args):
+        self.calls.append(args)
+        future = Future()
+        future.set_result(fn(*pickle.loads(pickle.dumps(args))))
+        self.futures.append(future)
+        return future
+
+
+@skipIf(TableExport is None, "Tablib is required to run the export tests")
+@skipIf(multiprocessing.get_start_method() != "fork", "Workers need to be forked")
+class ProcessPoolExportTest(TransactionTestCase):
+    """Export using the default executor, the workers read the data committed by the test."""
+
+    def test_default_executor(self):
+        if connection.vendor == "sqlite" and connection.is_in_memory_db():
+            self.skipTest("Workers can not share an in-memory database")
+
+        occupation = Occupation.objects.create(name="Carpenter")
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name, occupation=occupation)
+
+        table = ParallelTable(Person.objects.select_related("occupation"), order_by="last_name")
+        values = list(parallel_as_values(table, chunk_size=2))
+        self.assertEqual(values, list(table.as_values()))
+        self.assertEqual(values[2], ["GERARDO", "Castelein", "Carpenter"])
+
+
+@skipIf(TableExport is None, "Tablib is required to run the export tests")
+class ParallelExportTest(TestCase):
+    def setUp(self):
+        occupation = Occupation.objects.create(name="Carpenter")
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name, occupation=occupation)
+
+    def test_same_values_as_serial_export(self):
+        for kwargs in ({}, {"exclude_columns": ("occupation",)}):
+            table = ParallelTable(Person.objects.all(), order_by="-last_name")
+            executor = PicklingExecutor()
+            values = list(parallel_as_values(table, chunk_size=2, executor=executor, **kwargs))
+
+            self.assertEqual(values, list(table.as_values(**kwargs)))
+            self.assertEqual(values[1], ["TOP", None] + ([None] if not kwargs else []))
+            self.assertEqual(values[2][0], "YILDIZ")
+            self.assertEqual(len(executor.calls), 2)
+
+    def test_extra_columns_and_sequence(self):
+        table = ParallelTable(
+            Person.objects.all(),
+            order_by="last_name",
+            extra_columns=[("last_name2", tables.Column(accessor="last_name"))],
+            sequence=("last_name", "..."),
+        )
+        values = list(parallel_as_values(table, chunk_size=2, executor=PicklingExecutor()))
+        self.assertEqual(values, list(table.as_values()))
+        self.assertEqual(len(values[0]), 4)
+        self.assertEqual(values[2], ["Castelein", "GERARDO", "Carpenter", "Castelein"])
+
+    def test_max_pending(self):
+        class LazyFuture(Future):
+            """Future which only computes its result when it is requested."""
+
+            def __init__(self, fn):
+                super().__init__()
+                self.fn = fn
+
+            def result(self, timeout=None):
+                if not self.done():
+                    self.set_result(self.fn())
+                return super().result()
+
+        class Executor(PicklingExecutor):
+            def submit(self, fn, *args):
+                self.calls.append(args)
+                self.futures.append(LazyFuture(lambda: fn(*pickle.loads(pickle.dumps(args)))))
+                self.max_pending = max(
+                    getattr(self, "max_pending", 0),
+                    len([future for future in self.futures if not future.done()]),
+                )
+                return self.futures[-1]
+
+        table = ParallelTable(Person.objects.all())
+        executor = Executor()
+        values = list(parallel_as_values(table, chunk_size=1, executor=executor, max_pending=2))
+        self.assertEqual(values, list(table.as_values()))
+        self.assertEqual(len(executor.calls), 3)
+        self.assertEqual(executor.max_pending, 2)
+
+        # stopping the export cancels the submitted chunks
+        executor = Executor()
+        values = parallel_as_values(table, chunk_size=1, executor=executor)
+        self.assertEqual(len([next(values) for _ in range(3)]), 3)
+        values.close()
+        self.assertEqual(len(executor.calls), 2)
+        self.assertEqual([future.cancelled() for future in executor.futures], [False, True])
+
+    def test_prefetch_related(self):
+        yildiz, lindi, gerardo = Person.objects.order_by("pk")
+        yildiz.friends.add(lindi, gerardo)
+        lindi.friends.add(gerardo)
+
+        table = FriendsTable(
+            PersonQuerySet(model=Person).prefetch_related("friends"), order_by="first_name"
+        )
+        spec = pickle.loads(pickle.dumps(TableSpec(table)))
+        self.assertIsInstance(spec.get_queryset(), PersonQuerySet)
+        # one query for the people and one for all their friends
+        with self.assertNumQueries(2):
+            rows = export_chunk(spec, [gerardo.pk, lindi.pk, yildiz.pk])
+        self.assertEqual(
+            rows, [["Gerardo", None], ["Lindi", "Gerardo"], ["Yildiz", "Lindi, Gerardo"]]
+        )
+
+        values = list(parallel_as_values(table, executor=PicklingExecutor()))
+        self.assertEqual(values, list(table.as_values()))
+
+    def test_fallback(self):
+        executor = PicklingExecutor()
+        for data in (NAMES_LIST_OF_DICTS, Person.objects.all()[:2], Person.objects.values()):
+            table = ParallelTable(data)
+            values = list(parallel_as_values(table, executor=executor))
+            self.assertEqual(values, list(table.as_values()))
+        self.assertEqual(executor.calls, [])
+
+    def test_view(self):
+        executor = PicklingExecutor()
+
+        class View(ExportMixin, tables.SingleTableView):
+            table_class = ParallelTable
+            model = Person
+            export_parallel = True
+            export_executor = executor
+
+        response = View.as_view()(build_request("/?_export=csv"))
+        self.assertIn("YILDIZ,van der Kuil,Carpenter", response.getvalue().decode())
+        self.assertEqual(len(executor.calls), 1)
+
+        View.export_streaming = True
+        response = View.as_view()(build_request("/?_export=csv"))
+        self.assertIn("YILDIZ,van der Kuil,Carpenter", response.getvalue().decode())
+        self.assertEqual(len(executor.calls), 2)
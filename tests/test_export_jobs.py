@@ -0,0 +1,294 @@
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import InMemoryStorage
+from django.http import Http404
+from django.test import TestCase
+from django.utils import timezone
+
+import django_tables2 as tables
+from django_tables2.export import ExportJob, ExportJobMixin, ExportJobStatus, ThreadPoolRunner
+from django_tables2.export.jobs import file_response
+
+from .app.models import Person
+from .test_export import EXPECTED_CSV, NAMES, NAMES_LIST_OF_DICTS, Table
+from .utils import build_request
+
+
+class SynchronousRunner:
+    def submit(self, job):
+        self.job = job
+        job.run()
+
+
+class ExportJobTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.storage = InMemoryStorage()
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name)
+
+    def read(self, status):
+        with self.storage.open(status.name, "rb") as f:
+            return f.read().decode()
+
+    def test_run(self):
+        job = ExportJob(Table(Person.objects.all()), "csv", storage=self.storage)
+        self.assertEqual(job.status.state, ExportJobStatus.PENDING)
+        self.assertIsNone(job.status.progress)
+
+        status = job.run()
+        self.assertEqual(status.state, ExportJobStatus.FINISHED)
+        self.assertEqual((status.rows, status.total, status.progress), (3, 3, 1.0))
+        self.assertEqual(status.content_type, "text/csv; charset=utf-8")
+        self.assertEqual(self.read(status), EXPECTED_CSV)
+        self.assertEqual(job.status.as_dict(), status.as_dict())
+
+    def test_snapshot(self):
+        table = Table(Person.objects.all(), order_by="-first_name", exclude=("last_name",))
+        job = ExportJob(table, "csv", storage=self.storage)
+        # changes after creating the job are not exported
+        Person.objects.create(first_name="Zoë")
+        table.order_by = "first_name"
+
+        self.assertEqual(
+            self.read(job.run()).splitlines(), ["First name", "Zoë", "Yildiz", "Lindi", "Gerardo"]
+        )
+
+    def test_snapshot_columns(self):
+        table = Table(
+            Person.objects.all(),
+            order_by="first_name",
+            extra_columns=[("last_name2", tables.Column(accessor="last_name"))],
+            sequence=("last_name", "..."),
+        )
+        job = ExportJob(table, "csv", storage=self.storage)
+        self.assertEqual(
+            self.read(job.run()).splitlines()[:2],
+            ["Surname,First name,Surname", "Castelein,Gerardo,Castelein"],
+        )
+
+    def test_delete(self):
+        job = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage)
+        status = job.run()
+        self.assertTrue(self.storage.exists(status.name))
+
+        ExportJob.delete(job.id, storage=self.storage)
+        self.assertFalse(self.storage.exists(status.name))
+        self.assertIsNone(job.status)
+        # deleting an unknown job does nothing
+        ExportJob.delete(job.id, storage=self.storage)
+
+    def test_delete_expired(self):
+        old = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage).run()
+
+        job = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage, timeout=60)
+        with mock.patch(
+            "django_tables2.export.jobs.timezone.now",
+            return_value=timezone.now() + timedelta(seconds=30),
+        ):
+            status = job.run()
+        self.assertTrue(self.storage.exists(old.name))
+
+        job = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage, timeout=60)
+        with mock.patch(
+            "django_tables2.export.jobs.timezone.now",
+            return_value=timezone.now() + timedelta(seconds=90),
+        ):
+            new = job.run()
+        self.assertFalse(self.storage.exists(old.name))
+        self.assertFalse(self.storage.exists(status.name))
+        self.assertTrue(self.storage.exists(new.name))
+
+    def test_non_streaming_format(self):
+        status = ExportJob(Table(NAMES_LIST_OF_DICTS), "json", storage=self.storage).run()
+        self.assertEqual(status.state, ExportJobStatus.FINISHED)
+        self.assertEqual(status.content_type, "application/json")
+        self.assertEqual(len(json.loads(self.read(status))), 3)
+
+    def test_unsupported_format(self):
+        with self.assertRaisesMessage(TypeError, 'Export format "exe" is not supported.'):
+            ExportJob(Table([]), "exe")
+
+    def test_progress_and_cancel(self):
+        statuses = []
+
+        class CancellingTable(Table):
+            def value_first_name(self, value, record):
+                statuses.append(job.status)
+                if record["first_name"] == "Lindi":
+                    ExportJob.cancel(job.id)
+                return value
+
+        job = ExportJob(
+            CancellingTable(NAMES_LIST_OF_DICTS * 2), "jsonl", storage=self.storage, chunk_size=1
+        )
+        status = job.run()
+        self.assertEqual(status.state, ExportJobStatus.CANCELLED)
+        # cancelled while exporting the second row, which is checked after writing it
+        self.assertEqual([status.rows for status in statuses], [0, 1])
+        self.assertEqual(statuses[-1].progress, 1 / 6)
+        self.assertEqual(self.storage.listdir("")[1], [])
+
+        job = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage)
+        ExportJob.cancel(job.id)
+        self.assertEqual(job.run().state, ExportJobStatus.CANCELLED)
+
+    def test_failed(self):
+        class FailingTable(Table):
+            def value_last_name(self, value):
+                raise ValueError("Invalid name")
+
+        job = ExportJob(FailingTable(NAMES_LIST_OF_DICTS), "csv", storage=self.storage)
+        with self.assertRaises(ValueError):
+            job.run()
+        self.assertEqual(job.status.state, ExportJobStatus.FAILED)
+        self.assertEqual(job.status.error, "ValueError: Invalid name")
+
+    def test_thread_pool_runner(self):
+        job = ExportJob(Table(NAMES_LIST_OF_DICTS), "csv", storage=self.storage)
+        status = ThreadPoolRunner(max_workers=1).submit(job).result(timeout=10)
+        self.assertEqual(status.state, ExportJobStatus.FINISHED)
+        self.assertEqual(self.read(status).splitlines()[1:], EXPECTED_CSV.splitlines()[1:])
+
+
+class FileResponseTest(TestCase):
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        self.name = self.storage.save("export.csv", ContentFile(b"0123456789"))
+
+    def response(self, range_header=None):
+        request = build_request("/")
+        if range_header is not None:
+            request.META["HTTP_RANGE"] = range_header
+        return file_response(request, self.storage, self.name, filename="table.csv")
+
+    def test_full(self):
+        response = self.response()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"0123456789")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="table.csv"')
+
+    def test_ranges(self):
+        for range_header, content, content_range in (
+            ("bytes=4-", b"456789", "bytes 4-9/10"),
+            ("bytes=2-3", b"23", "bytes 2-3/10"),
+            ("bytes=8-20", b"89", "bytes 8-9/10"),
+            ("bytes=-3", b"789", "bytes 7-9/10"),
+        ):
+            with self.subTest(range_header):
+                response = self.response(range_header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(b"".join(response.streaming_content), content)
+                self.assertEqual(response["Content-Length"], str(len(content)))
+                self.assertEqual(response["Content-Range"], content_range)
+
+        # multiple or invalid ranges are ignored
+        for range_header in ("bytes=0-1,4-5", "items=1-2", "bytes=-"):
+            self.assertEqual(self.response(range_header).status_code, 200)
+
+    def test_unsatisfiable_range(self):
+        response = self.response("bytes=10-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+
+class ExportJobViewTest(TestCase):
+    class View(ExportJobMixin, tables.SingleTableView):
+        table_class = Table
+        model = Person
+        template_name = "django_tables2/table.html"
+        export_name = "people"
+
+    def setUp(self):
+        cache.clear()
+        for first_name, last_name in NAMES:
+            Person.objects.create(first_name=first_name, last_name=last_name)
+
+        self.runner = SynchronousRunner()
+        self.storage = InMemoryStorage()
+        self.view = self.View.as_view(export_runner=self.runner, export_storage=self.storage)
+
+    def test_export_job(self):
+        response = self.view(build_request("/?sort=first_name&_export=csv"))
+        self.assertEqual(response.status_code, 202)
+        data = json.loads(response.content)
+        # the synchronous runner finishes the job before responding
+        self.assertEqual(data["state"], "finished")
+        self.assertEqual(data["filename"], "people.csv")
+        self.assertEqual(data["url"], f"/?sort=first_name&_export_job={self.runner.job.id}")
+
+        response = self.view(build_request(data["url"]))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="people.csv"')
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().split("\r\n")[1:4],
+            ["Gerardo,Castelein", "Lindi,Hakvoort", "Yildiz,van der Kuil"],
+        )
+
+    def test_export_job_table_kwargs(self):
+        class View(self.View):
+            def get_table_kwargs(self):
+                return {
+                    "extra_columns": [("last_name2", tables.Column(accessor="last_name"))],
+                    "sequence": ("last_name", "..."),
+                }
+
+        view = View.as_view(export_runner=self.runner, export_storage=self.storage)
+        data = json.loads(view(build_request("/?sort=first_name&_export=csv")).content)
+        response = view(build_request(data["url"]))
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().split("\r\n")[:2],
+            ["Surname,First name,Surname", "Castelein,Gerardo,Castelein"],
+        )
+
+    def test_export_job_custom_table_kwargs(self):
+        class CustomTable(Table):
+            def __init__(self, *args, suffix, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.suffix = suffix
+
+            def value_last_name(self, value):
+                return value + self.suffix
+
+        class View(self.View):
+            table_class = CustomTable
+
+            def get_table_kwargs(self):
+                return {"suffix": "!", "order_by": "-first_name", "attrs": {"class": "people"}}
+
+        view = View.as_view(export_runner=self.runner, export_storage=self.storage)
+        data = json.loads(view(build_request("/?sort=first_name&_export=csv")).content)
+        self.assertEqual(data["state"], "finished")
+        self.assertEqual(self.runner.job.get_table().attrs["class"], "people")
+        response = view(build_request(data["url"]))
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().split("\r\n")[1:3],
+            ["Gerardo,Castelein!", "Lindi,Hakvoort!"],
+        )
+
+    def test_status_and_cancel(self):
+        job = ExportJob(Table(Person.objects.all()), "csv")
+
+        response = self.view(build_request(f"/?_export_job={job.id}"))
+        self.assertEqual(json.loads(response.content)["state"], "pending")
+
+        response = self.view(build_request(f"/?_export_job={job.id}&_cancel=1"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(job.run().state, ExportJobStatus.CANCELLED)
+
+        response = self.view(build_request(f"/?_export_job={job.id}"))
+        self.assertEqual(json.loads(response.content)["state"], "cancelled")
+
+    def test_unknown_job(self):
+        with self.assertRaises(Http404):
+            self.view(build_request("/?_export_job=unknown"))
+
+        job = ExportJob(Table(Person.objects.all()), "csv", owner=1)
+        with self.assertRaises(Http404):
+            self.view(build_request(f"/?_export_job={job.id}"))
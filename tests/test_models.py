@@ -637,3 +637,23 @@ class TableFactoryTest(TestCase):
 
         Table = tables.table_factory(Person, table=TableWithMeta)
         self.assertEqual(Table.Meta.fields, fields)
+
+    def test_factory_is_cached(self):
+        Table = tables.table_factory(Person, fields=["first_name"])
+        self.assertIs(tables.table_factory(Person, fields=("first_name",)), Table)
+        self.assertEqual(Table.Meta.fields, ("first_name",))
+
+        self.assertIsNot(tables.table_factory(Person), Table)
+        self.assertIsNot(tables.table_factory(Occupation, fields=["first_name"]), Table)
+        self.assertIsNot(tables.table_factory(Person, fields=["last_name"]), Table)
+        self.assertIsNot(tables.table_factory(Person, fields=["first_name"], localize=[]), Table)
+
+        class OtherTable(tables.Table):
+            pass
+
+        self.assertIsNot(tables.table_factory(Person, OtherTable, fields=["first_name"]), Table)
+
+    def test_factory_unhashable_arguments(self):
+        Table = tables.table_factory(Person, fields={"first_name"})
+        self.assertEqual(Table._meta.fields, {"first_name"})
+        self.assertIsNot(tables.table_factory(Person, fields={"first_name"}), Table)
@@ -1,7 +1,22 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connection
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+import django_tables2 as tables
+from django_tables2 import EstimatedCountPaginator, KeysetPaginator, LazyPaginator, RequestConfig
+from django_tables2.estimators import SampledEstimator, StatisticsEstimator
+from django_tables2.paginators import apage
+from django_tables2.templatetags.django_tables2 import table_page_range
 
-from django_tables2 import LazyPaginator
+from .app.models import Person
+from .utils import build_request, parse
 
 
 class FakeQuerySet:
@@ -81,3 +96,420 @@ class LazyPaginatorTest(TestCase):
         objects = list(range(1, 20))
         paginator = LazyPaginator(objects, 10, look_ahead=3)
         self.assertEqual(paginator.page(None).object_list, list(range(1, 11)))
+
+    def test_lookahead_probe(self):
+        for i in range(95):
+            Person.objects.create(first_name=f"first {i:02d}", last_name="last")
+        queryset = Person.objects.order_by("first_name")
+        table = tables.Table(queryset)
+        expected = LazyPaginator(list(queryset.all()), 10, look_ahead=3)
+
+        for number in (1, 7, 8, 9, 10):
+            paginator = LazyPaginator(table.rows, 10, look_ahead=3)
+            with CaptureQueriesContext(connection) as context:
+                page = paginator.page(number)
+
+            self.assertEqual(
+                [row.record for row in page.object_list], expected.page(number).object_list
+            )
+            self.assertEqual(paginator.num_pages, expected.num_pages)
+            self.assertEqual(paginator.is_last_page(number), expected.is_last_page(number))
+            if number < 10:
+                full_rows, probe = context.captured_queries
+                self.assertIn("last_name", full_rows["sql"])
+                self.assertNotIn("last_name", probe["sql"])
+            else:
+                # no need to probe if the current page is incomplete
+                self.assertEqual(len(context), 1)
+
+        # without look ahead, the extra row is fetched in the same query
+        with self.assertNumQueries(1):
+            LazyPaginator(queryset, 10).page(1)
+
+
+class AsyncPageTest(TestCase):
+    def setUp(self):
+        for i in range(25):
+            Person.objects.create(first_name=f"first {i:02d}", last_name="last")
+        self.queryset = Person.objects.order_by("first_name")
+
+    def names(self, page):
+        return [row.record.first_name for row in page.object_list]
+
+    async def test_paginator(self):
+        table = tables.Table(self.queryset)
+        paginator = Paginator(table.rows, 10)
+        page = await apage(paginator, 3)
+
+        self.assertEqual(paginator.count, 25)
+        self.assertEqual(self.names(page), [f"first {i}" for i in range(20, 25)])
+        # the records are fetched, iterating the page doesn't query the database.
+        self.assertIsInstance(page.object_list.data, list)
+
+        with self.assertRaises(EmptyPage):
+            await apage(paginator, 4)
+
+    async def test_lazy_paginator(self):
+        table = tables.Table(self.queryset)
+        paginator = LazyPaginator(table.rows, 10, look_ahead=2)
+        page = await apage(paginator, 2)
+
+        self.assertEqual(self.names(page), [f"first {i}" for i in range(10, 20)])
+        self.assertEqual(paginator.num_pages, 3)
+        with self.assertRaises(EmptyPage):
+            await paginator.apage(4)
+
+    async def test_sync_paginators(self):
+        # deferred join slicing and paginators without apage() are called in a thread.
+        class DeferredJoinTable(tables.Table):
+            class Meta:
+                pagination_strategy = "deferred_join"
+
+        table = DeferredJoinTable(self.queryset)
+        for paginator in (
+            Paginator(table.rows, 10),
+            LazyPaginator(table.rows, 10),
+            EstimatedCountPaginator(tables.Table(self.queryset).rows, 10),
+        ):
+            with self.subTest(type(paginator).__name__):
+                page = await apage(paginator, 2)
+                self.assertEqual(self.names(page), [f"first {i}" for i in range(10, 20)])
+
+    async def test_apaginate(self):
+        table = tables.Table(self.queryset)
+        await table.apaginate(per_page=20, page=2)
+        self.assertEqual(table.paginator.num_pages, 2)
+        self.assertEqual(len(table.page), 5)
+
+
+class KeysetPaginatorTest(TestCase):
+    class PersonTable(tables.Table):
+        first_name = tables.Column()
+        last_name = tables.Column()
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(23):
+            Person.objects.create(first_name=f"first {i % 4}", last_name=f"last {i % 3}")
+
+    def paginate_all(self, table, per_page=5):
+        """Follow the next-links until the last page, return the pks of each page."""
+        pages = []
+        cursor = None
+        while True:
+            page = KeysetPaginator(table.rows, per_page).page(cursor)
+            pages.append(page)
+            if not page.has_next():
+                return pages
+            cursor = page.next_page_number()
+
+    def pks(self, page):
+        return [row.record.pk for row in page.object_list]
+
+    def test_forward_matches_offset_pagination(self):
+        for order_by in (("first_name",), ("-first_name",), ("last_name", "-first_name")):
+            with self.subTest(order_by=order_by):
+                table = self.PersonTable(Person.objects.all(), order_by=order_by)
+                expected = list(
+                    table.data.data.order_by(*order_by, "pk").values_list("pk", flat=True)
+                )
+
+                pages = self.paginate_all(table)
+                self.assertEqual(len(pages), 5)
+                self.assertEqual([page.number for page in pages], [1, 2, 3, 4, 5])
+                self.assertEqual(sum((self.pks(page) for page in pages), []), expected)
+
+    def test_backwards(self):
+        table = self.PersonTable(Person.objects.all(), order_by=("last_name", "-first_name"))
+        pages = self.paginate_all(table)
+        paginator = KeysetPaginator(table.rows, 5)
+
+        page = pages[-1]
+        self.assertFalse(page.has_next())
+        for expected in reversed(pages[:-1]):
+            page = paginator.page(page.previous_page_number())
+            self.assertEqual(page.number, expected.number)
+            self.assertEqual(self.pks(page), self.pks(expected))
+        self.assertFalse(page.has_previous())
+        self.assertEqual(page.number, 1)
+
+    def test_pk_tie_breaker_is_added_once(self):
+        paginator = KeysetPaginator(Person.objects.all(), 5)
+        self.assertEqual(paginator.get_ordering(Person.objects.order_by("-pk")), ["-pk"])
+        self.assertEqual(
+            paginator.get_ordering(Person.objects.order_by("last_name")), ["last_name", "pk"]
+        )
+        # falls back to Meta.ordering
+        self.assertEqual(paginator.get_ordering(Person.objects.all()), ["pk"])
+
+    def test_invalid_cursor(self):
+        paginator = KeysetPaginator(Person.objects.all(), 5)
+        with self.assertRaisesMessage(PageNotAnInteger, "That page cursor is not valid"):
+            paginator.page("not-a-cursor")
+
+    def test_cursor_for_other_ordering(self):
+        queryset = Person.objects.order_by("first_name")
+        cursor = KeysetPaginator(queryset, 5).page(1).next_page_number()
+        self.assertEqual(len(KeysetPaginator(queryset, 5).page(cursor)), 5)
+
+        paginator = KeysetPaginator(Person.objects.order_by("birthdate"), 5)
+        with self.assertRaisesMessage(PageNotAnInteger, "That page cursor is not valid"):
+            paginator.page(cursor)
+
+    def test_cursor_with_invalid_values(self):
+        paginator = KeysetPaginator(Person.objects.order_by("pk"), 5)
+        for values in (["abc"], [None], [[1]], [1, 2]):
+            with self.subTest(values=values):
+                cursor = paginator.encode_cursor(2, paginator.NEXT, ["pk"], values)
+                with self.assertRaisesMessage(PageNotAnInteger, "That page cursor is not valid"):
+                    paginator.page(cursor)
+
+        paginator = KeysetPaginator(Person.objects.order_by("birthdate"), 5)
+        cursor = paginator.encode_cursor(2, paginator.NEXT, ["birthdate", "pk"], ["f2", 1])
+        with self.assertRaisesMessage(PageNotAnInteger, "That page cursor is not valid"):
+            paginator.page(cursor)
+
+    def test_sub_millisecond_datetimes(self):
+        start = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+        for i in range(7):
+            User.objects.create(
+                username=f"user {i}", date_joined=start + datetime.timedelta(microseconds=i)
+            )
+
+        queryset = User.objects.order_by("date_joined")
+        paginator = KeysetPaginator(queryset, 2)
+        pks, page = [], paginator.page(1)
+        while True:
+            pks.extend(record.pk for record in page.object_list)
+            if not page.has_next():
+                break
+            page = paginator.page(page.next_page_number())
+        self.assertEqual(pks, list(queryset.values_list("pk", flat=True)))
+
+    def test_offset_fallback(self):
+        Person.objects.filter(pk__in=Person.objects.order_by("pk")[:10]).update(
+            birthdate=datetime.date(2000, 1, 1)
+        )
+        orderings = (
+            ("birthdate",),
+            ("-birthdate", "first_name"),
+            (Lower("last_name"), "first_name"),
+            (F("first_name").desc(),),
+            ("occupation__name",),
+        )
+        for order_by in orderings:
+            with self.subTest(order_by=order_by):
+                queryset = Person.objects.order_by(*order_by)
+                self.assertIsNone(KeysetPaginator(queryset, 5).get_ordering(queryset))
+
+                table = self.PersonTable(queryset)
+                pages = self.paginate_all(table)
+                self.assertEqual(
+                    sum((self.pks(page) for page in pages), []),
+                    list(queryset.order_by(*order_by, "pk").values_list("pk", flat=True)),
+                )
+                self.assertEqual([page.number for page in pages], [1, 2, 3, 4, 5])
+
+                paginator = KeysetPaginator(table.rows, 5)
+                page = paginator.page(pages[-1].previous_page_number())
+                self.assertEqual(self.pks(page), self.pks(pages[-2]))
+
+    def test_null_value_in_seek_ordering(self):
+        # occupation_id is nullable, so this ordering uses OFFSET.
+        queryset = Person.objects.order_by("occupation")
+        self.assertIsNone(KeysetPaginator(queryset, 5).get_ordering(queryset))
+
+        # a NULL value for a non-nullable ordering (like an annotation) switches to OFFSET
+        paginator = KeysetPaginator(Person.objects.order_by("pk"), 5)
+        first = paginator.page(1)
+        with mock.patch.object(paginator, "get_values", return_value=[None]):
+            cursor = paginator.page(1).next_page_number()
+        self.assertEqual(paginator.decode_cursor(cursor)[1], paginator.OFFSET)
+        page = paginator.page(cursor)
+        self.assertEqual(page.number, 2)
+        self.assertEqual(
+            [record.pk for record in first.object_list + page.object_list],
+            list(Person.objects.order_by("pk").values_list("pk", flat=True)[:10]),
+        )
+
+    def test_request_config_nullable_column(self):
+        class PersonTable(self.PersonTable):
+            birthdate = tables.Column()
+
+        table = PersonTable(Person.objects.all())
+        RequestConfig(
+            build_request("/?sort=birthdate"),
+            paginate={"paginator_class": KeysetPaginator, "per_page": 10},
+        ).configure(table)
+        html = table.as_html(build_request("/?sort=birthdate"))
+        self.assertEqual(len(parse(html).xpath('//li[@class="next"]/a')), 1)
+
+    def test_num_pages(self):
+        paginator = KeysetPaginator(Person.objects.order_by("pk"), 10)
+        page = paginator.page(1)
+        self.assertEqual(paginator.num_pages, 2)
+        self.assertEqual((page.start_index(), page.end_index()), (1, 10))
+
+        page = paginator.page(paginator.page(page.next_page_number()).next_page_number())
+        self.assertEqual(page.number, 3)
+        self.assertEqual(paginator.num_pages, 3)
+        self.assertEqual((page.start_index(), page.end_index()), (21, 23))
+
+        with self.assertRaises(NotImplementedError):
+            paginator.count
+
+    def test_request_config(self):
+        table = self.PersonTable(Person.objects.all())
+        RequestConfig(
+            build_request("/?sort=-first_name"),
+            paginate={"paginator_class": KeysetPaginator, "per_page": 10},
+        ).configure(table)
+        self.assertEqual(table.page.number, 1)
+
+        html = table.as_html(build_request("/?sort=-first_name"))
+        next_link = parse(html).xpath('//li[@class="next"]/a')[0].attrib["href"]
+        self.assertEqual(len(parse(html).xpath('//ul[@class="pagination"]/li')), 1)
+
+        second = self.PersonTable(Person.objects.all())
+        RequestConfig(
+            build_request(next_link), paginate={"paginator_class": KeysetPaginator, "per_page": 10}
+        ).configure(second)
+        self.assertEqual(second.page.number, 2)
+        self.assertEqual(
+            [row.record.pk for row in second.page.object_list],
+            list(Person.objects.order_by("-first_name", "pk").values_list("pk", flat=True)[10:20]),
+        )
+
+        html = second.as_html(build_request(next_link))
+        self.assertEqual(len(parse(html).xpath('//li[@class="previous"]/a')), 1)
+
+    def test_request_config_invalid_cursor(self):
+        table = self.PersonTable(Person.objects.all())
+        RequestConfig(
+            build_request("/?page=garbage"), paginate={"paginator_class": KeysetPaginator}
+        ).configure(table)
+        self.assertEqual(table.page.number, 1)
+
+    def test_request_config_ordering_changed(self):
+        class PersonTable(self.PersonTable):
+            birthdate = tables.Column()
+
+        paginate = {"paginator_class": KeysetPaginator, "per_page": 10}
+        table = PersonTable(Person.objects.all())
+        RequestConfig(build_request("/?sort=first_name"), paginate=paginate).configure(table)
+        cursor = table.page.next_page_number()
+
+        # clicking the header of another column keeps the page cursor.
+        Person.objects.update(birthdate="2000-01-01")
+        table = PersonTable(Person.objects.all())
+        request = build_request(f"/?sort=birthdate&page={cursor}")
+        RequestConfig(request, paginate=paginate).configure(table)
+        self.assertEqual(table.page.number, 1)
+        self.assertEqual(
+            [row.record.pk for row in table.page.object_list],
+            list(Person.objects.order_by("birthdate", "pk").values_list("pk", flat=True)[:10]),
+        )
+
+
+class EstimatedCountPaginatorTest(TestCase):
+    class PersonTable(tables.Table):
+        first_name = tables.Column()
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(95):
+            Person.objects.create(first_name=f"first {i:02d}")
+
+    def paginate(self, estimate, page=1, **kwargs):
+        table = self.PersonTable(Person.objects.order_by("first_name"))
+        return table.paginate(
+            paginator_class=EstimatedCountPaginator,
+            per_page=10,
+            page=page,
+            estimator=lambda queryset: estimate,
+            **kwargs,
+        )
+
+    def test_exact_count_below_threshold(self):
+        table = self.paginate(estimate=50, exact_threshold=100)
+        self.assertFalse(table.paginator.is_estimated)
+        self.assertEqual(table.paginator.count, 95)
+        self.assertEqual(table.paginator.num_pages, 10)
+
+        table = self.paginate(estimate=None, exact_threshold=0)
+        self.assertFalse(table.paginator.is_estimated)
+        self.assertEqual(table.paginator.count, 95)
+
+    def test_estimated_count(self):
+        with self.assertNumQueries(1):
+            table = self.paginate(estimate=200, exact_threshold=100, page=2)
+        self.assertTrue(table.paginator.is_estimated)
+        self.assertEqual(table.paginator.count, 200)
+        self.assertEqual(table.paginator.num_pages, 20)
+        self.assertEqual(
+            [row.get_cell("first_name") for row in table.page.object_list],
+            [f"first {i}" for i in range(10, 20)],
+        )
+        self.assertEqual(
+            list(table_page_range(table.page, table.paginator)), [1, 2, 3, 4, 5, 6, 7, 8, "..."]
+        )
+
+        html = table.as_html(build_request())
+        self.assertIn("about 200 results", html)
+
+    def test_last_page_replaces_estimate(self):
+        table = self.paginate(estimate=200, exact_threshold=100, page=10)
+        self.assertEqual(len(table.page), 5)
+        self.assertFalse(table.page.has_next())
+        self.assertEqual(table.paginator.num_pages, 10)
+        self.assertEqual(table_page_range(table.page, table.paginator)[-1], 10)
+
+    def test_estimate_too_small(self):
+        table = self.paginate(estimate=60, exact_threshold=10, page=7)
+        self.assertTrue(table.page.has_next())
+        self.assertEqual(table.paginator.num_pages, 8)
+
+    def test_estimate_too_large(self):
+        table = self.PersonTable(Person.objects.order_by("first_name"))
+        RequestConfig(
+            build_request("/?page=15"),
+            paginate={
+                "paginator_class": EstimatedCountPaginator,
+                "per_page": 10,
+                "estimator": lambda queryset: 500,
+                "exact_threshold": 100,
+            },
+        ).configure(table)
+        # the silent EmptyPage handling shows the real last page
+        self.assertEqual(table.page.number, 10)
+
+    def test_non_queryset_data(self):
+        paginator = EstimatedCountPaginator(list(range(95)), 10, estimator=lambda queryset: 10**6)
+        self.assertFalse(paginator.is_estimated)
+        self.assertEqual(paginator.num_pages, 10)
+
+
+class EstimatorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(40):
+            Person.objects.create(first_name="even" if i % 2 else "odd")
+
+    def test_statistics_estimator_sqlite(self):
+        estimator = StatisticsEstimator()
+        self.assertIsNone(estimator(Person.objects.filter(first_name="even")))
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        self.assertEqual(estimator(Person.objects.all()), 40)
+        self.assertIsNone(estimator(Person.objects.filter(first_name="even")))
+
+    def test_sampled_estimator(self):
+        # fewer rows than the sample size results in an exact count
+        self.assertEqual(SampledEstimator()(Person.objects.filter(first_name="even")), 20)
+
+        estimator = SampledEstimator(sample_size=10, table_estimator=lambda queryset: 40)
+        self.assertEqual(estimator(Person.objects.filter(first_name="even")), 20)
+
+        estimator = SampledEstimator(sample_size=10, table_estimator=lambda queryset: None)
+        self.assertIsNone(estimator(Person.objects.filter(first_name="even")))
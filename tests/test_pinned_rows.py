@@ -50,6 +50,15 @@ class PinnedRowsTest(SimpleTestCase):
         self.assertIn("occupation", row)
         self.assertNotIn("gamma", row)
 
+    def test_bound_rows_iterator(self):
+        table = SimpleTable([{"name": "Grzegorz", "age": 30, "occupation": "programmer"}])
+
+        rows = list(table.rows.iterator(chunk_size=1))
+        self.assertEqual([type(row) for row in rows], [type(row) for row in table.rows])
+        self.assertEqual(
+            [row.get_cell("name") for row in rows], [row.get_cell("name") for row in table.rows]
+        )
+
     def test_as_html(self):
         """Ensure that as_html() renders correctly."""
         request = build_request("/")
@@ -0,0 +1,93 @@
+import json
+
+from django.template import Context, Template
+from django.test import TestCase, override_settings
+
+import django_tables2 as tables
+from django_tables2.profiling import profile_tables, table_profiled
+
+from .app.models import Person
+from .utils import build_request
+
+
+class PersonTable(tables.Table):
+    first_name = tables.Column(linkify=lambda record: f"/people/{record.pk}/")
+    last_name = tables.Column()
+
+    class Meta:
+        model = Person
+        fields = ("first_name", "last_name")
+
+    def render_last_name(self, value):
+        return value.upper()
+
+
+class ProfilingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            Person.objects.create(first_name=f"first {i}", last_name=f"last {i}")
+
+    def test_disabled_by_default(self):
+        table = PersonTable(Person.objects.all())
+        self.assertIsNone(table._profile)
+        table.as_html(build_request())
+
+    def test_profile_tables(self):
+        with profile_tables() as profiles:
+            table = PersonTable(Person.objects.all(), order_by="first_name")
+            table.paginate(per_page=2)
+        # rendering after the block is still profiled
+        table.as_html(build_request())
+
+        self.assertEqual(len(profiles), 1)
+        profile = profiles[0]
+        self.assertIs(profile, table._profile)
+        self.assertEqual(
+            list(profile.phases), ["ordering", "construction", "count", "fetch", "render"]
+        )
+        self.assertEqual(profile.phases["count"].calls, 1)
+
+        self.assertEqual(
+            {
+                name: {part: timing.calls for part, timing in parts.items()}
+                for name, parts in profile.columns.items()
+            },
+            {
+                "first_name": {"render": 2, "linkify": 2, "accessor": 2},
+                "last_name": {"render": 2, "accessor": 2},
+            },
+        )
+
+        data = json.loads(json.dumps(profile.as_dict()))
+        self.assertEqual(data["table"], "PersonTable")
+        self.assertEqual(data["phases"]["fetch"]["calls"], 1)
+        self.assertIn("last_name.render:", profile.report())
+
+    def test_fetch_before_render(self):
+        with profile_tables():
+            table = PersonTable(Person.objects.all()).paginate(per_page=2)
+        # the rows of the page are fetched once, before rendering
+        with self.assertNumQueries(1):
+            table.as_html(build_request())
+        self.assertEqual(table._profile.phases["fetch"].calls, 1)
+
+    @override_settings(DJANGO_TABLES2_PROFILING=True)
+    def test_setting_and_signal(self):
+        received = []
+
+        def receiver(sender, table, profile, **kwargs):
+            received.append((sender, table, profile))
+
+        table_profiled.connect(receiver)
+        try:
+            table = PersonTable(Person.objects.all())
+            Template("{% load django_tables2 %}{% render_table table %}").render(
+                Context({"request": build_request(), "table": table})
+            )
+        finally:
+            table_profiled.disconnect(receiver)
+
+        self.assertEqual(received, [(PersonTable, table, table._profile)])
+        self.assertEqual(table._profile.phases["render"].calls, 1)
+        self.assertEqual(table._profile.columns["last_name"]["render"].calls, 5)
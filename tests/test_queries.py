@@ -0,0 +1,84 @@
+import warnings
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+import django_tables2 as tables
+from django_tables2.queries import NPlusOneError, NPlusOneWarning, QueryDetector, suggest_lookup
+
+from .app.models import Occupation, Person, Region
+from .utils import build_request
+
+
+class PersonTable(tables.Table):
+    first_name = tables.Column()
+    occupation = tables.Column(accessor="occupation__name")
+    region = tables.Column(accessor="occupation__region__name", default="-")
+
+
+@override_settings(DEBUG=True, DJANGO_TABLES2_QUERY_DETECTION="warn")
+class QueryDetectorTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        region = Region.objects.create(name="Zuid-Holland")
+        for i in range(4):
+            occupation = Occupation.objects.create(name=f"occupation {i}", region=region)
+            Person.objects.create(first_name=f"first {i}", occupation=occupation)
+
+    def test_warns_for_related_columns(self):
+        table = PersonTable(Person.objects.all())
+        with self.assertWarns(NPlusOneWarning) as cm:
+            table.as_html(build_request())
+
+        messages = [str(warning.message) for warning in cm.warnings]
+        self.assertEqual(len(messages), 2)
+        self.assertIn(
+            "Column 'occupation' of PersonTable queried the database for 4 of 4 rows", messages[0]
+        )
+        self.assertIn('FROM "app_occupation" WHERE "app_occupation"."id" = %s', messages[0])
+        self.assertIn("Use select_related('occupation')", messages[0])
+        self.assertIn("Use select_related('occupation__region')", messages[1])
+
+    def test_no_warning_with_select_related(self):
+        table = PersonTable(Person.objects.select_related("occupation__region"))
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            html = table.as_html(build_request())
+        self.assertIn("Zuid-Holland", html)
+        self.assertEqual(table._query_detector.queries, {})
+
+    def test_threshold(self):
+        # two of four people don't have an occupation, so only half the rows query
+        Person.objects.filter(first_name__in=("first 0", "first 1")).update(occupation=None)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            PersonTable(Person.objects.all()).as_html(build_request())
+
+        with override_settings(DJANGO_TABLES2_QUERY_DETECTION_THRESHOLD=0.4):
+            with self.assertWarnsMessage(NPlusOneWarning, "2 of 4 rows"):
+                PersonTable(Person.objects.all()).as_html(build_request())
+
+    @override_settings(DJANGO_TABLES2_QUERY_DETECTION="raise")
+    def test_raise(self):
+        with self.assertRaisesMessage(NPlusOneError, "Column 'occupation'"):
+            PersonTable(Person.objects.all()).as_html(build_request())
+
+    @override_settings(DEBUG=False)
+    def test_debug_only(self):
+        table = PersonTable(Person.objects.all())
+        self.assertIsNone(table._query_detector)
+        table.as_html(build_request())
+
+    def test_invalid_action(self):
+        with self.assertRaises(ImproperlyConfigured):
+            QueryDetector(PersonTable([]), action="ignore")
+
+    def test_suggest_lookup(self):
+        self.assertEqual(suggest_lookup(Person, "occupation__name"), "select_related('occupation')")
+        self.assertEqual(suggest_lookup(Person, "friends"), "prefetch_related('friends')")
+        self.assertEqual(
+            suggest_lookup(Region, "mayor__friends__occupation"),
+            "prefetch_related('mayor__friends__occupation')",
+        )
+        self.assertIsNone(suggest_lookup(Person, "first_name"))
+        self.assertIsNone(suggest_lookup(None, "occupation"))
@@ -21,6 +21,35 @@ class RowsTest(SimpleTestCase):
             records.append(row.record)
         self.assertEqual(records, data)
 
+    def test_bound_rows_reuse_row(self):
+        class SimpleTable(tables.Table):
+            name = tables.Column()
+
+            def get_top_pinned_data(self):
+                return [{"name": "Pinned"}]
+
+        data = [{"name": "Bradley"}, {"name": "Chris"}, {"name": "Davina"}]
+        table = SimpleTable(data)
+
+        rows = []
+        for row in table.rows.iterator(reuse_row=True):
+            rows.append(row)
+            self.assertEqual(row.get_cell("name"), row.record["name"])
+            self.assertEqual(row.get_even_odd_css_class(), "odd" if row.row_counter % 2 else "even")
+
+        # the pinned row is not reused, one row object is used for the other records
+        self.assertIsInstance(rows[0], tables.rows.BoundPinnedRow)
+        self.assertIs(rows[1], rows[3])
+        self.assertEqual(rows[3].record, data[2])
+        self.assertEqual(rows[3].row_counter, 3)
+
+    def test_bound_row_slots(self):
+        table = tables.Table([{}])
+        row = table.rows[0]
+        # rows and their cell accessors don't have an instance __dict__
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertEqual(tables.rows.CellAccessor.__slots__, ("row",))
+
     def test_bound_row(self):
         class SimpleTable(tables.Table):
             name = tables.Column()
@@ -75,6 +104,31 @@ class RowsTest(SimpleTestCase):
         with self.assertRaises(KeyError):
             row.cells["gamma"]
 
+    def test_static_row_attrs(self):
+        """Static row attrs are rendered like attrs computed from callables."""
+        for row_attrs in (
+            {},
+            {"class": "row", "id": "x"},
+            {"id": "x", "class": "", "data-y": "<y>"},
+            {"id": "x", "class": None, "title": None},
+        ):
+            with self.subTest(row_attrs):
+                # callables (without arguments) returning the same values
+                dynamic_attrs = {
+                    key: (lambda value: lambda: value)(value) for key, value in row_attrs.items()
+                }
+                static = tables.Table([{}, {}], row_attrs=row_attrs, pinned_row_attrs=row_attrs)
+                dynamic = tables.Table(
+                    [{}, {}], row_attrs=dynamic_attrs, pinned_row_attrs=dynamic_attrs
+                )
+                for static_row, dynamic_row in zip(static.rows, dynamic.rows):
+                    self.assertEqual(static_row.attrs, dynamic_row.attrs)
+                    self.assertEqual(static_row.attrs.as_html(), dynamic_row.attrs.as_html())
+
+                pinned_row = tables.rows.BoundPinnedRow({}, table=static)
+                dynamic_pinned_row = tables.rows.BoundPinnedRow({}, table=dynamic)
+                self.assertEqual(pinned_row.attrs.as_html(), dynamic_pinned_row.attrs.as_html())
+
     def test_row_attrs(self):
         """If a callable returns an empty string, do not add a space to the CSS class attribute (#416)."""
         counter = count()
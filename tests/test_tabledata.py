@@ -1,11 +1,13 @@
 import warnings
+from unittest import mock
 
 from django.test import TestCase
 
-from django_tables2 import Table
-from django_tables2.data import TableData, TableListData, TableQuerysetData
+import django_tables2 as tables
+from django_tables2 import LazyPaginator, RequestConfig, Table
+from django_tables2.data import TableData, TableIteratorData, TableListData, TableQuerysetData
 
-from .app.models import Person, PersonProxy, Region
+from .app.models import Occupation, Person, PersonProxy, Region
 from .utils import build_request
 
 
@@ -155,3 +157,227 @@ class TableQuerysetDataTest(TestCase):
         html = table.as_html(build_request())
         self.assertIn("first 18", html)
         self.assertIn("first 10", html)
+
+    def test_iterator(self):
+        for i in range(5):
+            person = Person.objects.create(first_name=f"first {i}")
+            person.friends.add(person)
+
+        data = TableQuerysetData(Person.objects.prefetch_related("friends").order_by("-pk"))
+        # one query for the records, one prefetch query for each chunk of 2 records
+        with self.assertNumQueries(4):
+            records = list(data.iterator(chunk_size=2))
+        self.assertEqual(
+            [record.first_name for record in records], [f"first {i}" for i in range(4, -1, -1)]
+        )
+        # prefetch_related is applied for each chunk, not kept in the result cache.
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [list(record.friends.all()) for record in records], [[r] for r in records]
+            )
+        self.assertIsNone(data.data._result_cache)
+
+        # an evaluated QuerySet is not fetched again
+        list(data.data)
+        with self.assertNumQueries(0):
+            self.assertEqual(list(data.iterator()), records)
+
+    def test_ordering(self):
+        class MyTable(Table):
+            first_name = tables.Column()
+            last_name = tables.Column()
+            name = tables.Column(order_by=("last_name", "first_name"))
+
+        self.assertEqual(MyTable(Person.objects.all()).order_by, None)
+        table = MyTable(Person.objects.order_by("-first_name"))
+        self.assertEqual(table.order_by, ("-first_name",))
+        table = MyTable(Person.objects.order_by("last_name", "first_name"))
+        self.assertEqual(table.order_by, ("last_name", "first_name"))
+        table = MyTable(Person.objects.order_by("-last_name", "-first_name", "last_name"))
+        self.assertEqual(table.order_by, ("-name", "last_name"))
+        # the ordering can't be expressed using the columns
+        table = MyTable(Person.objects.order_by("pk"))
+        self.assertEqual(table.order_by, None)
+
+    def test_ordering_is_cached(self):
+        class MyTable(Table):
+            first_name = tables.Column()
+            last_name = tables.Column()
+
+        queryset = Person.objects.order_by("last_name", "-first_name")
+        MyTable(queryset)
+        with mock.patch("django_tables2.data.segment", side_effect=AssertionError) as segment:
+            table = MyTable(queryset)
+        segment.assert_not_called()
+        self.assertEqual(table.order_by, ("last_name", "-first_name"))
+
+        # different columns of the same table class are not served from the cache
+        table = MyTable(queryset, exclude=("first_name",))
+        self.assertEqual(table.order_by, None)
+
+    async def test_acount(self):
+        for i in range(3):
+            await Person.objects.acreate(first_name=f"first {i}")
+
+        # non-paginated tables evaluate the QuerySet, which is used for rendering.
+        table = Table(Person.objects.all())
+        self.assertEqual(await table.data.acount(), 3)
+        self.assertEqual(len(table.data.data._result_cache), 3)
+
+        table = Table(Person.objects.all())
+        table.paginator = None
+        self.assertEqual(await table.data.acount(), 3)
+        self.assertIsNone(table.data.data._result_cache)
+        # the count is cached
+        self.assertEqual(len(table.data), 3)
+
+    def test_list_data_iterator(self):
+        data = TableListData([{"name": "a"}, {"name": "b"}])
+        self.assertEqual(list(data.iterator(chunk_size=1)), data.data)
+
+
+class TableIteratorDataTest(TestCase):
+    class CountingGenerator:
+        def __init__(self, max_value):
+            self.consumed = 0
+            self.max_value = max_value
+
+        def __iter__(self):
+            for record in generator(self.max_value):
+                self.consumed += 1
+                yield record
+
+    def test_slicing_consumes_only_needed_records(self):
+        source = self.CountingGenerator(1000)
+        data = TableIteratorData(source)
+
+        self.assertEqual([r["foo"] for r in data[10:15]], [10, 11, 12, 13, 14])
+        self.assertEqual(source.consumed, 15)
+        self.assertEqual(data[20]["foo"], 20)
+        self.assertEqual(source.consumed, 21)
+
+        with self.assertRaisesMessage(ValueError, "have already been consumed"):
+            data[0:5]
+
+    def test_slicing_past_the_end(self):
+        data = TableIteratorData(generator(10))
+        self.assertEqual([r["foo"] for r in data[8:20]], [8, 9])
+        self.assertEqual(data[20:30], [])
+        with self.assertRaises(IndexError):
+            data[40]
+
+    def test_length_is_unknown(self):
+        data = TableIteratorData(generator(10))
+        with self.assertRaisesMessage(TypeError, "paginate it using LazyPaginator"):
+            len(data)
+
+    def test_lazy_paginator(self):
+        class Table(tables.Table):
+            foo = tables.Column()
+
+        source = self.CountingGenerator(10**6)
+        table = Table(TableIteratorData(source), orderable=False)
+        table.paginate(paginator_class=LazyPaginator, per_page=10, page=3)
+
+        self.assertEqual(
+            [row.get_cell("foo") for row in table.page.object_list], list(range(20, 30))
+        )
+        self.assertEqual(table.paginator.num_pages, 4)
+        # offset + per_page * look_ahead + 1
+        self.assertEqual(source.consumed, 31)
+
+        html = table.as_html(build_request())
+        self.assertIn("<td >25</td>", html)
+
+    def test_as_values_streams(self):
+        class Table(tables.Table):
+            foo = tables.Column()
+
+        source = self.CountingGenerator(100)
+        values = Table(TableIteratorData(source), orderable=False).as_values()
+        self.assertEqual(next(values), ["Foo"])
+        self.assertEqual(next(values), [0])
+        self.assertEqual(source.consumed, 1)
+        self.assertEqual(len(list(values)), 99)
+
+    def test_ordering_is_ignored(self):
+        class Table(tables.Table):
+            foo = tables.Column()
+            bar = tables.Column(accessor="foo", orderable=True)
+
+        with self.assertRaisesMessage(ValueError, "can not be ordered"):
+            TableIteratorData(generator(10)).order_by(("foo",))
+
+        table = Table(TableIteratorData(generator(10)), order_by="foo")
+        self.assertEqual(table.order_by, ())
+        self.assertFalse(table.orderable)
+        self.assertFalse(table.columns["bar"].orderable)
+
+        # orderings from the querystring don't break rendering
+        request = build_request("/?sort=-bar")
+        table = Table(TableIteratorData(generator(10)))
+        RequestConfig(request, paginate={"paginator_class": LazyPaginator}).configure(table)
+        self.assertEqual(table.order_by, ())
+        html = table.as_html(request)
+        self.assertIn("<td >0</td>", html)
+        self.assertNotIn("sort=", html)
+
+
+class DeferredJoinTest(TestCase):
+    class PersonTable(Table):
+        first_name = tables.Column()
+        occupation = tables.Column(accessor="occupation__name")
+
+        class Meta:
+            pagination_strategy = "deferred_join"
+
+    @classmethod
+    def setUpTestData(cls):
+        occupation = Occupation.objects.create(name="Programmer")
+        for i in range(30):
+            Person.objects.create(first_name=f"first {i:02d}", occupation=occupation)
+
+    def test_pages_match_offset_strategy(self):
+        queryset = Person.objects.select_related("occupation")
+        for page in (1, 2, 3):
+            with self.subTest(page=page):
+                table = self.PersonTable(queryset, order_by="-first_name")
+                table.paginate(page=page, per_page=10)
+
+                expected = list(
+                    queryset.order_by("-first_name").values_list("pk", flat=True)[
+                        (page - 1) * 10 : page * 10
+                    ]
+                )
+                self.assertEqual([row.record.pk for row in table.page.object_list], expected)
+
+    def test_queries(self):
+        table = self.PersonTable(Person.objects.select_related("occupation"), order_by="first_name")
+        with self.assertNumQueries(3):
+            # count, pk query and the query for the full rows (with joined occupation)
+            table.paginate(page=2, per_page=10)
+
+        with self.assertNumQueries(0):
+            cells = [row.get_cell("occupation") for row in table.page.object_list]
+        self.assertEqual(cells, ["Programmer"] * 10)
+
+    def test_lazy_paginator(self):
+        table = self.PersonTable(Person.objects.all(), order_by="first_name")
+        table.paginate(paginator_class=LazyPaginator, page=3, per_page=10)
+        self.assertEqual(
+            [row.get_cell("first_name") for row in table.page.object_list],
+            [f"first {i}" for i in range(20, 30)],
+        )
+
+    def test_values_queryset_uses_offset(self):
+        table = self.PersonTable(Person.objects.values("pk", "first_name"), order_by="first_name")
+        table.paginate(page=2, per_page=10)
+        self.assertEqual(table.page.object_list.data[0]["first_name"], "first 10")
+
+    def test_invalid_strategy(self):
+        message = "Table.pagination_strategy = 'keyset', but must be one of (offset, deferred_join)"
+        with self.assertRaisesMessage(ValueError, message):
+
+            class Table(tables.Table):
+                class Meta:
+                    pagination_strategy = "keyset"
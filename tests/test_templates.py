@@ -104,6 +104,44 @@ class TemplateTest(TestCase):
         assert result == template.render(context)
 
 
+class FragmentTest(SimpleTestCase):
+    def fragment(self, table, uri="/?_fragment=1"):
+        html = table.as_fragment(build_request(uri))
+        return html, parse(f"<table><tbody>{html}</tbody></table>")
+
+    def test_as_fragment(self):
+        table = CountryTable(MEMORY_DATA).paginate(per_page=3)
+        html, root = self.fragment(table)
+        self.assertNotIn("<thead", html)
+        self.assertEqual(len(root.findall(".//tr")), 4)
+        self.assertEqual(root.find(".//tr/td").text, "Germany")
+        self.assertEqual(root.find(".//tr[@class='next-page']/td").get("colspan"), "4")
+        self.assertEqual(
+            root.find(".//tr[@class='next-page']/td/a").get("href"), "?_fragment=1&page=2"
+        )
+
+        # no link on the last page
+        table = CountryTable(MEMORY_DATA).paginate(per_page=3, page=2)
+        html, root = self.fragment(table)
+        self.assertEqual([tr.find("td").text for tr in root.findall(".//tr")], ["Austria"])
+
+        # not paginated
+        html, root = self.fragment(CountryTable(MEMORY_DATA))
+        self.assertEqual(len(root.findall(".//tr")), 4)
+
+    def test_template_inheritance(self):
+        table = CountryTable(MEMORY_DATA, template_name="custom_row.html").paginate(per_page=2)
+        html, root = self.fragment(table)
+        self.assertIn("<!-- Germany -->", html)
+        self.assertIn("<!-- France -->", html)
+        self.assertEqual(len(root.findall(".//tr")), 3)
+
+    def test_block_not_found(self):
+        table = CountryTable(MEMORY_DATA, template_name="minimal.html")
+        with self.assertRaisesMessage(ValueError, "Block 'table.tbody.row' not found"):
+            table.as_fragment(build_request())
+
+
 class TestQueries(TestCase):
     def test_as_html_db_queries(self):
         class PersonTable(tables.Table):
@@ -1,9 +1,12 @@
+from unittest import mock
 from urllib.parse import parse_qs
 
 from django.core.exceptions import ImproperlyConfigured
 from django.core.paginator import Paginator
 from django.template import Context, RequestContext, Template, TemplateSyntaxError
 from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils.html import escape
+from django.utils.http import urlencode
 
 from django_tables2 import LazyPaginator, RequestConfig, Table, TemplateColumn
 from django_tables2.export import ExportMixin
@@ -193,6 +196,38 @@ class QuerystringReplaceTagTest(SimpleTestCase):
         qs = parse_qs(url[1:])  # trim the ?
         self.assertEqual(set(qs.keys()), {"c"})
 
+    def test_single_parameter(self):
+        template = Template(
+            '{% load django_tables2 %}{% querystring_replace key="x y" %} '
+            "{% querystring_replace key=value %}"
+        )
+        for querystring in ("", "a=1&b=2&a=3", "b=1&c=%C3%A9", "b=", "sort=a&page=2&b=4&b=5"):
+            request = build_request(f"/?{querystring}")
+            for key, value in (("a", "z"), ("b", 3), ("page", ["1", "2"]), ("new", "&")):
+                with self.subTest(querystring=querystring, key=key):
+                    expected = []
+                    for replacement in ("x y", value):
+                        params = dict(request.GET)
+                        params[key] = replacement
+                        expected.append(escape("?" + urlencode(params, doseq=True)))
+
+                    context = Context({"request": request, "key": key, "value": value})
+                    self.assertEqual(template.render(context), " ".join(expected))
+
+    def test_single_parameter_cache(self):
+        table = CountryTable(MEMORY_DATA, order_by="name").paginate(per_page=1)
+        request = build_request("/?foo=bar&baz=qux")
+        template = Template("{% load django_tables2 %}{% render_table table %}")
+
+        with mock.patch(
+            "django_tables2.templatetags.django_tables2.urlencode", wraps=urlencode
+        ) as patched:
+            template.render(Context({"request": request, "table": table}))
+        # the parameters around sort and page are encoded once, the parameter once for each
+        # link: 3 orderable columns, 4 pages and the next page.
+        links = 3 + 4 + 1
+        self.assertEqual(patched.call_count, 2 * 2 + links)
+
     def test_querystring_replace_syntax_error(self):
         with self.assertRaisesMessage(
             TemplateSyntaxError, "Malformed arguments to 'querystring_replace'"
@@ -0,0 +1,66 @@
+from django.test import TestCase
+
+import django_tables2 as tables
+from django_tables2.testing import (
+    TableTestCase,
+    assert_table_query_budget,
+    capture_table_queries,
+    get_export_formats,
+)
+
+from .app.models import Occupation, Person
+
+
+class PersonTable(tables.Table):
+    first_name = tables.Column()
+    occupation = tables.Column(accessor="occupation__name")
+
+    def render_occupation(self, value):
+        return value.upper()
+
+
+class TableQueryBudgetTest(TableTestCase, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(3):
+            occupation = Occupation.objects.create(name=f"occupation {i}")
+            Person.objects.create(first_name=f"first {i}", occupation=occupation)
+
+    def test_capture_table_queries(self):
+        queries = capture_table_queries(
+            PersonTable(Person.objects.all()), export_formats=("csv", "jsonl")
+        )
+        self.assertEqual(
+            queries.counts(), {"html": 4, "values": 5, "export_csv": 5, "export_jsonl": 5}
+        )
+        self.assertEqual(queries.rows["html"], 3)
+        self.assertIn('FROM "app_occupation"', queries.phases["html"][1])
+        # plain model fields are exported using values_list()
+        self.assertIn('"app_person"."first_name" AS "first_name"', queries.phases["values"][1])
+
+    def test_paginated(self):
+        table = PersonTable(Person.objects.select_related("occupation"))
+        table.paginate(per_page=2)
+        queries = capture_table_queries(table, export_formats=())
+        self.assertEqual(queries.counts(), {"html": 1, "values": 2})
+        self.assertEqual(queries.rows, {"html": 2, "values": 3})
+
+    def test_budget(self):
+        table = PersonTable(Person.objects.select_related("occupation"))
+        queries = assert_table_query_budget(table, max_queries=3)
+        self.assertEqual(
+            set(queries.phases), {"html", "values"} | {f"export_{f}" for f in get_export_formats()}
+        )
+
+        assert_table_query_budget(PersonTable(Person.objects.all()), max_queries=3, per_row=1)
+
+        message = "PersonTable executed more queries than its budget of 1:\nhtml: 4 queries for 3 rows\n    1. SELECT"
+        with self.assertRaisesMessage(AssertionError, message):
+            assert_table_query_budget(PersonTable(Person.objects.all()), max_queries=1)
+
+    def test_assert_table_query_budget(self):
+        self.assertTableQueryBudget(PersonTable(Person.objects.select_related("occupation")), 3)
+        with self.assertRaisesMessage(self.failureException, "budget of 0 + 1 per row"):
+            self.assertTableQueryBudget(
+                PersonTable(Person.objects.all()), max_queries=0, per_row=1, export_formats=()
+            )
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 from django.db import models
 from django.test import TestCase
 
@@ -164,6 +167,22 @@ class AccessorModelTests(TestCase):
 
 
 class AttributeDictTest(TestCase):
+    def test_copies_do_not_share_cache(self):
+        for copy_func in (
+            copy.copy,
+            copy.deepcopy,
+            lambda attrs: pickle.loads(pickle.dumps(attrs)),
+        ):
+            with self.subTest(copy_func=copy_func):
+                attrs = AttributeDict({"class": "a", "id": "x"})
+                self.assertEqual(attrs.as_html(), 'class="a" id="x"')
+                other = copy_func(attrs)
+                self.assertIsNot(other._cache, attrs._cache)
+                other["class"] = "b"
+                self.assertEqual(other.as_html(), 'class="b" id="x"')
+                self.assertEqual(attrs.as_html(), 'class="a" id="x"')
+                self.assertEqual(list(other.items()), [("class", "b"), ("id", "x")])
+
     def test_handles_escaping(self):
         self.assertEqual(
             AttributeDict({"x": "\"'x&"}).as_html(),
@@ -178,6 +197,46 @@ class AttributeDictTest(TestCase):
 
         self.assertEqual(x, AttributeDict(x))
 
+    def test_cached_html(self):
+        attrs = AttributeDict({"id": "foo", "class": "bar"})
+        self.assertEqual(attrs.as_html(), 'id="foo" class="bar"')
+        self.assertIs(attrs.as_html(), attrs.as_html())
+
+        # modifying the dict invalidates the cache
+        attrs["id"] = "baz"
+        self.assertEqual(attrs.as_html(), 'id="baz" class="bar"')
+        attrs.update({"title": "x"})
+        self.assertEqual(attrs.as_html(), 'id="baz" class="bar" title="x"')
+        attrs.move_to_end("id")
+        self.assertEqual(attrs.as_html(), 'class="bar" title="x" id="baz"')
+        attrs.pop("class")
+        del attrs["title"]
+        self.assertEqual(attrs.as_html(), 'id="baz"')
+        attrs.setdefault("lang", "nl")
+        attrs |= {"dir": "ltr"}
+        self.assertEqual(attrs.as_html(), 'id="baz" lang="nl" dir="ltr"')
+        attrs.popitem()
+        self.assertEqual(attrs.as_html(), 'id="baz" lang="nl"')
+        attrs.clear()
+        self.assertEqual(attrs.as_html(), "")
+
+    def test_callables_not_cached(self):
+        values = iter(["a", "b"])
+        attrs = AttributeDict({"id": lambda: next(values)})
+        self.assertEqual(attrs.as_html(), 'id="a"')
+        self.assertEqual(attrs.as_html(), 'id="b"')
+
+    def test_with_class(self):
+        attrs = AttributeDict({"id": "foo", "class": "bar", "data-x": "<"})
+        copy = attrs.with_class("bar odd")
+        self.assertEqual(copy, {"id": "foo", "class": "bar odd", "data-x": "<"})
+        self.assertEqual(copy.as_html(), 'id="foo" class="bar odd" data-x="&lt;"')
+        self.assertEqual(attrs["class"], "bar")
+
+        self.assertEqual(
+            AttributeDict({"id": "foo"}).with_class("a&b").as_html(), 'id="foo" class="a&amp;b"'
+        )
+
 
 class ComputedValuesTest(TestCase):
     def test_supports_shallow_structures(self):
@@ -204,6 +263,17 @@ class SegmentTest(TestCase):
             ("x", "z"),
         }
 
+    def test_order_of_candidates(self):
+        aliases = {"x": "a", "-z": ("b", "-c"), "y": ("b", "-c")}
+        self.assertEqual(list(segment(("a", "-b", "c"), aliases)), [("x", "z"), ("x", "-y")])
+        self.assertEqual(list(segment(("a", "d"), aliases)), [])
+        self.assertEqual(list(segment((), {})), [])
+
+    def test_many_aliases(self):
+        aliases = {f"c{i}": (f"c{i}",) for i in range(500)}
+        sequence = tuple(f"-c{i}" for i in range(499, -1, -1))
+        self.assertEqual(next(segment(sequence, aliases)), sequence)
+
 
 class SequenceTest(TestCase):
     def test_multiple_ellipsis(self):
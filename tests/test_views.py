@@ -1,14 +1,17 @@
+import json
+import threading
 from math import ceil
 
 import django_filters as filters
 from django.core.exceptions import ImproperlyConfigured
-from django.test import TestCase
+from django.http import Http404
+from django.test import TestCase, TransactionTestCase
 from django.views.generic import TemplateView
 from django_filters.views import FilterView
 
 import django_tables2 as tables
 
-from .app.models import Person, Region
+from .app.models import Occupation, Person, Region
 from .utils import build_request
 
 MEMORY_DATA = [
@@ -339,6 +342,209 @@ class SingleTableMixinTest(TestCase):
         self.assertEqual(response.content.decode().count("<tr>"), expected_per_page + 1)
 
 
+class FragmentViewTest(TestCase):
+    class View(tables.SingleTableView):
+        table_class = SimpleTable
+        model = Region
+        paginate_by = 2
+        template_name = "minimal.html"
+
+    @classmethod
+    def setUpTestData(cls):
+        for region in MEMORY_DATA:
+            Region.objects.create(name=region["name"])
+
+    def test_fragment(self):
+        request = build_request("/?_fragment=1&sort=name&page=2")
+        response = self.View.as_view()(request)
+        self.assertEqual(response["Vary"], "X-Table-Fragment")
+        html = response.content.decode()
+        self.assertNotIn("<table", html)
+        self.assertNotIn("<thead", html)
+        self.assertIn("<td >Tasmania</td>", html)
+        self.assertIn("<td >Victoria</td>", html)
+        self.assertNotIn("next-page", html)
+
+        request = build_request("/")
+        request.META["HTTP_X_TABLE_FRAGMENT"] = "1"
+        html = self.View.as_view()(request).content.decode()
+        self.assertIn("<td >Queensland</td>", html)
+        self.assertIn('<a href="?page=2">', html)
+
+    def test_full_page(self):
+        response = self.View.as_view()(build_request("/"))
+        self.assertEqual(response["Vary"], "X-Table-Fragment")
+        self.assertEqual(response.template_name[0], "minimal.html")
+
+        response = self.View.as_view(table_fragment_param=None, table_fragment_header=None)(
+            build_request("/?_fragment=1")
+        )
+        self.assertFalse(response.has_header("Vary"))
+        self.assertEqual(response.template_name[0], "minimal.html")
+
+
+class JsonViewTest(TestCase):
+    class View(tables.SingleTableView):
+        table_class = SimpleTable
+        model = Region
+        paginate_by = 3
+        template_name = "minimal.html"
+        table_json_param = "_json"
+
+    @classmethod
+    def setUpTestData(cls):
+        for region in MEMORY_DATA:
+            Region.objects.create(name=region["name"])
+
+    def test_json(self):
+        response = self.View.as_view()(build_request("/?_json&sort=name&page=2"))
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(response.content)
+        self.assertEqual(data["rows"], [{"name": "Victoria", "mayor": None}])
+        self.assertEqual(data["page"]["count"], 4)
+        self.assertEqual(data["ordering"], ["name"])
+
+        request = build_request("/?_json&sort=name&page=2")
+        request.META["HTTP_IF_NONE_MATCH"] = response["ETag"]
+        self.assertEqual(self.View.as_view()(request).status_code, 304)
+
+        request = build_request("/?_json&sort=name&page=1")
+        request.META["HTTP_IF_NONE_MATCH"] = response["ETag"]
+        self.assertEqual(self.View.as_view()(request).status_code, 200)
+
+    def test_streaming(self):
+        response = self.View.as_view(table_pagination=False)(build_request("/?_json"))
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.has_header("ETag"))
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data["rows"]), 4)
+        self.assertIsNone(data["page"])
+
+    def test_disabled_by_default(self):
+        response = self.View.as_view(table_json_param=None)(build_request("/?_json"))
+        self.assertEqual(response.template_name[0], "minimal.html")
+        self.assertIsNone(tables.SingleTableView.table_json_param)
+
+    def test_hidden_columns(self):
+        class Table(SimpleTable):
+            secret = tables.Column(accessor="pk", visible=False)
+
+        response = self.View.as_view(table_class=Table)(build_request("/?_json&sort=name"))
+        data = json.loads(response.content)
+        self.assertEqual([column["name"] for column in data["columns"]], ["name", "mayor"])
+        self.assertNotIn("secret", data["rows"][0])
+
+
+class AsyncSingleTableViewTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        for region in MEMORY_DATA:
+            Region.objects.create(name=region["name"])
+
+    async def test_pagination(self):
+        class View(tables.AsyncSingleTableView):
+            table_class = SimpleTable
+            model = Region
+            paginate_by = 3
+            template_name = "minimal.html"
+
+        response = await View.as_view()(build_request("/?page=2&sort=name"))
+        table = response.context_data["table"]
+        self.assertEqual(table.paginator.num_pages, 2)
+        # the records of the page are fetched, rendering doesn't query the database.
+        self.assertEqual([row.get_cell("name") for row in table.page.object_list], ["Victoria"])
+        self.assertIsInstance(table.page.object_list.data, list)
+        self.assertIs(response.context_data["page_obj"], table.page)
+        self.assertTrue(response.context_data["is_paginated"])
+
+        response.render()
+        self.assertIn("Victoria", response.rendered_content)
+
+    async def test_silent_pagination(self):
+        class View(tables.AsyncSingleTableView):
+            table_class = SimpleTable
+            model = Region
+            table_pagination = {"per_page": 3}
+            template_name = "minimal.html"
+
+        response = await View.as_view()(build_request("/?page=10"))
+        self.assertEqual(response.context_data["table"].page.number, 2)
+
+    async def test_without_pagination(self):
+        class View(tables.AsyncSingleTableView):
+            table_class = SimpleTable
+            model = Region
+            table_pagination = False
+            template_name = "minimal.html"
+
+        response = await View.as_view()(build_request("/"))
+        self.assertFalse(hasattr(response.context_data["table"], "page"))
+        self.assertFalse(response.context_data["is_paginated"])
+
+    async def test_allow_empty(self):
+        class View(tables.AsyncSingleTableView):
+            table_class = SimpleTable
+            queryset = Region.objects.none()
+            allow_empty = False
+
+        with self.assertRaises(Http404):
+            await View.as_view()(build_request("/"))
+
+    async def test_mixin(self):
+        class View(tables.AsyncSingleTableMixin, TemplateView):
+            table_class = SimpleTable
+            table_data = MEMORY_DATA
+            table_pagination = {"per_page": 2}
+            template_name = "minimal.html"
+
+        response = await View.as_view()(build_request("/?page=2"))
+        table = response.context_data["table"]
+        self.assertEqual(len(table.page), 2)
+        self.assertEqual(table.paginator.num_pages, 2)
+
+    async def test_fragment_related_column(self):
+        occupation = await Occupation.objects.acreate(name="Carpenter")
+        await Person.objects.acreate(first_name="Jan", last_name="Pietersen", occupation=occupation)
+
+        class Table(tables.Table):
+            first_name = tables.Column()
+            occupation = tables.Column(accessor="occupation__name")
+
+        class View(tables.AsyncSingleTableView):
+            table_class = Table
+            model = Person
+            template_name = "minimal.html"
+
+        response = await View.as_view()(build_request("/?_fragment=1"))
+        self.assertIn("<td >Carpenter</td>", response.content.decode())
+
+    async def test_json_related_column(self):
+        occupation = await Occupation.objects.acreate(name="Carpenter")
+        for i in range(3):
+            await Person.objects.acreate(first_name=f"Jan {i}", occupation=occupation)
+
+        class Table(tables.Table):
+            first_name = tables.Column()
+            occ = tables.Column(accessor="occupation__name")
+
+        class View(tables.AsyncSingleTableView):
+            table_class = Table
+            model = Person
+            table_pagination = {"per_page": 2}
+            table_json_param = "_json"
+
+        response = await View.as_view()(build_request("/?_json=1"))
+        self.assertTrue(response.has_header("ETag"))
+        data = json.loads(response.content)
+        self.assertEqual([row["occ"] for row in data["rows"]], ["Carpenter", "Carpenter"])
+
+        response = await View.as_view(table_pagination=False)(build_request("/?_json=1"))
+        self.assertTrue(response.streaming)
+        data = json.loads(b"".join([part async for part in response.streaming_content]))
+        self.assertEqual([row["occ"] for row in data["rows"]], ["Carpenter"] * 3)
+
+
 class TableA(tables.Table):
     class Meta:
         model = Person
@@ -519,3 +725,93 @@ class MultiTableMixinTest(TestCase):
 
         self.assertEqual("test_prefix", tableA.prefix)
         self.assertIn("table", tableB.prefix)
+
+
+class AsyncMultiTableMixinTest(TestCase):
+    async def test_basic(self):
+        await Person.objects.acreate(first_name="Jan Pieter", last_name="W")
+        for name in ("Flevoland", "Friesland", "Gelderland"):
+            await Region.objects.acreate(name=name)
+
+        class View(tables.AsyncMultiTableMixin, TemplateView):
+            tables = (TableA(Person.objects.all()), TableB(Region.objects.all(), prefix="regions-"))
+            table_pagination = {"per_page": 2}
+            template_name = "multiple.html"
+
+        response = await View.as_view()(build_request("/?regions-page=2"))
+        table_a, table_b = response.context_data["tables"]
+        self.assertEqual((table_a.prefix, table_b.prefix), ("table_0-", "regions-"))
+        self.assertEqual(table_b.page.number, 2)
+        self.assertEqual([row.get_cell("name") for row in table_b.page.object_list], ["Gelderland"])
+
+        response.render()
+        self.assertIn("<td >Jan Pieter</td>", response.rendered_content)
+
+
+class ConcurrentMultiTableMixinTest(TransactionTestCase):
+    def setUp(self):
+        Person.objects.create(first_name="Jan Pieter", last_name="W")
+        for name in ("Flevoland", "Friesland", "Gelderland"):
+            Region.objects.create(name=name)
+
+    def get_view(self, base):
+        threads = set()
+
+        class RecordingTableB(TableB):
+            def order_name(self, queryset, is_descending):
+                threads.add(threading.current_thread().name)
+                return queryset.order_by(("-" if is_descending else "") + "name"), True
+
+        class View(base, TemplateView):
+            table_concurrency = 4
+            table_pagination = {"per_page": 2}
+            template_name = "multiple.html"
+
+            def get_tables(self):
+                return [
+                    TableA(Person.objects.all()),
+                    RecordingTableB(Region.objects.all(), prefix="regions-"),
+                    RecordingTableB(Region.objects.all()),
+                ]
+
+        return View, threads
+
+    def assertTables(self, response):
+        table_a, table_b, table_c = response.context_data["tables"]
+        self.assertEqual(
+            [table.prefix for table in (table_a, table_b, table_c)],
+            ["table_0-", "regions-", "table_1-"],
+        )
+        # the records are fetched by the workers
+        self.assertIsInstance(table_b.page.object_list.data, list)
+        self.assertEqual([row.get_cell("name") for row in table_b.page], ["Flevoland"])
+        self.assertEqual(
+            [row.get_cell("name") for row in table_c.page], ["Gelderland", "Friesland"]
+        )
+
+    def test_threads(self):
+        View, threads = self.get_view(tables.MultiTableMixin)
+        response = View.as_view()(
+            build_request("/?regions-page=2&regions-sort=-name&table_1-sort=-name")
+        )
+        self.assertTables(response)
+        self.assertTrue(all(name.startswith("django_tables2") for name in threads))
+
+        response.render()
+        self.assertIn("<td >Jan Pieter</td>", response.rendered_content)
+
+    async def test_async(self):
+        View, threads = self.get_view(tables.AsyncMultiTableMixin)
+        response = await View.as_view()(
+            build_request("/?regions-page=2&regions-sort=-name&table_1-sort=-name")
+        )
+        self.assertTables(response)
+        self.assertTrue(all(name.startswith("django_tables2") for name in threads))
+
+    def test_serial(self):
+        View, threads = self.get_view(tables.MultiTableMixin)
+        View.table_concurrency = None
+        self.assertTables(
+            View.as_view()(build_request("/?regions-page=2&regions-sort=-name&table_1-sort=-name"))
+        )
+        self.assertEqual(threads, {threading.current_thread().name})